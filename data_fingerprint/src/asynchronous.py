@@ -0,0 +1,200 @@
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Optional, Union
+
+import polars as pl
+import pyarrow as pa
+
+from data_fingerprint.src.batch import ComparisonJob
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.models import DataReport
+from data_fingerprint.src.progress import CancellationToken
+from data_fingerprint.src.scan import (
+    InputSource,
+    collect_source,
+    get_side_filters,
+    scan_projected,
+)
+
+AsyncInputSource = Union[
+    InputSource, AsyncIterable[Union[pl.DataFrame, pa.RecordBatch, pa.Table]]
+]
+"""A source that can be loaded asynchronously: an :data:`data_compare.src.scan.InputSource`
+or an async iterator of dataframes or Arrow record batches."""
+
+
+async def collect_batches(
+    batches: AsyncIterable[Union[pl.DataFrame, pa.RecordBatch, pa.Table]],
+) -> pl.DataFrame:
+    """
+    Collect an async iterator of dataframes or Arrow record batches into one dataframe.
+
+    Raises:
+        ValueError: If the iterator does not yield any batch.
+
+    Args:
+        batches (AsyncIterable[Union[pl.DataFrame, pa.RecordBatch, pa.Table]]): The batches.
+
+    Returns:
+        pl.DataFrame: The dataframe.
+    """
+    frames: list[pl.DataFrame] = []
+    async for batch in batches:
+        frames.append(
+            batch if isinstance(batch, pl.DataFrame) else pl.from_arrow(batch)
+        )
+    if len(frames) == 0:
+        raise ValueError("The batches can not be collected, there is no batch.")
+    return pl.concat(frames, how="vertical_relaxed")
+
+
+async def load_async(
+    source: AsyncInputSource,
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+    row_filter: Optional[pl.Expr] = None,
+) -> pl.DataFrame:
+    """
+    Load a source without blocking the event loop.
+
+    Lazy frames and files are collected with `polars.LazyFrame.collect_async` (*on the polars thread pool*)
+    with the row filter and the projection in their plan (*see* :func:`data_compare.src.scan.scan_projected`),
+    async iterators of batches are collected with :func:`collect_batches` and then filtered and projected.
+
+    Args:
+        source (:data:`AsyncInputSource`): The source.
+        include_columns (Optional[list[str]]): The columns to keep, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns to drop.
+        row_filter (Optional[pl.Expr]): The filter of the rows to keep.
+
+    Returns:
+        pl.DataFrame: The loaded dataframe.
+    """
+    if hasattr(source, "__aiter__"):
+        source = await collect_batches(source)
+    if isinstance(source, pl.DataFrame):
+        return collect_source(source, include_columns, exclude_columns, row_filter)
+    return await scan_projected(
+        source, include_columns, exclude_columns, row_filter
+    ).collect_async()
+
+
+async def get_data_report_async(
+    df0: AsyncInputSource,
+    df1: AsyncInputSource,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+    executor: Optional[Executor] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+    **kwargs: Any,
+) -> DataReport:
+    """
+    Get a data report comparing two sources (*see* :func:`data_compare.src.comparator.get_data_report`)
+    without blocking the event loop.
+
+    Both sources are loaded concurrently with :func:`load_async` (*with `include_columns`, `exclude_columns`
+    and `row_filter` pushed into the scans*) and the comparison runs in the `executor`
+    (*the default executor of the loop if `None`*). When the awaiting task is cancelled, the comparison
+    is cancelled with a :class:`data_compare.src.progress.CancellationToken` and stops at its next check.
+
+    Example:
+        ```python
+        import polars as pl
+        from data_fingerprint.src.asynchronous import get_data_report_async
+
+        async def validate() -> None:
+            report = await get_data_report_async(
+                pl.scan_parquet("data/orders.parquet"),
+                pl.scan_parquet("backup/orders.parquet"),
+                "data",
+                "backup",
+                ["id"],
+            )
+        ```
+
+    Raises:
+        asyncio.CancelledError: If the task was cancelled.
+
+    Args:
+        df0 (:data:`AsyncInputSource`): The first source.
+        df1 (:data:`AsyncInputSource`): The second source.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        executor (Optional[Executor]): The executor running the comparison.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token,
+            a new one is created if `None`.
+        **kwargs (Any): The other arguments of :func:`data_compare.src.comparator.get_data_report`.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two sources.
+    """
+    cancellation_token = cancellation_token or CancellationToken()
+    # the projection and the filter are applied while loading, so they are pushed into the scans
+    include_columns: Optional[list[str]] = kwargs.pop("include_columns", None)
+    exclude_columns: Optional[list[str]] = kwargs.pop("exclude_columns", None)
+    df0_filter, df1_filter = get_side_filters(kwargs.pop("row_filter", None))
+    df0, df1 = await asyncio.gather(
+        load_async(df0, include_columns, exclude_columns, df0_filter),
+        load_async(df1, include_columns, exclude_columns, df1_filter),
+    )
+    future: asyncio.Future = asyncio.get_running_loop().run_in_executor(
+        executor,
+        functools.partial(
+            get_data_report,
+            df0,
+            df1,
+            df0_name,
+            df1_name,
+            grouping_columns,
+            cancellation_token=cancellation_token,
+            **kwargs,
+        ),
+    )
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancellation_token.cancel()
+        raise
+
+
+async def iter_data_reports_async(
+    jobs: list[ComparisonJob],
+    max_concurrency: int = 4,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[tuple[int, DataReport]]:
+    """
+    Compare many pairs of sources concurrently and yield the reports as they complete
+    (*the asynchronous variant of* :func:`data_compare.src.batch.iter_data_reports`).
+
+    Example:
+        ```python
+        async for index, report in iter_data_reports_async(jobs, max_concurrency=8):
+            print(index, len(report.row_differences))
+        ```
+
+    Args:
+        jobs (list[:data:`data_compare.src.batch.ComparisonJob`]): The comparison jobs.
+        max_concurrency (int): The maximal number of running comparisons.
+        executor (Optional[Executor]): The executor running the comparisons.
+
+    Yields:
+        tuple[int, :class:`data_compare.src.models.DataReport`]: The index of the job and its report.
+    """
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(index: int, job: ComparisonJob) -> tuple[int, DataReport]:
+        async with semaphore:
+            return index, await get_data_report_async(*job, executor=executor)
+
+    tasks: list[asyncio.Task] = [
+        asyncio.ensure_future(_run(index, job)) for index, job in enumerate(jobs)
+    ]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
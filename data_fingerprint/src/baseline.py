@@ -0,0 +1,525 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+
+import polars as pl
+
+from data_fingerprint.src.checkers import check_inputs
+from data_fingerprint.src.comparator import (
+    _get_hash_counts,
+    _get_hashed_row_differences,
+    _get_unique_key_row_differences,
+    _hash_subset,
+    _pair_row_differences,
+    _split_duplicated_keys,
+    get_column_dtype_differences,
+)
+from data_fingerprint.src.models import DataReport, RowDifference, RowGroupDifference
+from data_fingerprint.src.difference_types import RowDifferenceType
+from data_fingerprint.src.progress import CancellationToken, ProgressCallback
+from data_fingerprint.src.utils import convert_to_polars
+
+
+class Baseline:
+    """
+    A golden dataframe prepared once for comparing many candidate dataframes against it.
+
+    The baseline keeps its schema, the hashed subset of its columns, the multiplicities of the row hashes
+    and (*if grouping columns are given*) the index of the grouping keys.
+    Comparing a candidate only hashes the candidate, the baseline side is reused from the cache.
+    If a candidate does not have all the baseline columns, the hashed subset for the comparable columns
+    is computed once and cached as well, at most `max_hashed_subsets` hashed subsets are kept
+    (*the least recently used one is dropped first*).
+
+    In the reports the baseline is always the first dataframe (`df0`).
+
+    Example:
+        ```python
+        import polars as pl
+        from data_fingerprint.src.baseline import Baseline
+
+        golden = pl.DataFrame({"id": [1, 2, 3], "value": [1, 2, 3]})
+        baseline = Baseline(golden, "golden", grouping_columns=["id"])
+        for name, candidate in candidates.items():
+            report = baseline.compare(candidate, name)
+        ```
+    """
+
+    @convert_to_polars
+    @check_inputs
+    def __init__(
+        self,
+        df: pl.DataFrame,
+        name: str,
+        grouping_columns: Optional[list[str]] = None,
+        max_hashed_subsets: int = 8,
+    ) -> None:
+        """
+        Prepare the baseline.
+
+        Raises:
+            ValueError: If the grouping columns are not in the dataframe
+                or if `max_hashed_subsets` is smaller than 1.
+
+        Args:
+            df (pl.DataFrame): The golden dataframe.
+            name (str): The name of the golden dataframe.
+            grouping_columns (Optional[list[str]]): The default columns to pair the rows by.
+            max_hashed_subsets (int): The maximal number of cached hashed subsets.
+        """
+        if max_hashed_subsets < 1:
+            raise ValueError(
+                f"The maximal number of hashed subsets must be at least 1, got {max_hashed_subsets}."
+            )
+        if grouping_columns is not None and not set(grouping_columns).issubset(
+            df.columns
+        ):
+            raise ValueError(
+                f"Grouping columns {grouping_columns} are not in the baseline {name}."
+            )
+
+        self.df: pl.DataFrame = df
+        """The golden dataframe."""
+
+        self.name: str = name
+        """The name of the golden dataframe."""
+
+        self.schema: pl.Schema = df.schema
+        """The schema of the golden dataframe."""
+
+        self.grouping_columns: Optional[list[str]] = grouping_columns
+        """The default columns to pair the rows by."""
+
+        self.key_counts: Optional[pl.DataFrame] = None
+        """The number of rows per grouping key (*only with grouping columns*)."""
+        if grouping_columns is not None:
+            self.key_counts = df.group_by(grouping_columns).agg(pl.len().alias("count"))
+
+        self.max_hashed_subsets: int = max_hashed_subsets
+        """The maximal number of cached hashed subsets."""
+
+        self._lock: threading.Lock = threading.Lock()
+        self._hashed: OrderedDict[
+            tuple[str, ...], tuple[pl.DataFrame, pl.DataFrame]
+        ] = OrderedDict()
+        self.get_hashed_subset(df.columns)
+
+    @property
+    def is_key_unique(self) -> Optional[bool]:
+        """`True` if the grouping columns are a unique key of the baseline, `None` without grouping columns."""
+        if self.key_counts is None:
+            return None
+        return len(self.key_counts) == len(self.df)
+
+    @property
+    def estimated_size(self) -> int:
+        """The estimated size (*in bytes*) of the golden dataframe and of the cached hashes."""
+        return self.df.estimated_size("b") + sum(
+            hashed.estimated_size("b") + counts.estimated_size("b")
+            for hashed, counts in self._hashed.values()
+        )
+
+    def get_hashed_subset(
+        self, columns: list[str]
+    ) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """
+        Get the hashed subset of the baseline and the hash multiplicities for the columns
+        (*cached, the least recently used subsets are dropped above* :attr:`max_hashed_subsets`).
+
+        Args:
+            columns (list[str]): The columns to hash.
+
+        Returns:
+            pl.DataFrame: The hashed subset (*columns sorted by name*).
+
+            pl.DataFrame: The number of occurrences of every hash.
+        """
+        key: tuple[str, ...] = tuple(sorted(columns))
+        with self._lock:
+            if key not in self._hashed:
+                hashed: pl.DataFrame = _hash_subset(self.df, list(key), self.name)
+                self._hashed[key] = (hashed, _get_hash_counts(hashed))
+                while len(self._hashed) > self.max_hashed_subsets:
+                    self._hashed.popitem(last=False)
+            self._hashed.move_to_end(key)
+            return self._hashed[key]
+
+    def compare(
+        self,
+        candidate: pl.DataFrame,
+        candidate_name: str,
+        grouping_columns: Optional[list[str]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> DataReport:
+        """
+        Compare a candidate dataframe against the baseline
+        (*same result as :func:`data_compare.src.comparator.get_data_report` with the baseline as `df0`*).
+
+        Raises:
+            ValueError: If the grouping columns are not comparable in both dataframes.
+            ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+        Args:
+            candidate (pl.DataFrame): The candidate dataframe.
+            candidate_name (str): The name of the candidate dataframe.
+            grouping_columns (Optional[list[str]]): The columns to pair the rows by,
+                defaults to the grouping columns of the baseline.
+            progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+            cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+        Returns:
+            :class:`data_compare.src.models.DataReport`: A data report comparing the baseline and the candidate.
+        """
+        return _compare_with_baseline(
+            self,
+            candidate,
+            candidate_name,
+            grouping_columns or self.grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+
+
+@convert_to_polars
+@check_inputs
+def _compare_with_baseline(
+    baseline: Baseline,
+    candidate: pl.DataFrame,
+    candidate_name: str,
+    grouping_columns: Optional[list[str]],
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> DataReport:
+    """
+    Compare a candidate dataframe against a baseline, see :meth:`Baseline.compare`.
+    """
+    if baseline.name == candidate_name:
+        raise ValueError(f"Source name already exists: {candidate_name}")
+
+    same_columns, column_differences = get_column_dtype_differences(
+        baseline.df, candidate, baseline.name, candidate_name
+    )
+    if grouping_columns is not None and (
+        len(set(grouping_columns).difference(same_columns)) > 0
+    ):
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = []
+    duplicate_keys: Optional[dict[str, list]] = None
+    if len(same_columns) == 0:
+        row_differences = [
+            RowDifference(
+                source=name,
+                row=x,
+                number_of_occurrences=1,
+                difference_type=RowDifferenceType.MISSING_ROW,
+            )
+            for name, df in [(baseline.name, baseline.df), (candidate_name, candidate)]
+            for x in df.rows(named=True)
+        ]
+    elif grouping_columns is None:
+        baseline_subset, baseline_counts = baseline.get_hashed_subset(same_columns)
+        row_differences = _get_hashed_row_differences(
+            baseline_subset,
+            _hash_subset(candidate, sorted(same_columns), candidate_name),
+            baseline.name,
+            candidate_name,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+            df0_counts=baseline_counts,
+        )
+    else:
+        row_differences, duplicate_keys = _get_row_differences_by_key(
+            baseline,
+            candidate,
+            candidate_name,
+            same_columns,
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+
+    return DataReport(
+        df0_length=len(baseline.df),
+        df1_length=len(candidate),
+        df0_name=baseline.name,
+        df1_name=candidate_name,
+        comparable_columns=same_columns,
+        row_differences=row_differences,
+        column_differences=column_differences,
+        duplicate_keys=duplicate_keys,
+    )
+
+
+def _get_row_differences_by_key(
+    baseline: Baseline,
+    candidate: pl.DataFrame,
+    candidate_name: str,
+    same_columns: list[str],
+    grouping_columns: list[str],
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> tuple[list[Union[RowDifference, RowGroupDifference]], Optional[dict[str, list]]]:
+    """
+    Compare the rows of a candidate and a baseline paired by the grouping columns,
+    like :func:`data_compare.src.comparator._get_row_differences_by_key`:
+    the unique keys are paired with one join, the duplicated keys are paired group by group
+    from the cached hashes of the baseline.
+
+    If the grouping columns are the default grouping columns of the baseline,
+    the stored :attr:`Baseline.key_counts` decide whether the baseline has duplicated keys,
+    so a unique baseline with a unique candidate is never split.
+
+    Args:
+        baseline (:class:`Baseline`): The baseline.
+        candidate (pl.DataFrame): The candidate dataframe.
+        candidate_name (str): The name of the candidate dataframe.
+        same_columns (list[str]): The comparable columns.
+        grouping_columns (list[str]): The columns to pair the rows by.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences
+
+        Optional[dict[str, list]]: The keys of the differences found in the duplicated-key groups,
+        `None` if there are none.
+    """
+    baseline_unique: bool = baseline.is_key_unique is True and sorted(
+        grouping_columns
+    ) == sorted(baseline.grouping_columns)
+    if baseline_unique and not candidate.select(grouping_columns).is_duplicated().any():
+        baseline_df, candidate_df = baseline.df.select(same_columns), candidate.select(
+            same_columns
+        )
+        baseline_duplicated, candidate_duplicated = (
+            baseline_df.clear(),
+            candidate_df.clear(),
+        )
+    else:
+        baseline_df, candidate_df, baseline_duplicated, candidate_duplicated = (
+            _split_duplicated_keys(
+                baseline.df.select(same_columns),
+                candidate.select(same_columns),
+                grouping_columns,
+            )
+        )
+
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = (
+        _get_unique_key_row_differences(
+            baseline_df,
+            candidate_df,
+            baseline.name,
+            candidate_name,
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    )
+    if len(baseline_duplicated) + len(candidate_duplicated) == 0:
+        return row_differences, None
+
+    duplicated_keys: pl.DataFrame = pl.concat(
+        [
+            baseline_duplicated.select(grouping_columns),
+            candidate_duplicated.select(grouping_columns),
+        ]
+    ).unique()
+    baseline_subset, _ = baseline.get_hashed_subset(same_columns)
+    duplicated_differences: list[Union[RowDifference, RowGroupDifference]] = (
+        _pair_row_differences(
+            _get_hashed_row_differences(
+                baseline_subset.join(
+                    duplicated_keys, on=grouping_columns, how="semi", nulls_equal=True
+                ),
+                _hash_subset(
+                    candidate_duplicated, sorted(same_columns), candidate_name
+                ),
+                baseline.name,
+                candidate_name,
+                progress_callback=progress_callback,
+                cancellation_token=cancellation_token,
+            ),
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    )
+    if len(duplicated_differences) == 0:
+        return row_differences, None
+    row_differences.extend(duplicated_differences)
+    return row_differences, {
+        column: [difference.row[column][0] for difference in duplicated_differences]
+        for column in sorted(grouping_columns)
+    }
+
+
+class BaselineRegistry:
+    """
+    A registry of named baselines with a least recently used eviction policy.
+
+    The registry is bounded by the number of baselines and/or by the total estimated size of the baselines
+    (:attr:`Baseline.estimated_size`, *including the hashed subsets cached by the comparisons*).
+    When a bound is exceeded, the least recently used baselines are evicted.
+    The registry is thread safe.
+
+    Example:
+        ```python
+        from data_fingerprint.src.baseline import BaselineRegistry
+
+        registry = BaselineRegistry(max_baselines=10, max_bytes=8 * 1024**3)
+        registry.register("orders", golden_orders, grouping_columns=["order_id"])
+        report = registry.compare("orders", candidate, "candidate")
+        ```
+    """
+
+    def __init__(
+        self, max_baselines: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Create an empty registry.
+
+        Args:
+            max_baselines (Optional[int]): The maximal number of registered baselines.
+            max_bytes (Optional[int]): The maximal total estimated size (*in bytes*) of the registered baselines.
+        """
+        self.max_baselines: Optional[int] = max_baselines
+        """The maximal number of registered baselines."""
+
+        self.max_bytes: Optional[int] = max_bytes
+        """The maximal total estimated size (*in bytes*) of the registered baselines."""
+
+        self._baselines: OrderedDict[str, Baseline] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._baselines)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._baselines
+
+    @property
+    def names(self) -> list[str]:
+        """The names of the registered baselines, from the least to the most recently used."""
+        return list(self._baselines.keys())
+
+    @property
+    def estimated_size(self) -> int:
+        """The total estimated size (*in bytes*) of the registered baselines."""
+        return sum(baseline.estimated_size for baseline in self._baselines.values())
+
+    def register(
+        self,
+        name: str,
+        df: pl.DataFrame,
+        grouping_columns: Optional[list[str]] = None,
+        max_hashed_subsets: int = 8,
+    ) -> Baseline:
+        """
+        Prepare and register a baseline, a baseline with the same name is replaced.
+
+        Args:
+            name (str): The name of the baseline.
+            df (pl.DataFrame): The golden dataframe.
+            grouping_columns (Optional[list[str]]): The default columns to pair the rows by.
+            max_hashed_subsets (int): The maximal number of hashed subsets cached by the baseline.
+
+        Returns:
+            :class:`Baseline`: The registered baseline.
+        """
+        baseline: Baseline = Baseline(
+            df, name, grouping_columns, max_hashed_subsets=max_hashed_subsets
+        )
+        with self._lock:
+            self._baselines[name] = baseline
+            self._baselines.move_to_end(name)
+            self._evict()
+        return baseline
+
+    def get(self, name: str) -> Baseline:
+        """
+        Get a registered baseline and mark it as the most recently used.
+
+        Raises:
+            KeyError: If there is no baseline with the name.
+
+        Args:
+            name (str): The name of the baseline.
+
+        Returns:
+            :class:`Baseline`: The baseline.
+        """
+        with self._lock:
+            if name not in self._baselines:
+                raise KeyError(f"Baseline is not registered: {name}")
+            self._baselines.move_to_end(name)
+            return self._baselines[name]
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a registered baseline.
+
+        Raises:
+            KeyError: If there is no baseline with the name.
+
+        Args:
+            name (str): The name of the baseline.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            del self._baselines[name]
+
+    def compare(
+        self,
+        name: str,
+        candidate: pl.DataFrame,
+        candidate_name: str,
+        grouping_columns: Optional[list[str]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> DataReport:
+        """
+        Compare a candidate dataframe against a registered baseline (*see* :meth:`Baseline.compare`).
+
+        Raises:
+            KeyError: If there is no baseline with the name.
+
+        Args:
+            name (str): The name of the baseline.
+            candidate (pl.DataFrame): The candidate dataframe.
+            candidate_name (str): The name of the candidate dataframe.
+            grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+            progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+            cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+        Returns:
+            :class:`data_compare.src.models.DataReport`: A data report comparing the baseline and the candidate.
+        """
+        report: DataReport = self.get(name).compare(
+            candidate,
+            candidate_name,
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+        # the comparison may have cached a new hashed subset of the baseline
+        with self._lock:
+            self._evict()
+        return report
+
+    def _evict(self) -> None:
+        """Evict the least recently used baselines until the bounds are met (*always keeps the newest one*)."""
+        while len(self._baselines) > 1 and (
+            (
+                self.max_baselines is not None
+                and len(self._baselines) > self.max_baselines
+            )
+            or (self.max_bytes is not None and self.estimated_size > self.max_bytes)
+        ):
+            self._baselines.popitem(last=False)
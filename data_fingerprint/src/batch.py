@@ -0,0 +1,200 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Iterator, Optional, Union
+
+import pandas as pd
+import polars as pl
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.memory import MEMORY_FACTOR
+from data_fingerprint.src.models import DataReport
+from data_fingerprint.src.parallel import _create_executor
+from data_fingerprint.src.progress import (
+    CancellationToken,
+    ProgressCallback,
+    report_progress,
+)
+
+ComparisonJob = Union[
+    tuple[pl.DataFrame, pl.DataFrame, str, str],
+    tuple[pl.DataFrame, pl.DataFrame, str, str, Optional[list[str]]],
+]
+"""A comparison job: `(df0, df1, df0_name, df1_name)` or `(df0, df1, df0_name, df1_name, grouping_columns)`."""
+
+
+def estimate_job_memory(job: ComparisonJob) -> int:
+    """
+    Estimate the peak memory (*in bytes*) of a comparison job.
+
+    The estimate is :data:`data_compare.src.memory.MEMORY_FACTOR` times the estimated size of the loaded input dataframes
+    (*the hashed subsets and the differences are built next to the inputs*). Lazy frames are not loaded yet,
+    so they are estimated as `0`.
+
+    Args:
+        job (:data:`ComparisonJob`): The job.
+
+    Returns:
+        int: The estimated peak memory.
+    """
+    size: int = 0
+    for df in job[:2]:
+        if isinstance(df, pl.DataFrame):
+            size += df.estimated_size("b")
+        elif isinstance(df, pd.DataFrame):
+            size += int(df.memory_usage(deep=True).sum())
+    return MEMORY_FACTOR * size
+
+
+def _run_job(
+    job: ComparisonJob, cancellation_token: Optional[CancellationToken] = None
+) -> DataReport:
+    df0, df1, df0_name, df1_name, *grouping_columns = job
+    return get_data_report(
+        df0,
+        df1,
+        df0_name,
+        df1_name,
+        grouping_columns[0] if len(grouping_columns) > 0 else None,
+        cancellation_token=cancellation_token,
+    )
+
+
+def iter_data_reports(
+    jobs: list[ComparisonJob],
+    max_workers: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    use_processes: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> Iterator[tuple[int, DataReport]]:
+    """
+    Compare many pairs of dataframes in a bounded pool of workers and yield the reports as they complete.
+
+    The jobs are admitted in order: a job starts only when there is a free worker and the estimated memory
+    of the running jobs plus the job (*see* :func:`estimate_job_memory`) fits into `max_memory_bytes`.
+    A job that alone exceeds the limit is started when no other job is running,
+    so every job eventually runs.
+
+    Example:
+        ```python
+        from data_fingerprint.src.batch import iter_data_reports
+
+        jobs = [(df0, df1, f"{table}_prod", f"{table}_test", ["id"]) for table, (df0, df1) in tables.items()]
+        for index, report in iter_data_reports(jobs, max_workers=8, max_memory_bytes=16 * 1024**3):
+            print(jobs[index][2], len(report.row_differences))
+        ```
+
+    Raises:
+        ComparisonCancelledError: If the `cancellation_token` was cancelled, the jobs that did not start
+            are not started and the running jobs stop at their next check.
+        Exception: The first exception raised by a job.
+
+    Args:
+        jobs (list[:data:`ComparisonJob`]): The comparison jobs.
+        max_workers (Optional[int]): The number of workers, defaults to the number of CPU cores.
+        max_memory_bytes (Optional[int]): The maximal estimated memory of the running jobs, unlimited by default.
+        use_processes (bool): Run the jobs in a process pool instead of a thread pool.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the `batch` stage, number of completed jobs and total number of jobs.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            before a job is started and after a job completes, and it is passed to the running jobs
+            (*only in a thread pool, a process cannot see the cancellation of the token*).
+
+    Yields:
+        tuple[int, :class:`data_compare.src.models.DataReport`]: The index of the job and its report.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    job_token: Optional[CancellationToken] = (
+        None if use_processes else cancellation_token
+    )
+    job_memory: list[int] = [estimate_job_memory(job) for job in jobs]
+
+    with _create_executor(max_workers, use_processes) as executor:
+        running: dict[Future, int] = {}
+        next_job: int = 0
+        completed: int = 0
+        try:
+            report_progress(
+                progress_callback, cancellation_token, "batch", completed, len(jobs)
+            )
+            while completed < len(jobs):
+                running_memory: int = sum(job_memory[i] for i in running.values())
+                while (
+                    next_job < len(jobs)
+                    and len(running) < max_workers
+                    and (
+                        len(running) == 0
+                        or max_memory_bytes is None
+                        or running_memory + job_memory[next_job] <= max_memory_bytes
+                    )
+                ):
+                    if cancellation_token is not None:
+                        cancellation_token.raise_if_cancelled()
+                    running[executor.submit(_run_job, jobs[next_job], job_token)] = (
+                        next_job
+                    )
+                    running_memory += job_memory[next_job]
+                    next_job += 1
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index: int = running.pop(future)
+                    report: DataReport = future.result()
+                    completed += 1
+                    yield index, report
+                    report_progress(
+                        progress_callback,
+                        cancellation_token,
+                        "batch",
+                        completed,
+                        len(jobs),
+                    )
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
+
+
+def get_data_reports(
+    jobs: list[ComparisonJob],
+    max_workers: Optional[int] = None,
+    max_memory_bytes: Optional[int] = None,
+    use_processes: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> list[DataReport]:
+    """
+    Compare many pairs of dataframes in a bounded pool of workers (*see* :func:`iter_data_reports`).
+
+    Example:
+        ```python
+        from data_fingerprint.src.batch import get_data_reports
+
+        reports = get_data_reports(
+            [(orders0, orders1, "orders0", "orders1", ["id"]), (users0, users1, "users0", "users1")],
+            max_workers=4,
+        )
+        ```
+
+    Args:
+        jobs (list[:data:`ComparisonJob`]): The comparison jobs.
+        max_workers (Optional[int]): The number of workers, defaults to the number of CPU cores.
+        max_memory_bytes (Optional[int]): The maximal estimated memory of the running jobs, unlimited by default.
+        use_processes (bool): Run the jobs in a process pool instead of a thread pool.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        list[:class:`data_compare.src.models.DataReport`]: The reports in the order of the jobs.
+    """
+    reports: list[Optional[DataReport]] = [None] * len(jobs)
+    for index, report in iter_data_reports(
+        jobs,
+        max_workers=max_workers,
+        max_memory_bytes=max_memory_bytes,
+        use_processes=use_processes,
+        progress_callback=progress_callback,
+        cancellation_token=cancellation_token,
+    ):
+        reports[index] = report
+    return reports
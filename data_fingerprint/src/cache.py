@@ -0,0 +1,183 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+import polars as pl
+
+
+def get_content_signature(df: pl.DataFrame) -> tuple:
+    """
+    Get a signature of the full content of a dataframe.
+
+    The signature consists of the shape, the schema and the (*wrapping*) sum of the hashes of all rows
+    together with their positions, so a change in any value or in the order of the rows changes it
+    (*up to a 64-bit hash collision*). Computing it costs one hashing pass over all columns.
+
+    Args:
+        df (pl.DataFrame): The dataframe.
+
+    Returns:
+        tuple: The signature.
+    """
+    content_hash: int = (
+        int(df.with_row_index("__position").hash_rows().sum()) if df.height > 0 else 0
+    )
+    return (
+        df.height,
+        tuple((name, str(dtype)) for name, dtype in df.schema.items()),
+        content_hash,
+    )
+
+
+class HashCache:
+    """
+    Opt-in, memory capped cache of row hashes keyed by a dataframe and a set of columns.
+
+    By default the dataframes are identified by their identity (*the same object*), the cached hashes of a dataframe
+    are dropped as soon as the dataframe is garbage collected.
+    With `use_content_signature=True` the dataframes are identified by a signature of their full content
+    (:func:`get_content_signature`) instead, so equal dataframes loaded again hit the cache as well.
+    The signature hashes every row once per dataframe object (*it is memoized while the dataframe is alive*),
+    so lookups of the same dataframe on several column subsets or groupings do not compute it again.
+
+    When the total estimated size of the cached hashes exceeds `max_bytes`,
+    the least recently used hashes are evicted. The cache is thread safe.
+
+    .. note::
+        The cached hashes are not invalidated when a dataframe is modified in place,
+        so use the cache only for dataframes that are not modified.
+
+    Example:
+        ```python
+        from data_fingerprint.src.cache import HashCache
+        from data_fingerprint.src.comparator import get_data_report
+
+        cache = HashCache(max_bytes=1024**3)
+        report = get_data_report(df0, df1, "df0", "df1", ["a"], hash_cache=cache)
+        report = get_data_report(df0, df1, "df0", "df1", ["b"], hash_cache=cache)  # no rehashing
+        ```
+    """
+
+    def __init__(
+        self, max_bytes: int = 512 * 1024**2, use_content_signature: bool = False
+    ) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            max_bytes (int): The maximal total estimated size (*in bytes*) of the cached hashes.
+            use_content_signature (bool): Identify the dataframes by a content signature instead of their identity.
+        """
+        self.max_bytes: int = max_bytes
+        """The maximal total estimated size (*in bytes*) of the cached hashes."""
+
+        self.use_content_signature: bool = use_content_signature
+        """Identify the dataframes by a content signature instead of their identity."""
+
+        self.hits: int = 0
+        """The number of lookups that were found in the cache."""
+
+        self.misses: int = 0
+        """The number of lookups that had to hash the rows."""
+
+        self._entries: OrderedDict[
+            Hashable, tuple[Optional[weakref.ref], pl.Series]
+        ] = OrderedDict()
+        self._signatures: dict[int, tuple[weakref.ref, tuple]] = {}
+        self._lock: threading.RLock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def estimated_size(self) -> int:
+        """The total estimated size (*in bytes*) of the cached hashes."""
+        return sum(hashes.estimated_size("b") for _, hashes in self._entries.values())
+
+    def clear(self) -> None:
+        """
+        Remove all cached hashes.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._signatures.clear()
+
+    def get_hashes(self, df: pl.DataFrame, columns: list[str]) -> pl.Series:
+        """
+        Get the row hashes of the columns of a dataframe, hashing the rows only if they are not cached.
+
+        The columns are hashed in the order given, callers should pass them in a stable order.
+
+        Args:
+            df (pl.DataFrame): The dataframe.
+            columns (list[str]): The columns to hash.
+
+        Returns:
+            pl.Series: The row hashes.
+        """
+        key: Hashable = self._get_key(df, columns)
+        with self._lock:
+            entry: Optional[tuple[Optional[weakref.ref], pl.Series]] = (
+                self._entries.get(key)
+            )
+            # identity keys are verified, the id of a collected dataframe can be reused
+            if entry is not None and (entry[0] is None or entry[0]() is df):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        with self._lock:
+            self.misses += 1
+        hashes: pl.Series = df.select(columns).hash_rows()
+        if hashes.estimated_size("b") > self.max_bytes:
+            return hashes
+
+        reference: Optional[weakref.ref] = None
+        if not self.use_content_signature:
+            reference = weakref.ref(df, lambda _: self._remove(key))
+        with self._lock:
+            self._entries[key] = (reference, hashes)
+            self._evict()
+        return hashes
+
+    def _get_key(self, df: pl.DataFrame, columns: list[str]) -> Hashable:
+        if self.use_content_signature:
+            return (self._get_signature(df), tuple(columns))
+        return (id(df), tuple(columns))
+
+    def _get_signature(self, df: pl.DataFrame) -> tuple:
+        """Get the content signature of a dataframe, memoized per dataframe object."""
+        frame_id: int = id(df)
+        with self._lock:
+            entry: Optional[tuple[weakref.ref, tuple]] = self._signatures.get(frame_id)
+            if entry is not None and entry[0]() is df:
+                return entry[1]
+
+        signature: tuple = get_content_signature(df)
+        with self._lock:
+            self._signatures[frame_id] = (
+                weakref.ref(
+                    df, lambda reference: self._forget_signature(frame_id, reference)
+                ),
+                signature,
+            )
+        return signature
+
+    def _forget_signature(self, frame_id: int, reference: weakref.ref) -> None:
+        with self._lock:
+            entry: Optional[tuple[weakref.ref, tuple]] = self._signatures.get(frame_id)
+            # the id can already be reused by a newer dataframe
+            if entry is not None and entry[0] is reference:
+                del self._signatures[frame_id]
+
+    def _remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _evict(self) -> None:
+        while len(self._entries) > 0 and self.estimated_size > self.max_bytes:
+            self._entries.popitem(last=False)
@@ -1,4 +1,5 @@
-from typing import Any, Callable
+from typing import Any, Callable, Optional
+import functools
 import json
 
 import pandas as pd
@@ -41,9 +42,26 @@ def _raise_same_column_names(argument: Any, **kwargs) -> None:
     )
 
 
+def _get_column_names(argument: Any) -> Optional[list[str]]:
+    """
+    Get the column names of a dataframe, the schema of a `polars.LazyFrame` is resolved without reading the data.
+
+    Parameters:
+        argument (Any): The argument to get the column names of.
+
+    Returns:
+        Optional[list[str]]: The column names, `None` if the argument is not a dataframe.
+    """
+    if isinstance(argument, pl.LazyFrame):
+        return argument.collect_schema().names()
+    if isinstance(argument, (pd.DataFrame, pl.DataFrame)):
+        return list(argument.columns)
+    return None
+
+
 def _raise_hash_column_name(argument: Any, **kwargs) -> None:
     """
-    Check if the argument is a `pandas.DataFrame` or `polars.DataFrame` and has a column named `hash`.
+    Check if the argument is a `pandas.DataFrame`, `polars.DataFrame` or `polars.LazyFrame` and has a column named `hash`.
     If so, raise a `ValueError`.
 
     Parameters:
@@ -55,12 +73,10 @@ def _raise_hash_column_name(argument: Any, **kwargs) -> None:
     Returns:
         None
     """
-    if not isinstance(argument, pd.DataFrame) and not isinstance(
-        argument, pl.DataFrame
-    ):
+    column_names_list: Optional[list[str]] = _get_column_names(argument)
+    if column_names_list is None:
         return
 
-    column_names_list: list[str] = list(argument.columns)
     column_names_set: set[str] = set(column_names_list)
 
     if "hash" in column_names_set:
@@ -69,7 +85,7 @@ def _raise_hash_column_name(argument: Any, **kwargs) -> None:
 
 def _raise_source_column_name(argument: Any, **kwargs) -> None:
     """
-    Check if the argument is a `pandas.DataFrame` or `polars.DataFrame` and has a column named `source`.
+    Check if the argument is a `pandas.DataFrame`, `polars.DataFrame` or `polars.LazyFrame` and has a column named `source`.
     If so, raise a `ValueError`.
 
     Parameters:
@@ -81,12 +97,10 @@ def _raise_source_column_name(argument: Any, **kwargs) -> None:
     Returns:
         None
     """
-    if not isinstance(argument, pd.DataFrame) and not isinstance(
-        argument, pl.DataFrame
-    ):
+    column_names_list: Optional[list[str]] = _get_column_names(argument)
+    if column_names_list is None:
         return
 
-    column_names_list: list[str] = list(argument.columns)
     column_names_set: set[str] = set(column_names_list)
     if "source" in column_names_set:
         raise ValueError("Column names cannot contain 'source'")
@@ -125,6 +139,24 @@ _rules_for_inputs: list[Callable[[Any], None]] = [
 """Rules for checking the inputs, they are applied in the order they are defined."""
 
 
+def check_reserved_columns(df: Any) -> None:
+    """
+    Check that a dataframe (*or the schema of a lazy frame*) has none of the columns reserved by the comparison
+    (*same rules as* :func:`check_inputs`), so a scanned source is validated before it is streamed.
+
+    Parameters:
+        df (Any): The dataframe or lazy frame to check.
+
+    Raises:
+        ValueError: If the dataframe has a column named `hash` or `source`.
+
+    Returns:
+        None
+    """
+    _raise_hash_column_name(df)
+    _raise_source_column_name(df)
+
+
 def check_inputs(func) -> None:
     """
     Decorator for checking the input arguments against a set of input rules.
@@ -151,8 +183,8 @@ def check_inputs(func) -> None:
     .. note::
         The rules are applied in the order they are defined. There are rules:
         - there must not be any duplicate column names in the dataframes.
-        - there must not be any column named "hash" in the dataframes
-        - there must not be any column named "source" in the dataframes
+        - there must not be any column named "hash" in the dataframes (*or in the schema of lazy frames*)
+        - there must not be any column named "source" in the dataframes (*or in the schema of lazy frames*)
         - there must not be any duplicate source names
 
     Parameters:
@@ -165,6 +197,7 @@ def check_inputs(func) -> None:
         None
     """
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         source_names: list[str] = []
         for arg in args:
@@ -0,0 +1,276 @@
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from data_fingerprint.src.models import DataReport
+
+# polars reads `POLARS_MAX_THREADS` when it is imported, so the library (*and polars*) is imported
+# only after the arguments are parsed, see :func:`main`.
+
+SIZE_UNITS: dict[str, int] = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+"""The units of the memory sizes accepted by :func:`parse_size`."""
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a memory size like `512MB`, `4GiB` or `1000000` into bytes.
+
+    Raises:
+        argparse.ArgumentTypeError: If the size is not valid.
+
+    Args:
+        size (str): The size.
+
+    Returns:
+        int: The size in bytes.
+    """
+    match: Optional[re.Match] = re.fullmatch(
+        r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*", size
+    )
+    if match is None or match.group(2).lower() not in SIZE_UNITS:
+        raise argparse.ArgumentTypeError(f"Invalid memory size: {size}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).lower()])
+
+
+def _split_columns(values: Optional[list[str]]) -> Optional[list[str]]:
+    if values is None:
+        return None
+    return [column for value in values for column in value.split(",") if column]
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Get the parser of the command-line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="data-fingerprint",
+        description="Compare two datasets and report the differences between them.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "compare",
+        help="compare two files (Parquet, Arrow IPC, CSV or NDJSON)",
+        description="Compare two files and write the data report as JSON.",
+    )
+    compare_parser.add_argument("path0", help="the first file")
+    compare_parser.add_argument("path1", help="the second file")
+    compare_parser.add_argument(
+        "-k",
+        "--key",
+        action="append",
+        help="the columns to pair the rows by (repeatable or comma-separated)",
+    )
+    compare_parser.add_argument("--name0", help="the name of the first file")
+    compare_parser.add_argument("--name1", help="the name of the second file")
+    compare_parser.add_argument(
+        "--include", action="append", help="the only columns to compare"
+    )
+    compare_parser.add_argument(
+        "--exclude", action="append", help="the columns not to compare"
+    )
+    compare_parser.add_argument(
+        "-o", "--output", help="the file to write the report to (stdout by default)"
+    )
+    compare_parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="json",
+        help="`json` writes one report, `jsonl` writes a summary line and one line per difference",
+    )
+    compare_parser.add_argument(
+        "--memory-budget",
+        type=parse_size,
+        help="the memory budget, for example 4GB; files that do not fit are spilled to disk in hash partitions",
+    )
+    compare_parser.add_argument(
+        "--large-value-threshold",
+        type=parse_size,
+        help="report string and binary values larger than this, for example 4KB, by a digest and their length",
+    )
+    compare_parser.add_argument(
+        "--threads", type=int, help="the number of threads used by polars"
+    )
+    compare_parser.add_argument(
+        "--exit-code",
+        action="store_true",
+        help="exit with 1 when there are differences",
+    )
+    return parser
+
+
+def _get_names(args: argparse.Namespace) -> tuple[str, str]:
+    name0: str = args.name0 or Path(args.path0).name
+    name1: str = args.name1 or Path(args.path1).name
+    if name0 == name1 and args.name0 is None and args.name1 is None:
+        return args.path0, args.path1
+    return name0, name1
+
+
+def _fits_memory_budget(paths: list[str], memory_budget: Optional[int]) -> bool:
+    from data_fingerprint.src.memory import MEMORY_FACTOR
+
+    if memory_budget is None:
+        return True
+    return MEMORY_FACTOR * sum(os.path.getsize(path) for path in paths) <= memory_budget
+
+
+def write_report(
+    report: "DataReport", stream: IO[str], output_format: str = "json"
+) -> None:
+    """
+    Write a data report to a stream piece by piece, so the whole JSON document is never built in memory.
+
+    Args:
+        report (:class:`data_compare.src.models.DataReport`): The report.
+        stream (IO[str]): The stream.
+        output_format (str): `json` writes the report as one JSON object, `jsonl` writes a line with the summary
+            and a line per column difference and per row difference (*with the `kind` of the difference*).
+
+    Returns:
+        None
+    """
+    summary: dict = report.model_dump(
+        mode="json", exclude={"column_differences", "row_differences"}
+    )
+    if output_format == "jsonl":
+        stream.write(json.dumps({"kind": "summary", **summary}) + "\n")
+        for kind, differences in [
+            ("column_difference", report.column_differences),
+            ("row_difference", report.row_differences),
+        ]:
+            for difference in differences:
+                stream.write(
+                    json.dumps({"kind": kind, **difference.model_dump(mode="json")})
+                    + "\n"
+                )
+        return
+
+    stream.write(json.dumps(summary)[:-1])
+    for key, differences in [
+        ("column_differences", report.column_differences),
+        ("row_differences", report.row_differences),
+    ]:
+        stream.write(f', "{key}": [')
+        for index, difference in enumerate(differences):
+            if index > 0:
+                stream.write(", ")
+            stream.write(difference.model_dump_json())
+        stream.write("]")
+    stream.write("}\n")
+
+
+def compare(args: argparse.Namespace) -> int:
+    """
+    Run the `compare` command.
+
+    Both files are scanned lazily, so only the compared columns are read. Files that do not fit the memory budget
+    (*whatever their format*) are read in chunks and spilled to disk in hash partitions
+    (*see* :func:`data_compare.src.spill.get_data_report_spilled`).
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        int: The exit code.
+    """
+    from data_fingerprint.src.comparator import get_data_report
+    from data_fingerprint.src.scan import scan_source
+    from data_fingerprint.src.spill import get_data_report_spilled
+
+    paths: list[str] = [args.path0, args.path1]
+    df0_name, df1_name = _get_names(args)
+    grouping_columns: Optional[list[str]] = _split_columns(args.key)
+    include_columns: Optional[list[str]] = _split_columns(args.include)
+    exclude_columns: Optional[list[str]] = _split_columns(args.exclude)
+
+    if not _fits_memory_budget(paths, args.memory_budget):
+        report = get_data_report_spilled(
+            args.path0,
+            args.path1,
+            df0_name,
+            df1_name,
+            grouping_columns,
+            memory_limit=args.memory_budget,
+            include_columns=include_columns,
+            exclude_columns=exclude_columns,
+            large_value_threshold=args.large_value_threshold,
+        )
+    else:
+        report = get_data_report(
+            scan_source(args.path0),
+            scan_source(args.path1),
+            df0_name,
+            df1_name,
+            grouping_columns,
+            include_columns=include_columns,
+            exclude_columns=exclude_columns,
+            concurrent_sides=True,
+            large_value_threshold=args.large_value_threshold,
+        )
+
+    if args.output is None:
+        write_report(report, sys.stdout, args.format)
+    else:
+        with open(args.output, "w") as output:
+            write_report(report, output, args.format)
+
+    if args.exit_code and (
+        len(report.column_differences) > 0 or len(report.row_differences) > 0
+    ):
+        return 1
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    The entry point of the `data-fingerprint` console script.
+
+    Example:
+        ```
+        data-fingerprint compare orders.parquet orders_backup.csv --key id --threads 4 -o report.json
+        ```
+
+    Args:
+        argv (Optional[list[str]]): The arguments, `sys.argv` by default.
+
+    Returns:
+        int: The exit code, `0` on success (*`1` for differences with `--exit-code`*) and `2` on errors.
+    """
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args(argv)
+    if args.threads is not None:
+        if args.threads < 1:
+            parser.error("--threads must be at least 1")
+        os.environ["POLARS_MAX_THREADS"] = str(args.threads)
+
+    import polars as pl
+
+    try:
+        return compare(args)
+    except (ValueError, OSError, pl.exceptions.PolarsError) as error:
+        print(f"data-fingerprint: error: {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
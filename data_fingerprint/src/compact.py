@@ -0,0 +1,386 @@
+from typing import Iterator, Optional, Union
+
+import polars as pl
+
+from data_fingerprint.src.checkers import check_inputs
+from data_fingerprint.src.comparator import (
+    _get_row_differences_grouped,
+    _join_unique_keys,
+    _split_duplicated_keys,
+    compare_group_column_by_column,
+    get_column_dtype_differences,
+)
+from data_fingerprint.src.models import (
+    ColumnDifference,
+    RowDifference,
+    RowGroupDifference,
+)
+from data_fingerprint.src.progress import CancellationToken, ProgressCallback
+from data_fingerprint.src.utils import convert_to_polars
+
+BITS_PER_WORD: int = 64
+"""The number of columns in one word of a changed-column bitmask."""
+
+CHANGED_PREFIX: str = "__changed_"
+
+
+def get_bitmask_expression(
+    columns: list[str], changed_columns: list[str], prefix: str = ""
+) -> pl.Expr:
+    """
+    Get an expression packing boolean columns into a changed-column bitmask: a list of `UInt64` words
+    where bit `i % 64` of word `i // 64` is set when `columns[i]` changed.
+
+    Args:
+        columns (list[str]): The column dictionary.
+        changed_columns (list[str]): The columns of the dictionary that have a boolean column
+            (*named as the column with `prefix`*) telling if the column changed, the others never changed.
+        prefix (str): The prefix of the boolean columns.
+
+    Returns:
+        pl.Expr: The bitmask expression, named `changed`.
+    """
+    changed: set[str] = set(changed_columns)
+    words: list[pl.Expr] = []
+    for word in range(max(1, -(-len(columns) // BITS_PER_WORD))):
+        bits: list[pl.Expr] = [
+            pl.when(pl.col(f"{prefix}{column}"))
+            .then(pl.lit(1 << (index % BITS_PER_WORD), dtype=pl.UInt64))
+            .otherwise(pl.lit(0, dtype=pl.UInt64))
+            for index, column in enumerate(columns)
+            if index // BITS_PER_WORD == word and column in changed
+        ]
+        words.append(
+            pl.sum_horizontal(bits) if len(bits) > 0 else pl.lit(0, dtype=pl.UInt64)
+        )
+    return pl.concat_list(words).alias("changed")
+
+
+class CompactRowDifferences:
+    """
+    Compact representation of the row differences of a paired comparison
+    (*see* :func:`get_compact_row_differences`).
+
+    Instead of three dictionaries of lists per difference (*`row`, `consise_information` and `row_with_source`
+    of :class:`data_compare.src.models.RowGroupDifference`*), the differences are kept in two dataframes:
+
+    - `differences`: one row per difference with the key columns, the `source` of a missing row
+      (*`null` for a pair of rows with different values*), the `changed` bitmask of the changed columns
+      indexed against the shared column dictionary `columns` and the `offset` and `length` of its rows
+      in the value table
+    - `values`: the shared value table with the rows of all differences (*and their `source`*)
+
+    The verbose :class:`data_compare.src.models.RowDifference` and
+    :class:`data_compare.src.models.RowGroupDifference` views are derived on demand.
+
+    Example:
+        ```python
+        same_columns, column_differences, differences = get_compact_row_differences(df0, df1, "df0", "df1", ["id"])
+        print(len(differences), differences.estimated_size())
+        price_changes = differences.differences.filter(differences.get_changed("price"))
+        first = differences[0]  # a RowGroupDifference or a RowDifference
+        ```
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        grouping_columns: list[str],
+        differences: pl.DataFrame,
+        values: pl.DataFrame,
+    ) -> None:
+        """
+        Create the compact row differences.
+
+        Args:
+            columns (list[str]): The column dictionary, the sorted comparable columns.
+            grouping_columns (list[str]): The key columns.
+            differences (pl.DataFrame): One row per difference (*see the class documentation*).
+            values (pl.DataFrame): The shared value table.
+        """
+        self.columns: list[str] = columns
+        """The column dictionary, the bit `i` of a bitmask stands for `columns[i]`."""
+
+        self.grouping_columns: list[str] = grouping_columns
+        """The key columns."""
+
+        self.differences: pl.DataFrame = differences
+        """One row per difference: the key columns, `source`, `changed`, `offset` and `length`."""
+
+        self.values: pl.DataFrame = values
+        """The shared value table with the rows of the differences."""
+
+    def __len__(self) -> int:
+        return len(self.differences)
+
+    def __getitem__(self, index: int) -> Union[RowDifference, RowGroupDifference]:
+        """
+        Derive the verbose view of one difference.
+
+        Args:
+            index (int): The index of the difference.
+
+        Returns:
+            Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]: The difference.
+        """
+        row: dict = self.differences.row(index, named=True)
+        return compare_group_column_by_column(
+            self.values.slice(row["offset"], row["length"]), self.grouping_columns
+        )
+
+    def __iter__(self) -> Iterator[Union[RowDifference, RowGroupDifference]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_row_differences(self) -> list[Union[RowDifference, RowGroupDifference]]:
+        """
+        Derive the verbose views of all differences.
+
+        Returns:
+            list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The differences.
+        """
+        return list(self)
+
+    def get_changed_columns(self, index: int) -> list[str]:
+        """
+        Decode the changed columns of one difference from its bitmask.
+
+        Args:
+            index (int): The index of the difference.
+
+        Returns:
+            list[str]: The changed columns (*empty for a missing row*).
+        """
+        words: list[int] = self.differences["changed"][index].to_list()
+        return [
+            column
+            for position, column in enumerate(self.columns)
+            if words[position // BITS_PER_WORD] >> (position % BITS_PER_WORD) & 1
+        ]
+
+    def get_changed(self, column: str) -> pl.Expr:
+        """
+        Get an expression over `differences` that tells if a column changed, so the differences can be
+        filtered without decoding the bitmasks.
+
+        Raises:
+            ValueError: If the column is not in the column dictionary.
+
+        Args:
+            column (str): The column.
+
+        Returns:
+            pl.Expr: The boolean expression.
+        """
+        if column not in self.columns:
+            raise ValueError(f"Column is not compared: {column}")
+        position: int = self.columns.index(column)
+        return (
+            pl.col("changed").list.get(position // BITS_PER_WORD)
+            & pl.lit(1 << (position % BITS_PER_WORD), dtype=pl.UInt64)
+        ) != 0
+
+    def estimated_size(self) -> int:
+        """
+        Get the estimated size (*in bytes*) of the differences and the value table.
+
+        Returns:
+            int: The estimated size.
+        """
+        return int(
+            self.differences.estimated_size("b") + self.values.estimated_size("b")
+        )
+
+
+def _get_differences_frame(
+    rows: pl.DataFrame,
+    grouping_columns: list[str],
+    columns: list[str],
+    changed: pl.DataFrame,
+    offset: int,
+    length: int,
+) -> pl.DataFrame:
+    return (
+        rows.hstack(changed.select(pl.all().name.prefix(CHANGED_PREFIX)))
+        .select(
+            *grouping_columns,
+            (
+                pl.col("source")
+                if "source" in rows.columns
+                else pl.lit(None, pl.String).alias("source")
+            ),
+            get_bitmask_expression(columns, changed.columns, CHANGED_PREFIX),
+        )
+        .with_columns(
+            (pl.int_range(pl.len(), dtype=pl.UInt32) * length + offset).alias("offset"),
+            pl.lit(length, dtype=pl.UInt32).alias("length"),
+        )
+    )
+
+
+def _from_row_differences(
+    row_differences: list[Union[RowDifference, RowGroupDifference]],
+    columns: list[str],
+    grouping_columns: list[str],
+    offset: int,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    frames: list[pl.DataFrame] = []
+    differences: list[dict] = []
+    for difference in row_differences:
+        if isinstance(difference, RowGroupDifference):
+            frame: pl.DataFrame = pl.DataFrame(difference.row_with_source)
+            source: Optional[str] = None
+            changed_columns: list[str] = difference.column_differences
+        else:
+            frame = pl.DataFrame(difference.row).with_columns(
+                pl.lit(difference.source).alias("source")
+            )
+            source = difference.source
+            changed_columns = []
+        frames.append(frame.select(columns + ["source"]))
+        differences.append(
+            {
+                **{column: frame[column][0] for column in grouping_columns},
+                "source": source,
+                **{
+                    f"{CHANGED_PREFIX}{column}": column in changed_columns
+                    for column in columns
+                },
+                "offset": offset,
+                "length": len(frame),
+            }
+        )
+        offset += len(frame)
+    if len(differences) == 0:
+        return pl.DataFrame(), pl.DataFrame()
+    table: pl.DataFrame = pl.DataFrame(differences)
+    return (
+        table.select(
+            *grouping_columns,
+            pl.col("source").cast(pl.String),
+            get_bitmask_expression(columns, columns, CHANGED_PREFIX),
+            pl.col("offset").cast(pl.UInt32),
+            pl.col("length").cast(pl.UInt32),
+        ),
+        pl.concat(frames, how="vertical_relaxed"),
+    )
+
+
+@convert_to_polars
+@check_inputs
+def get_compact_row_differences(
+    df0: pl.DataFrame,
+    df1: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: list[str],
+    unique_key: Optional[bool] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> tuple[list[str], list[ColumnDifference], CompactRowDifferences]:
+    """
+    Compare the rows of two dataframes paired by the grouping columns
+    (*see* :func:`data_compare.src.comparator.get_row_differences_paired`)
+    into a :class:`CompactRowDifferences`.
+
+    The rows with unique keys are paired with one join and their bitmasks are computed column by column,
+    so no per-difference Python objects are created. The differences of the duplicated-key groups are
+    compared group by group and packed into the same representation.
+
+    Raises:
+        ValueError: If the pairing columns are not the present in both dataframes.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Args:
+        df0 (pl.DataFrame): The first dataframe.
+        df1 (pl.DataFrame): The second dataframe.
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        grouping_columns (list[str]): The columns to group by.
+        unique_key (Optional[bool]): `True` declares the grouping columns unique in both dataframes,
+            `None` detects the duplicated keys.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback
+            of the duplicated-key groups.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        list[str]: The same columns
+
+        list[:class:`data_compare.src.models.ColumnDifference`]: The column differences
+
+        :class:`CompactRowDifferences`: The row differences
+    """
+    same_columns, column_differences = get_column_dtype_differences(
+        df0, df1, df0_name, df1_name
+    )
+    if len(set(grouping_columns).difference(same_columns)) > 0:
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+
+    columns: list[str] = sorted(same_columns)
+    df0_unique, df1_unique, df0_duplicated, df1_duplicated = (
+        (df0.select(columns), df1.select(columns), None, None)
+        if unique_key
+        else _split_duplicated_keys(
+            df0.select(columns), df1.select(columns), grouping_columns
+        )
+    )
+    missing, stacked, changed = _join_unique_keys(
+        df0_unique, df1_unique, df0_name, df1_name, grouping_columns
+    )
+    pairs: pl.DataFrame = stacked.sort("__pair", "source", maintain_order=True)
+
+    differences: list[pl.DataFrame] = [
+        _get_differences_frame(
+            missing,
+            grouping_columns,
+            columns,
+            missing.select(
+                [pl.repeat(False, pl.len()).alias(column) for column in columns]
+            ),
+            0,
+            1,
+        ),
+        _get_differences_frame(
+            pairs.gather_every(2).select(grouping_columns),
+            grouping_columns,
+            columns,
+            changed,
+            len(missing),
+            2,
+        ),
+    ]
+    values: list[pl.DataFrame] = [missing, pairs.drop("__pair")]
+
+    if df0_duplicated is not None and len(df0_duplicated) + len(df1_duplicated) > 0:
+        _, _, duplicated_differences = _get_row_differences_grouped(
+            df0_duplicated,
+            df1_duplicated,
+            df0_name,
+            df1_name,
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+        duplicated, duplicated_values = _from_row_differences(
+            duplicated_differences,
+            columns,
+            grouping_columns,
+            len(missing) + len(pairs),
+        )
+        if len(duplicated) > 0:
+            differences.append(duplicated)
+            values.append(duplicated_values)
+
+    return (
+        same_columns,
+        column_differences,
+        CompactRowDifferences(
+            columns,
+            sorted(grouping_columns),
+            pl.concat(differences, how="vertical_relaxed"),
+            pl.concat(values, how="vertical_relaxed"),
+        ),
+    )
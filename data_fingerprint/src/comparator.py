@@ -1,4 +1,5 @@
-from typing import Union, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar, Union, Optional
 
 import polars as pl
 
@@ -7,18 +8,39 @@ from data_fingerprint.src.models import (
     RowDifference,
     RowGroupDifference,
     DataReport,
+    MemoryProfile,
+    StageMemory,
+)
+from data_fingerprint.src.memory import track_stage, record_frame_size
+from data_fingerprint.src.cache import HashCache
+from data_fingerprint.src.progress import (
+    CancellationToken,
+    ProgressCallback,
+    track_progress,
 )
 from data_fingerprint.src.utils import (
     convert_to_polars,
     convert_row_differences_to_pandas,
 )
 from data_fingerprint.src.checkers import check_inputs
-from data_fingerprint.src.difference_types import (
-    ColumnNameDifferenceType,
-    ColumnDataTypeDifferenceType,
-    RowDifferenceType,
+from data_fingerprint.src.difference_types import RowDifferenceType
+from data_fingerprint.src.digest import digest_large_values
+from data_fingerprint.src.scan import (
+    RowFilter,
+    collect_source,
+    get_side_filters,
+    scan_projected,
+)
+from data_fingerprint.src.schema import (
+    get_schema_differences,
+    get_schema_name_differences,
 )
 
+T = TypeVar("T")
+
+COLUMN_BLOCK_SIZE: int = 512
+"""The number of columns whose per-group distinct counts are computed in one pass over a wide dataframe."""
+
 
 @convert_to_polars
 @check_inputs
@@ -63,36 +85,7 @@ def get_column_name_differences(
 
         list[ColumnDifference]: A list of :class:`data_compare.src.models.ColumnDifference` objects representing the differences in column names.
     """
-    column_names_0 = set(df0.columns)
-    column_names_1 = set(df1.columns)
-
-    # Get the differences in column names
-    # Extra columns are columns in df0 that are not in df1
-    extra_columns = column_names_0 - column_names_1
-    # Missing columns are columns in df1 that are not in df0
-    missing_columns = column_names_1 - column_names_0
-
-    # get the same column names
-    same_columns = column_names_0 & column_names_1
-
-    column_differences: list[ColumnDifference] = []
-    for missing_col in missing_columns:
-        column_differences.append(
-            ColumnDifference(
-                source=df0_name,
-                column_name=missing_col,
-                difference_type=ColumnNameDifferenceType.MISSING,
-            )
-        )
-    for extra_col in extra_columns:
-        column_differences.append(
-            ColumnDifference(
-                source=df0_name,
-                column_name=extra_col,
-                difference_type=ColumnNameDifferenceType.EXTRA,
-            )
-        )
-    return same_columns, column_differences
+    return get_schema_name_differences(df0.schema, df1.schema, df0_name, df1_name)
 
 
 @convert_to_polars
@@ -144,7 +137,8 @@ def get_column_dtype_differences(
 
 
     .. note::
-        **One thing to remember is that timezone of `pl.Datetime` column is defined by first value in the column.**
+        The check uses only the schemas of the dataframes (*see* :func:`data_compare.src.schema.get_schema_differences`),
+        so it also works for empty dataframes and schemas of files and lazy frames can be compared without loading them.
 
     Args:
         df0 (pl.DataFrame): The first dataframe.
@@ -158,71 +152,7 @@ def get_column_dtype_differences(
         list[:class:`data_compare.src.models.ColumnDifference`]: The differences in column types between the two dataframes.
 
     """
-    df0_dtypes: dict[str, str] = {
-        column_name: type(dtype) for column_name, dtype in zip(df0.columns, df0.dtypes)
-    }
-    df1_dtypes: dict[str, str] = {
-        column_name: type(dtype) for column_name, dtype in zip(df1.columns, df1.dtypes)
-    }
-
-    same_columns, column_differences = get_column_name_differences(
-        df0, df1, df0_name, df1_name
-    )
-
-    same_columns_after_dtpe_check: list[str] = []
-    same_columns_after_dtpe_check.extend(same_columns)
-
-    for same_col in same_columns:
-        if df0_dtypes[same_col] != df1_dtypes[same_col]:
-            column_differences.append(
-                ColumnDifference(
-                    source=df0_name,
-                    column_name=same_col,
-                    difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TYPE,
-                    more_information={
-                        df0_name: f"{df0_dtypes[same_col]}",
-                        df1_name: f"{df1_dtypes[same_col]}",
-                    },
-                )
-            )
-            same_columns_after_dtpe_check.remove(same_col)
-            continue
-
-        # check if the timezone is the same
-        # in polars.DataFrame first element of the column is default timezone for the column
-        if df0_dtypes[same_col] == pl.Datetime:
-            if df0[same_col][0].tzinfo != df1[same_col][0].tzinfo:
-                column_differences.append(
-                    ColumnDifference(
-                        source=df0_name,
-                        column_name=same_col,
-                        difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TIMEZONE,
-                        more_information={
-                            df0_name: f"{df0[same_col][0].tzinfo}",
-                            df1_name: f"{df1[same_col][0].tzinfo}",
-                        },
-                    )
-                )
-                same_columns_after_dtpe_check.remove(same_col)
-                continue
-
-            # check if the precision of time is the same
-            if df0[same_col].dtype.time_unit != df1[same_col].dtype.time_unit:
-                column_differences.append(
-                    ColumnDifference(
-                        source=df0_name,
-                        column_name=same_col,
-                        difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TIME_PRECISION,
-                        more_information={
-                            df0_name: f"{df0[same_col].dtype.time_unit}",
-                            df1_name: f"{df1[same_col].dtype.time_unit}",
-                        },
-                    )
-                )
-                same_columns_after_dtpe_check.remove(same_col)
-                continue
-
-    return same_columns_after_dtpe_check, column_differences
+    return get_schema_differences(df0.schema, df1.schema, df0_name, df1_name)
 
 
 @convert_to_polars
@@ -232,6 +162,11 @@ def get_row_differences(
     df1: pl.DataFrame,
     df0_name: str,
     df1_name: str,
+    memory_profile: Optional[MemoryProfile] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+    hash_cache: Optional[HashCache] = None,
+    concurrent_sides: bool = False,
 ) -> tuple[list[str], list[ColumnDifference], list[RowDifference]]:
     """
     Get the row differences between two dataframes, meaning find the rows that are in one dataframe but not in the other **or they differ**.
@@ -284,6 +219,18 @@ def get_row_differences(
         df1 (pl.DataFrame): The second dataframe.
         df0_name (str): The name of the first dataframe.
         df1_name (str): The name of the second dataframe.
+        memory_profile (Optional[:class:`data_compare.src.models.MemoryProfile`]): If given, the memory usage of
+            the `column_differences`, `hashing` and `row_differences` stages is recorded into it.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the stage name, number of processed items and total number of items for each processed difference hash.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            between processed items and the comparison is aborted when it is cancelled.
+        hash_cache (Optional[:class:`data_compare.src.cache.HashCache`]): If given, the row hashes are taken
+            from the cache instead of hashing the same dataframes again.
+        concurrent_sides (bool): Hash both dataframes concurrently on two threads.
+
+    Raises:
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
 
     Returns:
        list[str]: The columns that are the same
@@ -294,9 +241,10 @@ def get_row_differences(
 
 
     """
-    same_columns, column_differences = get_column_dtype_differences(
-        df0, df1, df0_name, df1_name
-    )
+    with track_stage(memory_profile, "column_differences"):
+        same_columns, column_differences = get_column_dtype_differences(
+            df0, df1, df0_name, df1_name
+        )
 
     if len(same_columns) == 0:
         return (
@@ -322,110 +270,232 @@ def get_row_differences(
             ],
         )
 
-    df0_subset: pl.DataFrame = df0.select(same_columns)
-    df1_subset: pl.DataFrame = df1.select(same_columns)
+    with track_stage(memory_profile, "hashing") as stage_memory:
+        df0_subset, df1_subset = _run_sides(
+            lambda: _hash_subset(df0, same_columns, df0_name, hash_cache),
+            lambda: _hash_subset(df1, same_columns, df1_name, hash_cache),
+            concurrent_sides,
+        )
+        record_frame_size(stage_memory, "df0_subset", df0_subset)
+        record_frame_size(stage_memory, "df1_subset", df1_subset)
+
+    with track_stage(memory_profile, "row_differences") as stage_memory:
+        row_differences: list[RowDifference] = _get_hashed_row_differences(
+            df0_subset,
+            df1_subset,
+            df0_name,
+            df1_name,
+            stage_memory,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
 
-    df0_subset = df0_subset.with_columns(df0_subset.hash_rows().alias("hash"))
-    df1_subset = df1_subset.with_columns(df1_subset.hash_rows().alias("hash"))
+    return same_columns, column_differences, row_differences
 
-    df0_subset = df0_subset.with_columns(pl.lit(df0_name).alias("source"))
-    df1_subset = df1_subset.with_columns(pl.lit(df1_name).alias("source"))
 
-    row_differences: list[RowDifference] = []
+def _run_sides(
+    df0_function: Callable[[], T],
+    df1_function: Callable[[], T],
+    concurrent: bool = False,
+) -> tuple[T, T]:
+    """
+    Run the same work for both sides of a comparison, concurrently on two threads if requested.
 
-    differences_hash_df0: set[str] = set(df0_subset["hash"]).difference(
-        set(df1_subset["hash"])
-    )
-    differences_hash_df1: set[str] = set(df1_subset["hash"]).difference(
-        set(df0_subset["hash"])
+    Args:
+        df0_function (Callable[[], T]): The work for the first side.
+        df1_function (Callable[[], T]): The work for the second side.
+        concurrent (bool): Run both functions concurrently.
+
+    Returns:
+        tuple[T, T]: The results of both functions.
+    """
+    if not concurrent:
+        return df0_function(), df1_function()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        df0_future: Future = executor.submit(df0_function)
+        df1_future: Future = executor.submit(df1_function)
+        return df0_future.result(), df1_future.result()
+
+
+def _hash_subset(
+    df: pl.DataFrame,
+    columns: list[str],
+    name: str,
+    hash_cache: Optional[HashCache] = None,
+) -> pl.DataFrame:
+    """
+    Select the columns of a dataframe and add the row `hash` and the `source` columns.
+
+    The columns are sorted by name, so the hashes do not depend on the order of the columns.
+
+    Args:
+        df (pl.DataFrame): The dataframe.
+        columns (list[str]): The columns to select and hash.
+        name (str): The name of the dataframe (*value of the `source` column*).
+        hash_cache (Optional[:class:`data_compare.src.cache.HashCache`]): If given, the hashes are taken from the cache.
+
+    Returns:
+        pl.DataFrame: The hashed subset.
+    """
+    df_subset: pl.DataFrame = df.select(sorted(columns))
+    hashes: pl.Series = (
+        df_subset.hash_rows()
+        if hash_cache is None
+        else hash_cache.get_hashes(df, df_subset.columns)
     )
+    return df_subset.with_columns(hashes.alias("hash"), pl.lit(name).alias("source"))
 
-    for difference_hash in differences_hash_df0:
-        difference_row: pl.DataFrame = df0_subset.filter(
-            pl.col("hash") == difference_hash
-        )
 
-        diff: RowDifference = RowDifference(
-            source=df0_name,
-            row=difference_row.select(sorted(difference_row.columns))
-            .drop(["hash", "source"])
-            .sort("*")
-            .to_dict(as_series=False),
-            number_of_occurrences=difference_row.shape[0],
-            difference_type=RowDifferenceType.MISSING_ROW,
-        )
-        row_differences.append(diff)
+def _get_hash_counts(df_subset: pl.DataFrame) -> pl.DataFrame:
+    """
+    Get the number of occurrences (*multiplicity*) of every row hash of a hashed subset.
 
-    for difference_hash in differences_hash_df1:
-        difference_row: pl.DataFrame = df1_subset.filter(
-            pl.col("hash") == difference_hash
-        )
+    Args:
+        df_subset (pl.DataFrame): The hashed subset (*see* :func:`_hash_subset`).
 
-        diff: RowDifference = RowDifference(
-            source=df1_name,
-            row=difference_row.select(sorted(difference_row.columns))
-            .drop(["hash", "source"])
-            .sort("*")
-            .to_dict(as_series=False),
-            number_of_occurrences=difference_row.shape[0],
-            difference_type=RowDifferenceType.MISSING_ROW,
-        )
-        row_differences.append(diff)
+    Returns:
+        pl.DataFrame: The dataframe with the `hash` and `count` columns.
+    """
+    return df_subset.group_by("hash").agg(pl.len().cast(pl.Int64).alias("count"))
 
-    # look for duplicates that are in both dataframes
-    # but not the same number of times
-    duplicates_df0 = df0_subset.filter(pl.col("hash").is_duplicated())
-    duplicates_df1 = df1_subset.filter(pl.col("hash").is_duplicated())
 
-    duplicates_df0_hashes: set[str] = set(duplicates_df0["hash"]) & set(
-        df1_subset["hash"]
-    )
-    duplicates_df1_hashes: set[str] = set(duplicates_df1["hash"]) & set(
-        df0_subset["hash"]
-    )
+def _get_hashed_row_differences(
+    df0_subset: pl.DataFrame,
+    df1_subset: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    stage_memory: Optional[StageMemory] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+    df0_counts: Optional[pl.DataFrame] = None,
+    df1_counts: Optional[pl.DataFrame] = None,
+) -> list[RowDifference]:
+    """
+    Get the row differences between two hashed subsets (*see* :func:`get_row_differences`).
 
-    same_hashes: set[str] = duplicates_df0_hashes.union(duplicates_df1_hashes)
-    for same_hash in same_hashes:
-        duplicates_df0_count = df0_subset.filter(pl.col("hash") == same_hash).shape[0]
-        duplicates_df1_count = df1_subset.filter(pl.col("hash") == same_hash).shape[0]
+    Both subsets must have the same columns plus the `hash` and `source` columns.
+    The multiplicities of the hashes are compared in one join, so a hash is a difference when
+    it is missing in the other subset or when it is present a different number of times.
+    Only the rows of the differing hashes are materialized.
 
-        if duplicates_df0_count == duplicates_df1_count:
-            continue
+    Args:
+        df0_subset (pl.DataFrame): The hashed subset of the first dataframe.
+        df1_subset (pl.DataFrame): The hashed subset of the second dataframe.
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        stage_memory (Optional[:class:`data_compare.src.models.StageMemory`]): If given, the estimated size
+            of the difference frames is recorded into it.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+        df0_counts (Optional[pl.DataFrame]): Precomputed hash counts of the first subset (*see* :func:`_get_hash_counts`).
+        df1_counts (Optional[pl.DataFrame]): Precomputed hash counts of the second subset.
 
-        if duplicates_df0_count != duplicates_df1_count:
-            if duplicates_df0_count > duplicates_df1_count:
-                diff: RowDifference = RowDifference(
-                    source=df0_name,
-                    row=df0_subset.filter(pl.col("hash") == same_hash)
-                    .select(sorted(df0_subset.columns))
-                    .drop(["hash", "source"])
-                    .sort("*")
-                    .head(duplicates_df0_count - duplicates_df1_count)
-                    .to_dict(as_series=False),
-                    number_of_occurrences=duplicates_df0_count - duplicates_df1_count,
-                    difference_type=RowDifferenceType.MISSING_ROW,
-                )
-                row_differences.append(diff)
-                continue
+    Raises:
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Returns:
+        list[:class:`data_compare.src.models.RowDifference`]: The row differences.
+    """
+    if df0_counts is None:
+        df0_counts = _get_hash_counts(df0_subset)
+    if df1_counts is None:
+        df1_counts = _get_hash_counts(df1_subset)
+
+    hash_differences: pl.DataFrame = (
+        df0_counts.join(df1_counts, on="hash", how="full", coalesce=True, suffix="_1")
+        .fill_null(0)
+        .filter(pl.col("count") != pl.col("count_1"))
+    )
+    # hashes missing in one of the dataframes
+    missing_df0: dict[int, int] = dict(
+        hash_differences.filter(pl.col("count_1") == 0).select("hash", "count").rows()
+    )
+    missing_df1: dict[int, int] = dict(
+        hash_differences.filter(pl.col("count") == 0).select("hash", "count_1").rows()
+    )
+    # hashes present in both dataframes but not the same number of times
+    duplicates: dict[int, int] = dict(
+        hash_differences.filter((pl.col("count") > 0) & (pl.col("count_1") > 0))
+        .select("hash", pl.col("count") - pl.col("count_1"))
+        .rows()
+    )
+
+    df0_differences: dict[int, pl.DataFrame] = _get_rows_by_hash(
+        df0_subset,
+        list(missing_df0.keys()) + [h for h, d in duplicates.items() if d > 0],
+    )
+    df1_differences: dict[int, pl.DataFrame] = _get_rows_by_hash(
+        df1_subset,
+        list(missing_df1.keys()) + [h for h, d in duplicates.items() if d < 0],
+    )
+    for frame in df0_differences.values():
+        record_frame_size(stage_memory, "df0_differences", frame)
+    for frame in df1_differences.values():
+        record_frame_size(stage_memory, "df1_differences", frame)
+
+    stages: list[tuple[str, dict[int, int]]] = [
+        ("row_differences_df0", missing_df0),
+        ("row_differences_df1", {h: -count for h, count in missing_df1.items()}),
+        ("duplicates", duplicates),
+    ]
+    row_differences: list[RowDifference] = []
+    for stage, hashes in stages:
+        for difference_hash in track_progress(
+            hashes, stage, progress_callback, cancellation_token
+        ):
+            # positive difference means that the rows are extra in the first dataframe
+            difference: int = hashes[difference_hash]
+            source, difference_rows = (
+                (df0_name, df0_differences[difference_hash])
+                if difference > 0
+                else (df1_name, df1_differences[difference_hash])
+            )
 
             diff: RowDifference = RowDifference(
-                source=df1_name,
-                row=df1_subset.filter(pl.col("hash") == same_hash)
-                .select(sorted(df1_subset.columns))
+                source=source,
+                row=difference_rows.select(pl.col(sorted(difference_rows.columns)))
                 .drop(["hash", "source"])
                 .sort("*")
-                .head(duplicates_df1_count - duplicates_df0_count)
+                .head(abs(difference))
                 .to_dict(as_series=False),
-                number_of_occurrences=duplicates_df1_count - duplicates_df0_count,
+                number_of_occurrences=abs(difference),
                 difference_type=RowDifferenceType.MISSING_ROW,
             )
             row_differences.append(diff)
 
-    return same_columns, column_differences, row_differences
+    return row_differences
+
+
+def _get_rows_by_hash(
+    df_subset: pl.DataFrame, hashes: list[int]
+) -> dict[int, pl.DataFrame]:
+    """
+    Get the rows of a hashed subset that have one of the hashes, split by the hash.
+
+    Args:
+        df_subset (pl.DataFrame): The hashed subset.
+        hashes (list[int]): The hashes to select.
+
+    Returns:
+        dict[int, pl.DataFrame]: The rows by hash.
+    """
+    if len(hashes) == 0:
+        return {}
+    selected_rows: pl.DataFrame = df_subset.join(
+        pl.DataFrame({"hash": pl.Series(hashes, dtype=df_subset["hash"].dtype)}),
+        on="hash",
+        how="semi",
+    )
+    return {
+        key[0]: rows
+        for key, rows in selected_rows.partition_by("hash", as_dict=True).items()
+    }
 
 
 def compare_group_column_by_column(
-    data: pl.DataFrame, grouping_columns: list[str]
+    data: pl.DataFrame,
+    grouping_columns: list[str],
+    different_columns: Optional[list[str]] = None,
 ) -> list[Union[RowDifference, RowGroupDifference]]:
     """
     Compares the rows of a dataframe (**already**) grouped by the grouping columns.
@@ -465,12 +535,18 @@ def compare_group_column_by_column(
         row_with_source={'a': [3, 3], 'b': [3, 10], 'source': ['df0', 'df1']})]
         ```
 
+    The different columns are found with one vectorized pass over all columns
+    (*or taken from `different_columns` when they were already computed for all groups at once,
+    see* :func:`get_different_columns_by_group`).
+
     Raises:
         ValueError: If the dataframe is not grouped by the grouping columns.
 
     Args:
         data (pl.DataFrame): The dataframe to compare.
         grouping_columns (list[str]): The columns to group by.
+        different_columns (Optional[list[str]]): The columns with different values in the group,
+            computed if `None`.
 
     Returns:
         list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The differences between the rows of the different sources.
@@ -481,35 +557,33 @@ def compare_group_column_by_column(
         raise ValueError("The dataframe must be grouped by the grouping columns.")
 
     sources: list[str] = list(data["source"].unique())
+    # one projection expression, so the columns of a wide dataframe are not parsed one by one
+    data = data.select(pl.col(sorted(data.columns)))
 
     if len(sources) == 1:
         row_difference_information: RowDifference = RowDifference(
             source=sources[0],
-            row=data.select(sorted(data.columns))
-            .drop(["source"])
-            .sort("*")
-            .to_dict(as_series=False),
+            row=data.drop(["source"]).sort("*").to_dict(as_series=False),
             number_of_occurrences=len(data),
             difference_type=RowDifferenceType.MISSING_ROW,
         )
         return row_difference_information
 
-    different_columns: list[str] = []
-    to_check_columns: set[str] = (
-        set(data.columns) - set(grouping_columns) - {"hash", "source"}
-    )
-    for col in to_check_columns:
-        if len(data[col].unique()) == 1:
-            continue
-
-        different_columns.append(col)
+    if different_columns is None:
+        excluded_columns: set[str] = set(grouping_columns) | {"hash", "source"}
+        to_check_columns: list[str] = [
+            col for col in data.columns if col not in excluded_columns
+        ]
+        unique_counts: dict[str, list[int]] = data.select(
+            pl.col(to_check_columns).n_unique()
+        ).to_dict(as_series=False)
+        different_columns = [
+            col for col, count in unique_counts.items() if count[0] > 1
+        ]
 
     row_grouping_difference: RowGroupDifference = RowGroupDifference(
         sources=sorted(sources),
-        row=data.select(sorted(data.columns))
-        .drop(["source"])
-        .sort("*")
-        .to_dict(as_series=False),
+        row=data.drop(["source"]).sort("*").to_dict(as_series=False),
         number_of_occurrences=len(data),
         grouping_columns=sorted(grouping_columns),
         column_differences=sorted(different_columns),
@@ -518,13 +592,67 @@ def compare_group_column_by_column(
         )
         .sort("*")
         .to_dict(as_series=False),
-        row_with_source=data.select(sorted(data.columns))
-        .sort("*")
-        .to_dict(as_series=False),
+        row_with_source=data.sort("*").to_dict(as_series=False),
     )
     return row_grouping_difference
 
 
+def _get_different_columns_by_group(
+    data: pl.DataFrame,
+    grouping_columns: list[str],
+    column_block_size: int = COLUMN_BLOCK_SIZE,
+) -> tuple[pl.DataFrame, list[list[str]]]:
+    """
+    Find the columns with different values of every group at once, so wide dataframes are not
+    compared column by column and group by group in Python.
+
+    The distinct counts per group are aggregated for blocks of `column_block_size` columns, the changed
+    ones are kept in a long (*group, column*) frame, so the cost grows linearly with the number of columns.
+
+    Args:
+        data (pl.DataFrame): The rows to compare, with the `source` column.
+        grouping_columns (list[str]): The columns to group by.
+        column_block_size (int): The number of columns aggregated in one pass.
+
+    Returns:
+        pl.DataFrame: The rows with the `__group` index of their group.
+
+        list[list[str]]: The sorted different columns by group index.
+    """
+    keys: pl.DataFrame = (
+        data.select(grouping_columns)
+        .unique(maintain_order=True)
+        .with_row_index("__group")
+    )
+    data = data.join(keys, on=grouping_columns, nulls_equal=True, maintain_order="left")
+    excluded_columns: set[str] = set(grouping_columns) | {"hash", "source", "__group"}
+    to_check_columns: list[str] = [
+        col for col in data.columns if col not in excluded_columns
+    ]
+
+    different_columns: list[list[str]] = [[] for _ in range(len(keys))]
+    if len(to_check_columns) == 0:
+        return data, different_columns
+    changed: pl.DataFrame = pl.concat(
+        [
+            data.group_by("__group")
+            .agg(pl.col(block).n_unique() > 1)
+            .unpivot(index="__group", variable_name="column", value_name="different")
+            .filter(pl.col("different"))
+            .select("__group", "column")
+            for block in [
+                to_check_columns[start : start + column_block_size]
+                for start in range(0, len(to_check_columns), column_block_size)
+            ]
+        ]
+    )
+    for group, columns in (
+        changed.group_by("__group").agg(pl.col("column").sort()).iter_rows()
+    ):
+        different_columns[group] = columns
+    return data, different_columns
+
+
 @convert_to_polars
 @check_inputs
 def get_row_differences_paired(
@@ -533,6 +661,12 @@ def get_row_differences_paired(
     df0_name: str,
     df_1_name: str,
     grouping_columns: list[str],
+    memory_profile: Optional[MemoryProfile] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+    hash_cache: Optional[HashCache] = None,
+    concurrent_sides: bool = False,
+    unique_key: Optional[bool] = None,
 ) -> tuple[
     list[str], list[ColumnDifference], list[Union[RowDifference, RowGroupDifference]]
 ]:
@@ -543,6 +677,10 @@ def get_row_differences_paired(
     with this function you can find the columns in which they differ, but also have a functionality that
     tells you that there are some missing rows in one of the dataframes.
 
+    Rows whose grouping columns are unique in both dataframes (*a primary key*) are paired with one join
+    and compared column by column, only the groups of duplicated keys are hashed and compared group by group.
+    Both paths return the same differences.
+
     Example:
         ```python
         import polars as pl
@@ -569,6 +707,7 @@ def get_row_differences_paired(
 
     Raises:
         ValueError: If the pairing columns are not the present in both dataframes.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
 
     Args:
         df0 (pl.DataFrame): The first dataframe.
@@ -576,6 +715,64 @@ def get_row_differences_paired(
         df0_name (str): The name of the first dataframe.
         df_1_name (str): The name of the second dataframe.
         grouping_columns (list[str]): The columns to group by.
+        memory_profile (Optional[:class:`data_compare.src.models.MemoryProfile`]): If given, the memory usage of
+            the comparison stages (*see* :func:`get_row_differences`) and of the `pairing` stage is recorded into it.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the stage name, number of processed items and total number of items (*hashes or groups*).
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            between processed items and the comparison is aborted when it is cancelled.
+        hash_cache (Optional[:class:`data_compare.src.cache.HashCache`]): If given, the row hashes are taken
+            from the cache instead of hashing the same dataframes again.
+        concurrent_sides (bool): Hash both dataframes concurrently on two threads.
+        unique_key (Optional[bool]): `True` declares the grouping columns unique in both dataframes
+            (*the check is skipped*), `None` detects the duplicated keys and `False` compares all the rows
+            group by group. With a `hash_cache`, `None` compares all the rows group by group,
+            so the cached hashes are used.
+
+    Returns:
+        list[str]: The same columns
+
+        list[:class:`data_compare.src.models.ColumnDifference`]: The column differences
+
+        list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences
+    """
+    same_columns, column_differences, row_differences, _ = _get_row_differences_by_key(
+        df0,
+        df1,
+        df0_name,
+        df_1_name,
+        grouping_columns,
+        memory_profile=memory_profile,
+        progress_callback=progress_callback,
+        cancellation_token=cancellation_token,
+        hash_cache=hash_cache,
+        concurrent_sides=concurrent_sides,
+        unique_key=unique_key,
+    )
+    return same_columns, column_differences, row_differences
+
+
+def _get_row_differences_grouped(
+    df0: pl.DataFrame,
+    df1: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: list[str],
+    memory_profile: Optional[MemoryProfile] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+    hash_cache: Optional[HashCache] = None,
+    concurrent_sides: bool = False,
+) -> tuple[
+    list[str], list[ColumnDifference], list[Union[RowDifference, RowGroupDifference]]
+]:
+    """
+    Compare the rows of two dataframes by hashing them and pairing the differing rows group by group
+    (*the path for groups that can contain many rows*).
+
+    Raises:
+        ValueError: If the pairing columns are not the present in both dataframes.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
 
     Returns:
         list[str]: The same columns
@@ -585,38 +782,440 @@ def get_row_differences_paired(
         list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences
     """
     same_columns, column_differences, row_differences = get_row_differences(
-        df0, df1, df0_name, df_1_name
+        df0,
+        df1,
+        df0_name,
+        df1_name,
+        memory_profile=memory_profile,
+        progress_callback=progress_callback,
+        cancellation_token=cancellation_token,
+        hash_cache=hash_cache,
+        concurrent_sides=concurrent_sides,
+    )
+
+    if len(set(grouping_columns).difference(same_columns)) > 0:
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+
+    with track_stage(memory_profile, "pairing") as stage_memory:
+        row_differences = _pair_row_differences(
+            row_differences,
+            grouping_columns,
+            stage_memory,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    return same_columns, column_differences, row_differences
+
+
+def _split_duplicated_keys(
+    df0: pl.DataFrame, df1: pl.DataFrame, grouping_columns: list[str]
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    Split both dataframes into the rows whose key (*the grouping columns*) is unique in both dataframes
+    and the rows whose key is duplicated in at least one of them.
+
+    Args:
+        df0 (pl.DataFrame): The first dataframe.
+        df1 (pl.DataFrame): The second dataframe.
+        grouping_columns (list[str]): The key columns.
+
+    Returns:
+        pl.DataFrame: The rows of the first dataframe with unique keys.
+
+        pl.DataFrame: The rows of the second dataframe with unique keys.
+
+        pl.DataFrame: The rows of the first dataframe with duplicated keys.
+
+        pl.DataFrame: The rows of the second dataframe with duplicated keys.
+    """
+    duplicated_keys: pl.DataFrame = pl.concat(
+        [
+            df.filter(pl.struct(grouping_columns).is_duplicated()).select(
+                grouping_columns
+            )
+            for df in [df0, df1]
+        ]
+    ).unique()
+    if len(duplicated_keys) == 0:
+        return df0, df1, df0.clear(), df1.clear()
+    return (
+        df0.join(duplicated_keys, on=grouping_columns, how="anti", nulls_equal=True),
+        df1.join(duplicated_keys, on=grouping_columns, how="anti", nulls_equal=True),
+        df0.join(duplicated_keys, on=grouping_columns, how="semi", nulls_equal=True),
+        df1.join(duplicated_keys, on=grouping_columns, how="semi", nulls_equal=True),
     )
 
+
+def _join_unique_keys(
+    df0: pl.DataFrame,
+    df1: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: list[str],
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    Pair the rows of two dataframes whose grouping columns are unique in both of them with one join
+    on the grouping columns and compare the paired rows column by column.
+
+    Args:
+        df0 (pl.DataFrame): The first dataframe (*only the comparable columns*).
+        df1 (pl.DataFrame): The second dataframe (*only the comparable columns*).
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        grouping_columns (list[str]): The key columns.
+
+    Returns:
+        pl.DataFrame: The rows present in only one dataframe, with the `source` column.
+
+        pl.DataFrame: The paired rows with different values, both rows of a pair (*with the `source` column*)
+        share the `__pair` index.
+
+        pl.DataFrame: Per pair (*in the order of the `__pair` index*), if the value columns are different.
+    """
+    columns: list[str] = sorted(df0.columns)
+    value_columns: list[str] = [
+        column for column in columns if column not in grouping_columns
+    ]
+    # the value columns are renamed by position, so they can not collide with the key columns
+    left: dict[str, str] = {
+        column: f"__left_{index}" for index, column in enumerate(value_columns)
+    }
+    right: dict[str, str] = {
+        column: f"__right_{index}" for index, column in enumerate(value_columns)
+    }
+    joined: pl.DataFrame = (
+        df0.rename(left)
+        .with_columns(pl.lit(True).alias("__in_left"))
+        .join(
+            df1.rename(right).with_columns(pl.lit(True).alias("__in_right")),
+            on=grouping_columns,
+            how="full",
+            coalesce=True,
+            nulls_equal=True,
+        )
+        .with_columns(
+            [
+                pl.col(left[column]).ne_missing(pl.col(right[column])).alias(column)
+                for column in value_columns
+            ]
+        )
+    )
+
+    missing: pl.DataFrame = pl.concat(
+        [
+            joined.filter(pl.col(marker).is_null()).select(
+                *[
+                    pl.col(names.get(column, column)).alias(column)
+                    for column in columns
+                ],
+                pl.lit(source).alias("source"),
+            )
+            for source, marker, names in [
+                (df0_name, "__in_right", left),
+                (df1_name, "__in_left", right),
+            ]
+        ]
+    )
+    paired: pl.DataFrame = joined.filter(
+        pl.col("__in_left").is_not_null()
+        & pl.col("__in_right").is_not_null()
+        & (pl.any_horizontal(value_columns) if len(value_columns) > 0 else False)
+    ).with_row_index("__pair")
+    stacked: pl.DataFrame = pl.concat(
+        [
+            paired.select(
+                "__pair",
+                *[
+                    pl.col(names.get(column, column)).alias(column)
+                    for column in columns
+                ],
+                pl.lit(source).alias("source"),
+            )
+            for source, names in [(df0_name, left), (df1_name, right)]
+        ]
+    )
+    return missing, stacked, paired.select(value_columns)
+
+
+def _get_unique_key_row_differences(
+    df0: pl.DataFrame,
+    df1: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: list[str],
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> list[Union[RowDifference, RowGroupDifference]]:
+    """
+    Compare two dataframes whose grouping columns are unique in both of them: the rows are paired
+    with one join on the grouping columns and compared column by column (*see* :func:`_join_unique_keys`).
+
+    The differences are the same as the differences of :func:`compare_group_column_by_column`
+    (*a missing row is a :class:`data_compare.src.models.RowDifference`, a pair of rows with different values is
+    a :class:`data_compare.src.models.RowGroupDifference`*).
+
+    Args:
+        df0 (pl.DataFrame): The first dataframe (*only the comparable columns*).
+        df1 (pl.DataFrame): The second dataframe (*only the comparable columns*).
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        grouping_columns (list[str]): The key columns.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences
+    """
+    columns: list[str] = sorted(df0.columns)
+    missing, stacked, changed = _join_unique_keys(
+        df0, df1, df0_name, df1_name, grouping_columns
+    )
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = [
+        RowDifference(
+            source=row["source"],
+            row={column: [row[column]] for column in columns},
+            number_of_occurrences=1,
+            difference_type=RowDifferenceType.MISSING_ROW,
+        )
+        for row in missing.iter_rows(named=True)
+    ]
+    if len(changed) == 0:
+        return row_differences
+
+    value_columns: list[str] = changed.columns
+    different_columns: list[list[str]] = [
+        [column for column in value_columns if differences[column]]
+        for differences in changed.iter_rows(named=True)
+    ]
+    row: dict[str, list] = stacked.sort(["__pair"] + columns).to_dict(as_series=False)
+    row_with_source: dict[str, list] = stacked.sort(
+        ["__pair"] + sorted(columns + ["source"])
+    ).to_dict(as_series=False)
+    # the pairs are grouped by their pattern of changed columns in one pass
+    pattern_indexes: dict[tuple[str, ...], int] = {}
+    pair_patterns: list[int] = [
+        pattern_indexes.setdefault(tuple(columns_of_pair), len(pattern_indexes))
+        for columns_of_pair in different_columns
+    ]
+    stacked_by_pattern: dict[tuple, pl.DataFrame] = stacked.with_columns(
+        pl.Series(pair_patterns, dtype=pl.UInt32)
+        .gather(stacked["__pair"])
+        .alias("__pattern")
+    ).partition_by("__pattern", as_dict=True, include_key=False)
+    consise_information: dict[int, dict[str, list]] = {}
+    for pattern, pattern_index in pattern_indexes.items():
+        consise_columns: list[str] = sorted(
+            grouping_columns + list(pattern) + ["source"]
+        )
+        pattern_rows: dict[str, list] = (
+            stacked_by_pattern[(pattern_index,)]
+            .sort(["__pair"] + consise_columns)
+            .to_dict(as_series=False)
+        )
+        for position in range(0, len(pattern_rows["__pair"]), 2):
+            consise_information[pattern_rows["__pair"][position]] = {
+                column: pattern_rows[column][position : position + 2]
+                for column in consise_columns
+            }
+
+    for index in track_progress(
+        range(len(changed)), "pairing", progress_callback, cancellation_token
+    ):
+        position: int = 2 * index
+        row_differences.append(
+            RowGroupDifference(
+                sources=sorted([df0_name, df1_name]),
+                row={
+                    column: row[column][position : position + 2] for column in columns
+                },
+                number_of_occurrences=2,
+                grouping_columns=sorted(grouping_columns),
+                column_differences=different_columns[index],
+                consise_information=consise_information[index],
+                row_with_source={
+                    column: row_with_source[column][position : position + 2]
+                    for column in sorted(columns + ["source"])
+                },
+            )
+        )
+    return row_differences
+
+
+def _get_row_differences_by_key(
+    df0: pl.DataFrame,
+    df1: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: list[str],
+    memory_profile: Optional[MemoryProfile] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+    hash_cache: Optional[HashCache] = None,
+    concurrent_sides: bool = False,
+    unique_key: Optional[bool] = None,
+) -> tuple[
+    list[str],
+    list[ColumnDifference],
+    list[Union[RowDifference, RowGroupDifference]],
+    Optional[dict[str, list]],
+]:
+    """
+    Compare the rows of two dataframes paired by the grouping columns (*see* :func:`get_row_differences_paired`),
+    with the 1:1 join for the unique keys and the grouped path for the duplicated keys.
+
+    Returns:
+        list[str]: The same columns
+
+        list[:class:`data_compare.src.models.ColumnDifference`]: The column differences
+
+        list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences
+
+        Optional[dict[str, list]]: The keys of the differences found in the duplicated-key groups,
+        `None` if there are none.
+    """
+    if unique_key is False or (unique_key is None and hash_cache is not None):
+        return (
+            *_get_row_differences_grouped(
+                df0,
+                df1,
+                df0_name,
+                df1_name,
+                grouping_columns,
+                memory_profile=memory_profile,
+                progress_callback=progress_callback,
+                cancellation_token=cancellation_token,
+                hash_cache=hash_cache,
+                concurrent_sides=concurrent_sides,
+            ),
+            None,
+        )
+
+    same_columns, column_differences = get_column_dtype_differences(
+        df0, df1, df0_name, df1_name
+    )
     if len(set(grouping_columns).difference(same_columns)) > 0:
         raise ValueError(
             "Pairing columns must be the same in both dataframes. "
             f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
         )
 
+    with track_stage(memory_profile, "pairing"):
+        df0_unique, df1_unique, df0_duplicated, df1_duplicated = (
+            (df0.select(same_columns), df1.select(same_columns), None, None)
+            if unique_key
+            else _split_duplicated_keys(
+                df0.select(same_columns), df1.select(same_columns), grouping_columns
+            )
+        )
+        row_differences: list[Union[RowDifference, RowGroupDifference]] = (
+            _get_unique_key_row_differences(
+                df0_unique,
+                df1_unique,
+                df0_name,
+                df1_name,
+                grouping_columns,
+                progress_callback=progress_callback,
+                cancellation_token=cancellation_token,
+            )
+        )
+
+    duplicated_keys: Optional[dict[str, list]] = None
+    if df0_duplicated is not None and len(df0_duplicated) + len(df1_duplicated) > 0:
+        _, _, duplicated_differences = _get_row_differences_grouped(
+            df0_duplicated,
+            df1_duplicated,
+            df0_name,
+            df1_name,
+            grouping_columns,
+            memory_profile=memory_profile,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+            concurrent_sides=concurrent_sides,
+        )
+        if len(duplicated_differences) > 0:
+            duplicated_keys = {
+                column: [
+                    difference.row[column][0] for difference in duplicated_differences
+                ]
+                for column in sorted(grouping_columns)
+            }
+        row_differences.extend(duplicated_differences)
+    return same_columns, column_differences, row_differences, duplicated_keys
+
+
+def _pair_row_differences(
+    row_differences: list[RowDifference],
+    grouping_columns: list[str],
+    stage_memory: Optional[StageMemory] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> list[Union[RowDifference, RowGroupDifference]]:
+    """
+    Pair the row differences by the grouping columns (*see* :func:`get_row_differences_paired`).
+
+    Args:
+        row_differences (list[:class:`data_compare.src.models.RowDifference`]): The unpaired row differences.
+        grouping_columns (list[str]): The columns to group by.
+        stage_memory (Optional[:class:`data_compare.src.models.StageMemory`]): If given, the estimated size
+            of the difference frame is recorded into it.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Raises:
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Returns:
+        list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences
+    """
     difference_dataframe: pl.DataFrame = convert_row_differences_to_pandas(
         row_differences
     )
+    record_frame_size(stage_memory, "difference_dataframe", difference_dataframe)
     if len(difference_dataframe) == 0:
-        return same_columns, column_differences, row_differences
+        return row_differences
 
-    row_differences: list[Union[RowDifference, RowGroupDifference]] = []
-    for name, dat in difference_dataframe.group_by(grouping_columns):
+    difference_dataframe, different_columns = _get_different_columns_by_group(
+        difference_dataframe, grouping_columns
+    )
+    groups: list[tuple[tuple, pl.DataFrame]] = list(
+        difference_dataframe.group_by("__group")
+    )
+    paired_row_differences: list[Union[RowDifference, RowGroupDifference]] = []
+    for (group,), dat in track_progress(
+        groups, "pairing", progress_callback, cancellation_token
+    ):
         difference: Union[RowDifference, RowGroupDifference] = (
-            compare_group_column_by_column(dat, grouping_columns)
+            compare_group_column_by_column(
+                dat.drop("__group"), grouping_columns, different_columns[group]
+            )
         )
-        row_differences.append(difference)
-    return same_columns, column_differences, row_differences
+        paired_row_differences.append(difference)
+    return paired_row_differences
 
 
 @convert_to_polars
 @check_inputs
 def get_data_report(
-    df0: pl.DataFrame,
-    df1: pl.DataFrame,
+    df0: Union[pl.DataFrame, pl.LazyFrame],
+    df1: Union[pl.DataFrame, pl.LazyFrame],
     df0_name: str,
     df1_name: str,
     grouping_columns: Optional[list[str]] = None,
+    memory_profile: Optional[MemoryProfile] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+    presorted: Optional[bool] = False,
+    hash_cache: Optional[HashCache] = None,
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    concurrent_sides: bool = False,
+    memory_limit: Optional[int] = None,
+    unique_key: Optional[bool] = None,
+    large_value_threshold: Optional[int] = None,
 ) -> DataReport:
     """
     Get a data report comparing two dataframes.
@@ -749,28 +1348,240 @@ def get_data_report(
         }
         ```
 
+    Memory usage can be recorded per comparison stage by passing a :class:`data_compare.src.models.MemoryProfile`:
+
+    ```python
+    from data_fingerprint.src.models import MemoryProfile
+
+    profile = MemoryProfile()
+    report = get_data_report(df0, df1, "df0", "df1", ["a"], memory_profile=profile)
+    print(profile.model_dump_json(indent=4))
+    ```
+
+    Long comparisons can report their progress and be cancelled from another thread:
+
+    ```python
+    from data_fingerprint.src.progress import CancellationToken
+
+    token = CancellationToken()
+    report = get_data_report(
+        df0,
+        df1,
+        "df0",
+        "df1",
+        progress_callback=lambda stage, processed, total: print(stage, processed, total),
+        cancellation_token=token,
+    )
+    ```
+
+    Dataframes that are already sorted by the grouping columns can be compared with the sort-merge engine
+    (:func:`data_compare.src.sort_merge.get_row_differences_sorted`) by declaring them as `presorted=True`
+    or by letting the function detect it with `presorted=None`. The detection is not done by default
+    (*`presorted=False`*), as it reads the grouping columns of both dataframes. Lazy frames declared as presorted
+    are streamed into the sort-merge engine chunk by chunk, so they are never loaded as a whole.
+
+    Only a subset of the columns can be compared with `include_columns` and `exclude_columns`
+    (*for example audit timestamps that are meant to differ*). For lazy frames (*like `pl.scan_parquet`*)
+    the projection is pushed into the scan, so the excluded columns are never read or hashed:
+
+    ```python
+    report = get_data_report(
+        pl.scan_parquet("data/orders.parquet"),
+        pl.scan_parquet("backup/orders.parquet"),
+        "data",
+        "backup",
+        exclude_columns=["updated_at"],
+    )
+    ```
+
+    Only a slice of the dataframes can be compared with `row_filter` (*one expression for both dataframes
+    or a tuple with one expression per dataframe*), for lazy frames it is pushed into the scan before hashing:
+
+    ```python
+    report = get_data_report(
+        pl.scan_parquet("data/orders/*.parquet"),
+        pl.scan_parquet("backup/orders/*.parquet"),
+        "data",
+        "backup",
+        row_filter=pl.col("region") == "EU",
+    )
+    ```
+
     Args:
-        df0 (pl.DataFrame): The first dataframe.
-        df1 (pl.DataFrame): The second dataframe.
+        df0 (Union[pl.DataFrame, pl.LazyFrame]): The first dataframe.
+        df1 (Union[pl.DataFrame, pl.LazyFrame]): The second dataframe.
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        memory_profile (Optional[:class:`data_compare.src.models.MemoryProfile`]): If given, the estimated frame sizes
+            and process RSS deltas of each comparison stage are recorded into it.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the stage name, number of processed items and total number of items of each comparison stage.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            between processed items and the comparison is aborted when it is cancelled.
+        presorted (Optional[bool]): `True` if both dataframes are sorted by the grouping columns,
+            `None` to detect it after loading them, `False` (*the default*) to skip the detection.
+            Sorted dataframes are compared with the sort-merge engine.
+        hash_cache (Optional[:class:`data_compare.src.cache.HashCache`]): If given, the row hashes are taken
+            from the cache, so repeated comparisons of unchanged dataframes skip hashing.
+        include_columns (Optional[list[str]]): The columns to compare, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns that are not compared.
+        row_filter (Optional[:data:`data_compare.src.scan.RowFilter`]): The filter of the compared rows,
+            the lengths in the report are the lengths of the filtered dataframes.
+        concurrent_sides (bool): Load (*lazy frames*) and hash both dataframes concurrently on two threads.
+            Polars releases the GIL, so the I/O of one side overlaps with the compute of the other.
+        memory_limit (Optional[int]): The memory limit in bytes. When the estimated memory of the comparison
+            exceeds it, the dataframes are compared partition by partition spilled to disk
+            (*see* :func:`data_compare.src.spill.get_data_report_spilled`). It can not be combined
+            with `presorted`, `hash_cache` and `concurrent_sides`.
+        unique_key (Optional[bool]): `True` declares the grouping columns unique in both dataframes,
+            `None` detects the duplicated keys and `False` compares all the rows group by group
+            (*see* :func:`get_row_differences_paired`). The keys of the differences found in the duplicated-key
+            groups are reported in `duplicate_keys`.
+        large_value_threshold (Optional[int]): If given, the string and binary values (*except the grouping columns*)
+            longer than this number of bytes are replaced by a digest and their length after loading
+            (*see* :func:`data_compare.src.digest.digest_large_values`), so the rows are compared by the digests
+            and the report does not copy the payloads. The payloads can be fetched back from the sources
+            with :func:`data_compare.src.digest.fetch_large_value`.
+
+    Raises:
+        ValueError: If `presorted` is `True` without grouping columns, the row filter is not valid
+            or `memory_limit` is combined with `presorted`, `hash_cache` or `concurrent_sides`.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
 
     Returns:
         :class:`data_compare.src.models.DataReport`: A data report comparing the two dataframes.
     """
-    if grouping_columns is None:
+    from data_fingerprint.src.sort_merge import (
+        get_row_differences_sorted,
+        is_sorted_by,
+    )
+    from data_fingerprint.src.spill import (
+        estimate_comparison_memory,
+        get_data_report_spilled,
+    )
+
+    if memory_limit is not None and (
+        presorted is not False or hash_cache is not None or concurrent_sides
+    ):
+        raise ValueError(
+            "Memory limit can not be combined with presorted, hash_cache or concurrent_sides."
+        )
+    if (
+        memory_limit is not None
+        and estimate_comparison_memory(
+            df0,
+            df1,
+            include_columns=include_columns,
+            exclude_columns=exclude_columns,
+            row_filter=row_filter,
+        )
+        > memory_limit
+    ):
+        return get_data_report_spilled(
+            df0,
+            df1,
+            df0_name,
+            df1_name,
+            grouping_columns,
+            memory_limit=memory_limit,
+            include_columns=include_columns,
+            exclude_columns=exclude_columns,
+            row_filter=row_filter,
+            large_value_threshold=large_value_threshold,
+            unique_key=unique_key,
+            memory_profile=memory_profile,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+
+    if presorted and grouping_columns is None:
+        raise ValueError("Presorted dataframes must be compared with grouping columns.")
+
+    df0_filter, df1_filter = get_side_filters(row_filter)
+    if presorted:
+        # the sort-merge engine streams the sources, so they are not loaded here
+        df0, df1 = [
+            scan_projected(df, include_columns, exclude_columns, side_filter)
+            for df, side_filter in [(df0, df0_filter), (df1, df1_filter)]
+        ]
+    else:
+        df0, df1 = _run_sides(
+            lambda: collect_source(df0, include_columns, exclude_columns, df0_filter),
+            lambda: collect_source(df1, include_columns, exclude_columns, df1_filter),
+            concurrent_sides,
+        )
+    if large_value_threshold is not None:
+        df0, df1 = [
+            digest_large_values(df, large_value_threshold, grouping_columns)
+            for df in [df0, df1]
+        ]
+
+    if presorted is None and grouping_columns is not None:
+        presorted = all(
+            set(grouping_columns).issubset(df.columns)
+            and is_sorted_by(df, grouping_columns)
+            for df in [df0, df1]
+        )
+
+    duplicate_keys: Optional[dict[str, list]] = None
+    if presorted:
+        with track_stage(memory_profile, "sort_merge"):
+            same_columns, column_differences, row_differences = (
+                get_row_differences_sorted(
+                    df0,
+                    df1,
+                    df0_name,
+                    df1_name,
+                    grouping_columns,
+                    progress_callback=progress_callback,
+                    cancellation_token=cancellation_token,
+                )
+            )
+    elif grouping_columns is None:
         same_columns, column_differences, row_differences = get_row_differences(
-            df0, df1, df0_name, df1_name
+            df0,
+            df1,
+            df0_name,
+            df1_name,
+            memory_profile=memory_profile,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+            hash_cache=hash_cache,
+            concurrent_sides=concurrent_sides,
         )
     else:
-        same_columns, column_differences, row_differences = get_row_differences_paired(
-            df0, df1, df0_name, df1_name, grouping_columns
+        same_columns, column_differences, row_differences, duplicate_keys = (
+            _get_row_differences_by_key(
+                df0,
+                df1,
+                df0_name,
+                df1_name,
+                grouping_columns,
+                memory_profile=memory_profile,
+                progress_callback=progress_callback,
+                cancellation_token=cancellation_token,
+                hash_cache=hash_cache,
+                concurrent_sides=concurrent_sides,
+                unique_key=unique_key,
+            )
+        )
+    df0_length, df1_length = [
+        (
+            df.select(pl.len()).collect().item()
+            if isinstance(df, pl.LazyFrame)
+            else len(df)
         )
+        for df in [df0, df1]
+    ]
     return DataReport(
-        df0_length=len(df0),
-        df1_length=len(df1),
+        df0_length=df0_length,
+        df1_length=df1_length,
         df1=df1,
         df0_name=df0_name,
         df1_name=df1_name,
         comparable_columns=same_columns,
         row_differences=row_differences,
         column_differences=column_differences,
+        duplicate_keys=duplicate_keys,
     )
@@ -0,0 +1,545 @@
+import hashlib
+import sqlite3
+import uuid
+from typing import Any, Callable, Iterator, Optional, Union
+
+import numpy as np
+import polars as pl
+
+from data_fingerprint.src.comparator import (
+    _get_hashed_row_differences,
+    _pair_row_differences,
+    get_data_report,
+)
+from data_fingerprint.src.models import (
+    DataReport,
+    RowDifference,
+    RowGroupDifference,
+)
+from data_fingerprint.src.schema import get_schema_differences
+
+HASH_FUNCTION_NAME: str = "data_fingerprint_hash"
+"""The name of the SQL function computing :func:`portable_hash` (*see* :func:`register_sqlite_hash_function`)."""
+
+_NULL_TOKEN: str = "\x00"
+_SEPARATOR: str = "\x1f"
+
+
+def _to_text(value: Any) -> str:
+    if value is None:
+        return _NULL_TOKEN
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+_PYTHON_DTYPES: dict[type, pl.DataType] = {
+    bool: pl.Boolean(),
+    int: pl.Int64(),
+    float: pl.Float64(),
+    str: pl.String(),
+    bytes: pl.Binary(),
+}
+
+
+def _get_declared_dtype(declared_type: str) -> Optional[pl.DataType]:
+    """
+    Get the dtype of a declared SQL column type by the SQLite type affinity rules.
+
+    Args:
+        declared_type (str): The declared type (*for example `VARCHAR(10)`*).
+
+    Returns:
+        Optional[pl.DataType]: The dtype, `None` if the type has no affinity (*for example an expression*)
+        or a numeric affinity whose values can be integers or floats.
+    """
+    declared_type = declared_type.upper()
+    if "INT" in declared_type:
+        return pl.Int64()
+    if any(name in declared_type for name in ("CHAR", "CLOB", "TEXT")):
+        return pl.String()
+    if "BLOB" in declared_type:
+        return pl.Binary()
+    if any(name in declared_type for name in ("REAL", "FLOA", "DOUB")):
+        return pl.Float64()
+    return None
+
+
+def _get_text_column(series: pl.Series) -> pl.Series:
+    """
+    Convert a column to the text of :func:`portable_hash` (*see* :func:`_to_text`),
+    vectorized for the integer, string, boolean and binary columns.
+    """
+    if series.dtype.is_integer() or series.dtype == pl.String:
+        text: pl.Series = series.cast(pl.String)
+    elif series.dtype == pl.Boolean:
+        text = series.cast(pl.UInt8).cast(pl.String)
+    elif series.dtype == pl.Binary:
+        text = series.bin.encode("hex")
+    else:
+        return pl.Series(
+            series.name, [_to_text(value) for value in series], dtype=pl.String
+        )
+    return text.fill_null(_NULL_TOKEN)
+
+
+def _hash_text(text: str) -> int:
+    return int.from_bytes(hashlib.md5(text.encode()).digest()[:8], "big", signed=True)
+
+
+def _hash_texts(texts: pl.Series) -> pl.Series:
+    # the truncated digests of the whole batch are read at once as big-endian 64-bit integers
+    digests: bytes = b"".join(
+        hashlib.md5(text).digest()[:8] for text in texts.cast(pl.Binary)
+    )
+    return pl.Series(
+        texts.name, np.frombuffer(digests, dtype=">i8").astype(np.int64), pl.Int64
+    )
+
+
+def portable_hash(*values: Any) -> int:
+    """
+    Hash the values of a row in a way that can be reproduced outside of polars (*for example in SQL*).
+
+    The values are converted to text, joined and hashed with MD5, the first 8 bytes of the digest are
+    returned as a signed 64-bit integer (*so it fits into the integer type of every database*).
+
+    .. note::
+        The hashes of two sources are equal only if the values have the same Python types when they are read,
+        for example a `REAL` column must be compared with a float column.
+
+    Args:
+        *values (Any): The values of the row (*in the order of the sorted column names*).
+
+    Returns:
+        int: The hash.
+    """
+    return _hash_text(_SEPARATOR.join(_to_text(value) for value in values))
+
+
+def register_sqlite_hash_function(connection: sqlite3.Connection) -> None:
+    """
+    Register :func:`portable_hash` as the `data_fingerprint_hash` SQL function of a SQLite connection.
+
+    Args:
+        connection (sqlite3.Connection): The connection.
+
+    Returns:
+        None
+    """
+    connection.create_function(
+        HASH_FUNCTION_NAME, -1, portable_hash, deterministic=True
+    )
+
+
+class FrameSource:
+    """
+    A source adapter for a dataframe, hashing the rows with :func:`portable_hash`
+    so they can be compared with a :class:`SQLSource`.
+    """
+
+    def __init__(self, df: pl.DataFrame, chunk_size: int = 100_000) -> None:
+        """
+        Create the source.
+
+        Args:
+            df (pl.DataFrame): The dataframe.
+            chunk_size (int): The number of rows hashed at once.
+        """
+        self.df: pl.DataFrame = df
+        """The dataframe."""
+
+        self.chunk_size: int = chunk_size
+        """The number of rows hashed at once."""
+
+    @property
+    def schema(self) -> pl.Schema:
+        """The schema of the dataframe."""
+        return self.df.schema
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def iter_chunks(
+        self, columns: Optional[list[str]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Read the rows of the source in chunks of `chunk_size` rows.
+
+        Args:
+            columns (Optional[list[str]]): The columns to read, all columns by default.
+
+        Yields:
+            pl.DataFrame: The chunks.
+        """
+        columns = columns or self.df.columns
+        for offset in range(0, len(self.df), self.chunk_size):
+            yield self.df.slice(offset, self.chunk_size).select(columns)
+
+    def _get_hashed(self, columns: list[str]) -> Iterator[pl.DataFrame]:
+        for chunk in self.iter_chunks(columns):
+            # the text of the rows is built column by column and hashed as one batch
+            yield chunk.with_columns(
+                pl.concat_str(
+                    [_get_text_column(chunk[column]) for column in columns],
+                    separator=_SEPARATOR,
+                )
+                .map_batches(_hash_texts, return_dtype=pl.Int64)
+                .alias("hash")
+            )
+
+    def get_hash_counts(self, columns: list[str]) -> pl.DataFrame:
+        """
+        Get the number of occurrences of every row hash.
+
+        Args:
+            columns (list[str]): The hashed columns (*sorted by name*).
+
+        Returns:
+            pl.DataFrame: The dataframe with the `hash` and `count` columns.
+        """
+        hashes: pl.DataFrame = pl.concat(
+            [chunk.select("hash") for chunk in self._get_hashed(columns)]
+            or [pl.DataFrame(schema={"hash": pl.Int64})]
+        )
+        return hashes.group_by("hash").agg(pl.len().cast(pl.Int64).alias("count"))
+
+    def get_rows_by_hashes(self, columns: list[str], hashes: list[int]) -> pl.DataFrame:
+        """
+        Get the rows with one of the hashes.
+
+        Args:
+            columns (list[str]): The hashed columns (*sorted by name*).
+            hashes (list[int]): The hashes.
+
+        Returns:
+            pl.DataFrame: The rows with the `hash` column.
+        """
+        selected: pl.DataFrame = pl.DataFrame(
+            {"hash": hashes}, schema={"hash": pl.Int64}
+        )
+        return pl.concat(
+            [
+                chunk.join(selected, on="hash", how="semi")
+                for chunk in self._get_hashed(columns)
+            ]
+            or [
+                pl.DataFrame(
+                    schema={**self.df.select(columns).schema, "hash": pl.Int64}
+                )
+            ]
+        )
+
+
+class SQLSource:
+    """
+    A source adapter for a SQL query over a DB-API 2.0 connection.
+
+    The rows are read in chunks of `chunk_size` rows (`fetchmany`). The rows are hashed by the database with
+    the `hash_function` SQL function (*it must compute* :func:`portable_hash`, for SQLite it is registered
+    by :func:`register_sqlite_hash_function`) and the hashes are counted with `GROUP BY` in SQL,
+    so only the hashes and their counts are transferred. Full rows are fetched only for the requested hashes.
+
+    Example:
+        ```python
+        import sqlite3
+        from data_fingerprint.src.database import SQLSource, register_sqlite_hash_function
+
+        connection = sqlite3.connect("warehouse.db")
+        register_sqlite_hash_function(connection)
+        source = SQLSource(connection, "SELECT * FROM orders WHERE region = 'EU'")
+        ```
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        query: str,
+        chunk_size: int = 100_000,
+        hash_function: str = HASH_FUNCTION_NAME,
+        placeholder: str = "?",
+        quote: Callable[[str], str] = lambda name: '"' + name.replace('"', '""') + '"',
+    ) -> None:
+        """
+        Create the source.
+
+        Args:
+            connection (Any): The DB-API 2.0 connection.
+            query (str): The query selecting the rows of the source (*for example `SELECT * FROM orders`*).
+            chunk_size (int): The number of rows fetched at once.
+            hash_function (str): The name of the SQL function computing :func:`portable_hash`.
+            placeholder (str): The query parameter placeholder of the database driver.
+            quote (Callable[[str], str]): The function quoting the column names.
+        """
+        self.connection: Any = connection
+        """The DB-API 2.0 connection."""
+
+        self.query: str = query
+        """The query selecting the rows of the source."""
+
+        self.chunk_size: int = chunk_size
+        """The number of rows fetched at once."""
+
+        self.hash_function: str = hash_function
+        """The name of the SQL function computing :func:`portable_hash`."""
+
+        self.placeholder: str = placeholder
+        """The query parameter placeholder of the database driver."""
+
+        self.quote: Callable[[str], str] = quote
+        """The function quoting the column names."""
+
+        self._schema: Optional[pl.Schema] = None
+
+    @property
+    def schema(self) -> pl.Schema:
+        """
+        The schema of the query result.
+
+        The dtypes are read from the cursor description (*if the driver reports Python types*)
+        or from the declared column types (*for SQLite connections*). Only the columns without a known type
+        (*for example expressions*) are inferred from the rows, reading chunks until every such column has
+        a value, so a column that is `NULL` in the first chunk does not become `pl.Null`.
+        """
+        if self._schema is None:
+            cursor: Any = self.connection.cursor()
+            cursor.execute(self.query)
+            names: list[str] = [column[0] for column in cursor.description]
+            dtypes: dict[str, Optional[pl.DataType]] = {
+                column[0]: _PYTHON_DTYPES.get(column[1])
+                for column in cursor.description
+            }
+            if isinstance(self.connection, sqlite3.Connection):
+                for name, declared_type in self._get_sqlite_declared_types().items():
+                    dtypes[name] = dtypes[name] or _get_declared_dtype(declared_type)
+            while any(dtype is None for dtype in dtypes.values()):
+                rows: list[tuple] = cursor.fetchmany(self.chunk_size)
+                if len(rows) == 0:
+                    break
+                chunk: pl.DataFrame = pl.DataFrame(
+                    rows, schema=names, orient="row", infer_schema_length=None
+                )
+                for name, dtype in chunk.schema.items():
+                    if dtypes[name] is None and dtype != pl.Null:
+                        dtypes[name] = dtype
+            self._schema = pl.Schema(
+                {name: dtypes[name] or pl.Null() for name in names}
+            )
+        return self._schema
+
+    def _get_sqlite_declared_types(self) -> dict[str, str]:
+        view: str = self.quote(f"data_fingerprint_schema_{uuid.uuid4().hex}")
+        try:
+            self.connection.execute(f"CREATE TEMP VIEW {view} AS {self.query}")
+            return {
+                row[1]: row[2]
+                for row in self.connection.execute(f"PRAGMA table_info({view})")
+            }
+        finally:
+            self.connection.execute(f"DROP VIEW IF EXISTS temp.{view}")
+
+    def __len__(self) -> int:
+        cursor: Any = self.connection.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM ({self.query}) AS source_query")
+        return cursor.fetchone()[0]
+
+    def _get_hash_expression(self, columns: list[str]) -> str:
+        return f"{self.hash_function}({', '.join(self.quote(c) for c in columns)})"
+
+    def _fetch(
+        self, sql: str, names: list[str], parameters: tuple = ()
+    ) -> Iterator[pl.DataFrame]:
+        cursor: Any = self.connection.cursor()
+        cursor.execute(sql, parameters)
+        while True:
+            rows: list[tuple] = cursor.fetchmany(self.chunk_size)
+            if len(rows) == 0:
+                return
+            yield pl.DataFrame(
+                rows, schema=names, orient="row", infer_schema_length=None
+            )
+
+    def iter_chunks(
+        self, columns: Optional[list[str]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Read the rows of the source in chunks of `chunk_size` rows.
+
+        Args:
+            columns (Optional[list[str]]): The columns to read, all columns by default.
+
+        Yields:
+            pl.DataFrame: The chunks.
+        """
+        columns = columns or self.schema.names()
+        yield from self._fetch(
+            f"SELECT {', '.join(self.quote(c) for c in columns)} "
+            f"FROM ({self.query}) AS source_query",
+            columns,
+        )
+
+    def get_hash_counts(self, columns: list[str]) -> pl.DataFrame:
+        """
+        Get the number of occurrences of every row hash, computed by the database.
+
+        Args:
+            columns (list[str]): The hashed columns (*sorted by name*).
+
+        Returns:
+            pl.DataFrame: The dataframe with the `hash` and `count` columns.
+        """
+        chunks: list[pl.DataFrame] = list(
+            self._fetch(
+                f"SELECT {self._get_hash_expression(columns)} AS hash, COUNT(*) AS count "
+                f"FROM ({self.query}) AS source_query GROUP BY 1",
+                ["hash", "count"],
+            )
+        )
+        return (
+            pl.concat(chunks).cast(pl.Int64)
+            if len(chunks) > 0
+            else pl.DataFrame(schema={"hash": pl.Int64, "count": pl.Int64})
+        )
+
+    def get_rows_by_hashes(self, columns: list[str], hashes: list[int]) -> pl.DataFrame:
+        """
+        Fetch the rows with one of the hashes (*in batches of at most 500 hashes per query*).
+
+        Args:
+            columns (list[str]): The hashed columns (*sorted by name*).
+            hashes (list[int]): The hashes.
+
+        Returns:
+            pl.DataFrame: The rows with the `hash` column.
+        """
+        hash_expression: str = self._get_hash_expression(columns)
+        chunks: list[pl.DataFrame] = []
+        for offset in range(0, len(hashes), 500):
+            batch: list[int] = hashes[offset : offset + 500]
+            chunks.extend(
+                self._fetch(
+                    f"SELECT {', '.join(self.quote(c) for c in columns)}, {hash_expression} AS hash "
+                    f"FROM ({self.query}) AS source_query "
+                    f"WHERE {hash_expression} IN ({', '.join([self.placeholder] * len(batch))})",
+                    columns + ["hash"],
+                    tuple(batch),
+                )
+            )
+        if len(chunks) == 0:
+            return pl.DataFrame(schema={**self.schema, "hash": pl.Int64}).select(
+                *columns, "hash"
+            )
+        return pl.concat(chunks, how="vertical_relaxed").cast(
+            {**{c: self.schema[c] for c in columns}, "hash": pl.Int64}
+        )
+
+
+Source = Union[FrameSource, SQLSource]
+"""A source adapter."""
+
+
+def get_source_data_report(
+    source0: Source,
+    source1: Source,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+) -> DataReport:
+    """
+    Get a data report comparing two source adapters (*for example a warehouse table and a Parquet export*),
+    with the same result as :func:`data_compare.src.comparator.get_data_report` on the loaded sources.
+
+    Only the hash counts of both sources are compared, the full rows are fetched only for the differing hashes.
+
+    Example:
+        ```python
+        import polars as pl
+        from data_fingerprint.src.database import FrameSource, SQLSource, get_source_data_report
+
+        report = get_source_data_report(
+            SQLSource(connection, "SELECT * FROM orders"),
+            FrameSource(pl.read_parquet("export/orders.parquet")),
+            "warehouse",
+            "export",
+            grouping_columns=["order_id"],
+        )
+        ```
+
+    Raises:
+        ValueError: If the names are the same or the grouping columns are not comparable in both sources.
+
+    Args:
+        source0 (:data:`Source`): The first source.
+        source1 (:data:`Source`): The second source.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two sources.
+    """
+    if df0_name == df1_name:
+        raise ValueError(f"Source name already exists: {df1_name}")
+
+    same_columns, column_differences = get_schema_differences(
+        source0.schema, source1.schema, df0_name, df1_name
+    )
+    if grouping_columns is not None and (
+        len(set(grouping_columns).difference(same_columns)) > 0
+    ):
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+
+    if len(same_columns) == 0:
+        return get_data_report(
+            *[
+                pl.concat(
+                    list(source.iter_chunks()) or [pl.DataFrame(schema=source.schema)]
+                )
+                for source in [source0, source1]
+            ],
+            df0_name,
+            df1_name,
+        )
+
+    columns: list[str] = sorted(same_columns)
+    df0_counts: pl.DataFrame = source0.get_hash_counts(columns)
+    df1_counts: pl.DataFrame = source1.get_hash_counts(columns)
+    differing_hashes: list[int] = (
+        df0_counts.join(df1_counts, on="hash", how="full", coalesce=True, suffix="_1")
+        .fill_null(0)
+        .filter(pl.col("count") != pl.col("count_1"))["hash"]
+        .to_list()
+    )
+    subsets: list[pl.DataFrame] = [
+        source.get_rows_by_hashes(columns, differing_hashes).with_columns(
+            pl.lit(name).alias("source")
+        )
+        for source, name in [(source0, df0_name), (source1, df1_name)]
+    ]
+    row_differences = _get_hashed_row_differences(
+        subsets[0],
+        subsets[1],
+        df0_name,
+        df1_name,
+        df0_counts=df0_counts,
+        df1_counts=df1_counts,
+    )
+    if grouping_columns is not None:
+        row_differences = _pair_row_differences(row_differences, grouping_columns)
+
+    return DataReport(
+        df0_length=len(source0),
+        df1_length=len(source1),
+        df0_name=df0_name,
+        df1_name=df1_name,
+        comparable_columns=same_columns,
+        column_differences=column_differences,
+        row_differences=row_differences,
+    )
@@ -39,3 +39,29 @@ class RowDifferenceType(str, Enum):
 
     MISSING_ROW: str = "MISSING_ROW"
     """When this row is present in `source` row but not in the other source."""
+
+
+class ExecutionStrategy(str, Enum):
+    """
+    Enum for the execution strategies of a comparison (*see* :func:`data_compare.src.planner.plan_comparison`).
+    """
+
+    HASH: str = "HASH"
+    """Hash every row of both loaded dataframes and compare the hash counts
+    (:func:`data_compare.src.comparator.get_data_report`)."""
+
+    SORT_MERGE: str = "SORT_MERGE"
+    """Walk both dataframes sorted by the grouping columns in lockstep
+    (:func:`data_compare.src.sort_merge.get_row_differences_sorted`)."""
+
+    PARTITIONED: str = "PARTITIONED"
+    """Split both dataframes into hash partitions compared in a process pool
+    (:func:`data_compare.src.parallel.get_data_report_partitioned`)."""
+
+    PARQUET_HASHES: str = "PARQUET_HASHES"
+    """Stream the row hashes of two Parquet files and read only the differing rows
+    (:func:`data_compare.src.parquet.get_parquet_data_report`)."""
+
+    SPILL: str = "SPILL"
+    """Spill hash partitions of both sources to disk and compare them one pair at a time
+    (:func:`data_compare.src.spill.get_data_report_spilled`)."""
@@ -0,0 +1,168 @@
+import re
+from typing import Optional, Union
+
+import polars as pl
+
+from data_fingerprint.src.scan import InputSource, scan_source
+
+DIGEST_TOKEN_PATTERN: re.Pattern = re.compile(r"^<digest (\d+) length (\d+)>$")
+"""The pattern of a digest token, `<digest {hash} length {length in bytes}>`."""
+
+
+def _get_length_expression(column: str, dtype: pl.DataType) -> pl.Expr:
+    if dtype == pl.Binary:
+        return pl.col(column).bin.size()
+    return pl.col(column).str.len_bytes()
+
+
+def get_digest_expressions(
+    schema: pl.Schema,
+    large_value_threshold: int,
+    exclude_columns: Optional[list[str]] = None,
+) -> list[pl.Expr]:
+    """
+    Get the expressions replacing the large string and binary values by digest tokens.
+
+    A value longer than `large_value_threshold` bytes is replaced by `<digest {hash} length {length}>`
+    (*see* :data:`DIGEST_TOKEN_PATTERN`), where `hash` is the polars hash of the value,
+    so equal values get equal tokens and the rows are compared (*and reported*) without their payloads.
+    Binary tokens are binary values, smaller values are kept as they are.
+
+    Args:
+        schema (pl.Schema): The schema of the dataframe.
+        large_value_threshold (int): The largest value (*in bytes*) that is kept.
+        exclude_columns (Optional[list[str]]): The columns that are never replaced (*e.g. the grouping columns*).
+
+    Returns:
+        list[pl.Expr]: One expression per string and binary column.
+    """
+    excluded: set[str] = set(exclude_columns or [])
+    expressions: list[pl.Expr] = []
+    for column, dtype in schema.items():
+        if column in excluded or dtype not in (pl.String, pl.Binary):
+            continue
+        length: pl.Expr = _get_length_expression(column, dtype)
+        expressions.append(
+            pl.when(length > large_value_threshold)
+            .then(
+                pl.format("<digest {} length {}>", pl.col(column).hash(), length).cast(
+                    dtype
+                )
+            )
+            .otherwise(pl.col(column))
+            .alias(column)
+        )
+    return expressions
+
+
+def digest_large_values(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    large_value_threshold: int,
+    exclude_columns: Optional[list[str]] = None,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Replace the large string and binary values of a dataframe by digest tokens
+    (*see* :func:`get_digest_expressions`).
+
+    Example:
+        ```python
+        import polars as pl
+        from data_fingerprint.src.digest import digest_large_values
+
+        df = pl.DataFrame({"id": [1, 2], "payload": ["small", "x" * 10_000]})
+        print(digest_large_values(df, 1024)["payload"].to_list())
+        ```
+        Output:
+        ```
+        ['small', '<digest 13190599519302854686 length 10000>']
+        ```
+
+    Args:
+        df (Union[pl.DataFrame, pl.LazyFrame]): The dataframe.
+        large_value_threshold (int): The largest value (*in bytes*) that is kept.
+        exclude_columns (Optional[list[str]]): The columns that are never replaced.
+
+    Returns:
+        Union[pl.DataFrame, pl.LazyFrame]: The dataframe with the digest tokens.
+    """
+    schema: pl.Schema = (
+        df.collect_schema() if isinstance(df, pl.LazyFrame) else df.schema
+    )
+    expressions: list[pl.Expr] = get_digest_expressions(
+        schema, large_value_threshold, exclude_columns
+    )
+    if len(expressions) == 0:
+        return df
+    return df.with_columns(expressions)
+
+
+def parse_digest_token(value: object) -> Optional[tuple[int, int]]:
+    """
+    Parse a digest token.
+
+    Args:
+        value (object): A reported value.
+
+    Returns:
+        Optional[tuple[int, int]]: The hash and the length of the replaced value,
+        `None` if the value is not a digest token.
+    """
+    if isinstance(value, bytes):
+        try:
+            value = value.decode()
+        except UnicodeDecodeError:
+            return None
+    if not isinstance(value, str):
+        return None
+    match: Optional[re.Match] = DIGEST_TOKEN_PATTERN.match(value)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def fetch_large_value(
+    source: InputSource, column: str, token: Union[str, bytes]
+) -> Union[str, bytes]:
+    """
+    Fetch the payload of a digest token from the source it was reported from.
+
+    The source is scanned lazily and filtered by the length and the hash of the column,
+    so only the matching value is materialized.
+
+    Example:
+        ```python
+        report = get_data_report(df0, df1, "df0", "df1", ["id"], large_value_threshold=1024)
+        difference = report.row_differences[0]
+        source = {"df0": df0, "df1": df1}[difference.row_with_source["source"][0]]
+        payload = fetch_large_value(source, "payload", difference.row_with_source["payload"][0])
+        ```
+
+    Raises:
+        ValueError: If the value is not a digest token or the source has no value with the digest.
+
+    Args:
+        source (:data:`data_compare.src.scan.InputSource`): The source of the value.
+        column (str): The column of the value.
+        token (Union[str, bytes]): The digest token.
+
+    Returns:
+        Union[str, bytes]: The original value.
+    """
+    parsed: Optional[tuple[int, int]] = parse_digest_token(token)
+    if parsed is None:
+        raise ValueError(f"Not a digest token: {token!r}")
+    value_hash, length = parsed
+    lazy_frame: pl.LazyFrame = scan_source(source)
+    dtype: pl.DataType = lazy_frame.collect_schema()[column]
+    values: pl.Series = (
+        lazy_frame.select(column)
+        .filter(
+            (_get_length_expression(column, dtype) == length)
+            & (pl.col(column).hash() == value_hash)
+        )
+        .head(1)
+        .collect()[column]
+    )
+    if len(values) == 0:
+        raise ValueError(f"No value of {column} has the digest {token!r}")
+    return values[0]
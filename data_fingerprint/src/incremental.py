@@ -0,0 +1,259 @@
+from typing import Any, Optional, Union
+
+import polars as pl
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.models import (
+    DataReport,
+    IncrementalState,
+    RowDifference,
+    RowGroupDifference,
+)
+from data_fingerprint.src.scan import InputSource, scan_source
+
+
+def _get_watermark_expression(
+    watermark_column: str, watermark: Any, dtype: pl.DataType
+) -> pl.Expr:
+    """
+    Build the expression selecting the rows changed at or after the watermark.
+
+    The rows with the last watermark value itself are selected again, because rows written late with the
+    same value as the last run would be skipped otherwise (*their keys are compared again, not reported twice*).
+    Watermarks loaded from a JSON state are strings, they are parsed to the type of the watermark column.
+
+    Args:
+        watermark_column (str): The watermark column.
+        watermark (Any): The last watermark value.
+        dtype (pl.DataType): The data type of the watermark column.
+
+    Returns:
+        pl.Expr: The boolean expression.
+    """
+    if isinstance(watermark, str) and dtype.is_temporal():
+        watermark = pl.Series([watermark]).str.strptime(dtype).item()
+    return pl.col(watermark_column) >= pl.lit(watermark, dtype=dtype)
+
+
+def _get_row_difference_keys(
+    row_difference: Union[RowDifference, RowGroupDifference],
+    grouping_columns: list[str],
+) -> set[tuple]:
+    """
+    Get the keys (*values of the grouping columns*) of the rows of a row difference.
+
+    Args:
+        row_difference (Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]): The row difference.
+        grouping_columns (list[str]): The key columns.
+
+    Returns:
+        set[tuple]: The keys.
+    """
+    return set(zip(*[row_difference.row[column] for column in grouping_columns]))
+
+
+def _merge_duplicate_keys(
+    stored: Optional[dict[str, list[Any]]],
+    delta: Optional[dict[str, list[Any]]],
+    changed: set[tuple],
+    grouping_columns: list[str],
+) -> Optional[dict[str, list[Any]]]:
+    """
+    Merge the stored duplicated keys with the duplicated keys of the changed rows:
+    the stored keys that were compared again are replaced by the new ones.
+
+    Args:
+        stored (Optional[dict[str, list[Any]]]): The duplicated keys of the stored report.
+        delta (Optional[dict[str, list[Any]]]): The duplicated keys of the changed rows.
+        changed (set[tuple]): The changed keys (*in the order of the grouping columns*).
+        grouping_columns (list[str]): The key columns.
+
+    Returns:
+        Optional[dict[str, list[Any]]]: The merged duplicated keys, `None` if there are none.
+    """
+    keys: dict[tuple, None] = {}
+    if stored is not None:
+        keys.update(
+            dict.fromkeys(
+                key
+                for key in zip(*[stored[column] for column in grouping_columns])
+                if key not in changed
+            )
+        )
+    if delta is not None:
+        keys.update(dict.fromkeys(zip(*[delta[column] for column in grouping_columns])))
+    if len(keys) == 0:
+        return None
+    return {
+        column: [key[grouping_columns.index(column)] for key in keys]
+        for column in sorted(grouping_columns)
+    }
+
+
+def get_incremental_data_report(
+    df0: InputSource,
+    df1: InputSource,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: list[str],
+    watermark_column: str,
+    state: Optional[IncrementalState] = None,
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+) -> IncrementalState:
+    """
+    Compare only the rows changed since the last run and merge the result into the stored state.
+
+    The keys of the rows with a watermark value at least the last watermark are collected from both sides
+    (*only the key and watermark columns are scanned*), then only the rows with these keys are loaded, hashed and
+    compared (*on both sides, so a row changed on one side is compared with the unchanged row on the other side*).
+    The differences (*and the duplicated keys*) of the changed keys replace the stored ones of these keys,
+    the other stored differences are kept. The cost of a run scales with the number of changed rows instead of the table size.
+
+    Without a state all the rows are compared and the first state is created.
+
+    .. note::
+        Deleted rows do not have a watermark, so they are detected only by a full comparison (*without a state*).
+        The watermark column is usually different on both sides, exclude it from the comparison with `exclude_columns`.
+
+    Example:
+        ```python
+        import polars as pl
+        from data_fingerprint.src.incremental import get_incremental_data_report
+        from data_fingerprint.src.models import IncrementalState
+
+        state = get_incremental_data_report(
+            pl.scan_parquet("warehouse/orders.parquet"),
+            pl.scan_parquet("export/orders.parquet"),
+            "warehouse",
+            "export",
+            ["order_id"],
+            "updated_at",
+            state=IncrementalState.model_validate_json(open("state.json").read()),
+            exclude_columns=["updated_at"],
+        )
+        open("state.json", "w").write(state.model_dump_json())
+        print(state.data_report.row_differences)
+        ```
+
+    Raises:
+        ValueError: If the state was created with other sources, grouping columns or watermark column,
+            or the watermark column is not in both sources.
+
+    Args:
+        df0 (:data:`data_compare.src.scan.InputSource`): The first source.
+        df1 (:data:`data_compare.src.scan.InputSource`): The second source.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+        grouping_columns (list[str]): The key columns of the rows.
+        watermark_column (str): The column with the time (*or version*) of the last change of a row.
+        state (Optional[:class:`data_compare.src.models.IncrementalState`]): The state of the last run.
+        include_columns (Optional[list[str]]): The columns to compare, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns that are not compared.
+
+    Returns:
+        :class:`data_compare.src.models.IncrementalState`: The new state, with the merged data report.
+    """
+    if state is not None and (
+        state.watermark_column != watermark_column
+        or state.grouping_columns != grouping_columns
+        or (state.data_report.df0_name, state.data_report.df1_name)
+        != (df0_name, df1_name)
+    ):
+        raise ValueError(
+            "The state was created for other sources, grouping columns or watermark column. "
+            f"State: {(state.data_report.df0_name, state.data_report.df1_name)}, "
+            f"{state.grouping_columns}, {state.watermark_column}."
+        )
+
+    lazy_frames: list[pl.LazyFrame] = [scan_source(df0), scan_source(df1)]
+    schemas: list[pl.Schema] = [lf.collect_schema() for lf in lazy_frames]
+    if any(watermark_column not in schema for schema in schemas):
+        raise ValueError(
+            f"Watermark column {watermark_column} must be in both sources."
+        )
+
+    watermark: Optional[Any] = None if state is None else state.watermark
+    changed_rows: list[pl.DataFrame] = [
+        (
+            lf
+            if watermark is None
+            else lf.filter(
+                _get_watermark_expression(
+                    watermark_column, watermark, schema[watermark_column]
+                )
+            )
+        )
+        .select(*grouping_columns, watermark_column)
+        .collect()
+        for lf, schema in zip(lazy_frames, schemas)
+    ]
+    new_watermark: Optional[Any] = max(
+        [
+            value
+            for rows in changed_rows
+            if (value := rows[watermark_column].max()) is not None
+        ],
+        default=watermark,
+    )
+    if state is None:
+        data_report: DataReport = get_data_report(
+            lazy_frames[0],
+            lazy_frames[1],
+            df0_name,
+            df1_name,
+            grouping_columns,
+            include_columns=include_columns,
+            exclude_columns=exclude_columns,
+        )
+        return IncrementalState(
+            watermark_column=watermark_column,
+            watermark=new_watermark,
+            grouping_columns=grouping_columns,
+            data_report=data_report,
+        )
+
+    changed_keys: pl.DataFrame = pl.concat(
+        [rows.select(grouping_columns) for rows in changed_rows], how="vertical_relaxed"
+    ).unique()
+    delta_report: DataReport = get_data_report(
+        *[
+            lf.join(
+                changed_keys.lazy(), on=grouping_columns, how="semi", nulls_equal=True
+            )
+            for lf in lazy_frames
+        ],
+        df0_name,
+        df1_name,
+        grouping_columns,
+        include_columns=include_columns,
+        exclude_columns=exclude_columns,
+    )
+
+    lengths: list[int] = [lf.select(pl.len()).collect().item() for lf in lazy_frames]
+    changed: set[tuple] = set(changed_keys.rows())
+    kept_row_differences: list[Union[RowDifference, RowGroupDifference]] = [
+        rd
+        for rd in state.data_report.row_differences
+        if len(_get_row_difference_keys(rd, grouping_columns) & changed) == 0
+    ]
+    return IncrementalState(
+        watermark_column=watermark_column,
+        watermark=new_watermark,
+        grouping_columns=grouping_columns,
+        data_report=DataReport(
+            df0_length=lengths[0],
+            df1_length=lengths[1],
+            df0_name=df0_name,
+            df1_name=df1_name,
+            comparable_columns=delta_report.comparable_columns,
+            column_differences=delta_report.column_differences,
+            row_differences=kept_row_differences + delta_report.row_differences,
+            duplicate_keys=_merge_duplicate_keys(
+                state.data_report.duplicate_keys,
+                delta_report.duplicate_keys,
+                changed,
+                grouping_columns,
+            ),
+        ),
+    )
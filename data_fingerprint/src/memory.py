@@ -0,0 +1,118 @@
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import polars as pl
+
+from data_fingerprint.src.models import MemoryProfile, StageMemory
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+MEMORY_FACTOR: int = 3
+"""The estimated peak memory of a comparison as a multiple of the estimated size of its inputs."""
+
+
+def get_rss_bytes() -> Optional[int]:
+    """
+    Get the current resident set size (RSS) of the process.
+
+    The value is read from `/proc/self/statm`, so it is only available on Linux.
+    On other platforms the peak resident set size is returned instead (see :func:`get_peak_rss_bytes`).
+
+    Returns:
+        Optional[int]: The resident set size in bytes or `None` if it can not be determined.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages: int = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return get_peak_rss_bytes()
+
+
+def get_peak_rss_bytes() -> Optional[int]:
+    """
+    Get the peak resident set size (RSS) of the process.
+
+    Returns:
+        Optional[int]: The peak resident set size in bytes or `None` if it can not be determined.
+    """
+    if resource is None:
+        return None
+
+    max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # on macOS `ru_maxrss` is in bytes, on Linux it is in kilobytes
+    if sys.platform == "darwin":
+        return max_rss
+    return max_rss * 1024
+
+
+@contextmanager
+def track_stage(
+    memory_profile: Optional[MemoryProfile], stage: str
+) -> Iterator[Optional[StageMemory]]:
+    """
+    Context manager that records the memory usage of a comparison stage into a
+    :class:`data_fingerprint.src.models.MemoryProfile`.
+
+    If `memory_profile` is `None` nothing is recorded, so the instrumentation costs nothing
+    when it is not requested.
+
+    Example:
+        ```python
+        from data_fingerprint.src.memory import track_stage, record_frame_size
+        from data_fingerprint.src.models import MemoryProfile
+
+        profile = MemoryProfile()
+        with track_stage(profile, "hashing") as stage:
+            hashed = df.with_columns(df.hash_rows().alias("hash"))
+            record_frame_size(stage, "hashed", hashed)
+        print(profile.get_stage("hashing"))
+        ```
+
+    Args:
+        memory_profile (Optional[MemoryProfile]): The profile to record into.
+        stage (str): The name of the stage.
+
+    Returns:
+        Iterator[Optional[StageMemory]]: The recorded stage (or `None` if nothing is recorded).
+    """
+    if memory_profile is None:
+        yield None
+        return
+
+    stage_memory: StageMemory = StageMemory(stage=stage, rss_before=get_rss_bytes())
+    try:
+        yield stage_memory
+    finally:
+        stage_memory.rss_after = get_rss_bytes()
+        stage_memory.peak_rss = get_peak_rss_bytes()
+        memory_profile.stages.append(stage_memory)
+
+
+def record_frame_size(
+    stage_memory: Optional[StageMemory], name: str, frame: pl.DataFrame
+) -> None:
+    """
+    Record the estimated size of a `polars.DataFrame` (`polars.DataFrame.estimated_size`) in a stage.
+
+    Sizes recorded under the same name are summed up, so it can be used inside loops.
+
+    Args:
+        stage_memory (Optional[StageMemory]): The stage to record into, nothing is recorded if `None`.
+        name (str): The name of the frame.
+        frame (pl.DataFrame): The frame to measure.
+
+    Returns:
+        None
+    """
+    if stage_memory is None:
+        return
+
+    stage_memory.frame_sizes[name] = stage_memory.frame_sizes.get(
+        name, 0
+    ) + frame.estimated_size("b")
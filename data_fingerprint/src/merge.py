@@ -0,0 +1,197 @@
+from typing import Any, Optional, Union
+
+import polars as pl
+
+from data_fingerprint.src.comparator import (
+    _get_hashed_row_differences,
+    _hash_subset,
+    _pair_row_differences,
+)
+from data_fingerprint.src.models import (
+    ColumnDifference,
+    DataReport,
+    RowDifference,
+    RowGroupDifference,
+)
+
+
+def _get_difference_rows(
+    row_differences: list[Union[RowDifference, RowGroupDifference]],
+) -> pl.DataFrame:
+    """
+    Convert the row differences of a report back to rows with the `source` column.
+
+    Every :class:`data_compare.src.models.RowDifference` contributes all of its occurrences and every
+    :class:`data_compare.src.models.RowGroupDifference` contributes the rows of all its sources.
+
+    Args:
+        row_differences (list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]): The row differences.
+
+    Returns:
+        pl.DataFrame: The difference rows, empty if there are no row differences.
+    """
+    difference_rows: list[pl.DataFrame] = []
+    for rd in row_differences:
+        if isinstance(rd, RowDifference):
+            difference_rows.append(
+                pl.DataFrame(rd.row).with_columns(pl.lit(rd.source).alias("source"))
+            )
+            continue
+
+        difference_rows.append(pl.DataFrame(rd.row_with_source))
+
+    if len(difference_rows) == 0:
+        return pl.DataFrame()
+    return pl.concat(difference_rows, how="diagonal_relaxed")
+
+
+def _merge_duplicate_keys(
+    data_reports: list[DataReport],
+) -> Optional[dict[str, list[Any]]]:
+    """
+    Merge the duplicated keys of partial data reports (*the union of the keys, each key once*).
+
+    Args:
+        data_reports (list[:class:`data_compare.src.models.DataReport`]): The partial reports.
+
+    Returns:
+        Optional[dict[str, list[Any]]]: The merged duplicated keys, `None` if no report has any.
+    """
+    columns: Optional[list[str]] = None
+    keys: dict[tuple, None] = {}
+    for data_report in data_reports:
+        if data_report.duplicate_keys is None:
+            continue
+        if columns is None:
+            columns = sorted(data_report.duplicate_keys)
+        elif columns != sorted(data_report.duplicate_keys):
+            raise ValueError(
+                "Data reports must have the same duplicate key columns. "
+                f"Duplicate key columns: {[sorted(r.duplicate_keys or {}) for r in data_reports]}"
+            )
+        keys.update(
+            dict.fromkeys(
+                zip(*(data_report.duplicate_keys[column] for column in columns))
+            )
+        )
+    if columns is None:
+        return None
+    return {
+        column: [key[position] for key in keys]
+        for position, column in enumerate(columns)
+    }
+
+
+def merge_data_reports(
+    data_reports: list[DataReport], grouping_columns: Optional[list[str]] = None
+) -> DataReport:
+    """
+    Merge partial data reports of disjoint shards (*for example tables sharded by date*) into one data report.
+
+    The merged report is the same as if the whole (*unsharded*) dataframes were compared:
+    - the lengths of the dataframes are summed up
+    - the column differences are deduplicated
+    - the row differences are reconciled, a row that is missing in one source on one shard and
+      missing in the other source on another shard is not a difference at all, and differences in the number
+      of duplicates of the same row (*same hash*) are netted over all shards
+    - the duplicated keys are the union of the duplicated keys of the reports
+    - if grouping columns are used, the rows of one group coming from different shards are paired again
+
+    The merge is associative, so partial reports can be merged in any grouping
+    (*for example in a map-reduce tree over many machines*).
+
+    Example:
+        ```python
+        from data_fingerprint.src.comparator import get_data_report
+        from data_fingerprint.src.merge import merge_data_reports
+
+        reports = [
+            get_data_report(shard0, shard1, "df0", "df1", ["id"])
+            for shard0, shard1 in shards
+        ]
+        report = merge_data_reports(reports, ["id"])
+        ```
+
+    Raises:
+        ValueError: If there are no reports or the reports do not compare the same sources and columns
+            (*or report duplicated keys of different columns*).
+
+    Args:
+        data_reports (list[:class:`data_compare.src.models.DataReport`]): The partial reports.
+        grouping_columns (Optional[list[str]]): The columns the rows were paired by, if `None` they are
+            taken from the row group differences of the reports (*if there are any*).
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: The merged data report.
+    """
+    if len(data_reports) == 0:
+        raise ValueError("At least one data report is needed to merge.")
+
+    first_report: DataReport = data_reports[0]
+    for data_report in data_reports[1:]:
+        if (data_report.df0_name, data_report.df1_name) != (
+            first_report.df0_name,
+            first_report.df1_name,
+        ):
+            raise ValueError(
+                "Data reports must compare the same sources. "
+                f"Sources: {[(r.df0_name, r.df1_name) for r in data_reports]}"
+            )
+        if set(data_report.comparable_columns) != set(first_report.comparable_columns):
+            raise ValueError(
+                "Data reports must have the same comparable columns. "
+                f"Comparable columns: {[r.comparable_columns for r in data_reports]}"
+            )
+
+    column_differences: list[ColumnDifference] = []
+    for data_report in data_reports:
+        for column_difference in data_report.column_differences:
+            if column_difference not in column_differences:
+                column_differences.append(column_difference)
+
+    all_row_differences: list[Union[RowDifference, RowGroupDifference]] = [
+        rd for data_report in data_reports for rd in data_report.row_differences
+    ]
+    if grouping_columns is None:
+        grouping_columns = next(
+            (
+                rd.grouping_columns
+                for rd in all_row_differences
+                if isinstance(rd, RowGroupDifference)
+            ),
+            None,
+        )
+
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = (
+        all_row_differences
+    )
+    if len(first_report.comparable_columns) > 0 and len(all_row_differences) > 0:
+        difference_rows: pl.DataFrame = _get_difference_rows(all_row_differences)
+        columns: list[str] = sorted(first_report.comparable_columns)
+        row_differences = _get_hashed_row_differences(
+            _hash_subset(
+                difference_rows.filter(pl.col("source") == first_report.df0_name),
+                columns,
+                first_report.df0_name,
+            ),
+            _hash_subset(
+                difference_rows.filter(pl.col("source") == first_report.df1_name),
+                columns,
+                first_report.df1_name,
+            ),
+            first_report.df0_name,
+            first_report.df1_name,
+        )
+        if grouping_columns is not None:
+            row_differences = _pair_row_differences(row_differences, grouping_columns)
+
+    return DataReport(
+        df0_length=sum(r.df0_length for r in data_reports),
+        df1_length=sum(r.df1_length for r in data_reports),
+        df0_name=first_report.df0_name,
+        df1_name=first_report.df1_name,
+        comparable_columns=first_report.comparable_columns,
+        column_differences=column_differences,
+        row_differences=row_differences,
+        duplicate_keys=_merge_duplicate_keys(data_reports),
+    )
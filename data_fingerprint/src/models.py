@@ -6,6 +6,7 @@ import polars as pl
 from data_fingerprint.src.difference_types import (
     ColumnNameDifferenceType,
     ColumnDataTypeDifferenceType,
+    ExecutionStrategy,
     RowDifferenceType,
 )
 
@@ -140,3 +141,277 @@ class DataReport(BaseModel):
 
     row_differences: list[Union[RowDifference, RowGroupDifference]]
     """The row differences."""
+
+    duplicate_keys: Optional[dict[str, list[Any]]] = None
+    """The values of the grouping columns of the row differences whose key is duplicated in one of the
+    dataframes (*they are compared group by group instead of row by row*), `None` if there are none."""
+
+
+class StageMemory(BaseModel):
+    """
+    Model for memory usage of a single comparison stage.
+    """
+
+    stage: str
+    """The name of the comparison stage."""
+
+    rss_before: Optional[int] = None
+    """The resident set size (*in bytes*) of the process before the stage started."""
+
+    rss_after: Optional[int] = None
+    """The resident set size (*in bytes*) of the process after the stage finished."""
+
+    peak_rss: Optional[int] = None
+    """The peak resident set size (*in bytes*) of the process after the stage finished."""
+
+    frame_sizes: dict[str, int] = {}
+    """The estimated sizes (*in bytes*) of the `polars.DataFrame` objects created in the stage."""
+
+    @computed_field
+    @property
+    def rss_delta(self) -> Optional[int]:
+        """The difference in resident set size (*in bytes*) caused by the stage."""
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+
+    @computed_field
+    @property
+    def estimated_size(self) -> int:
+        """The total estimated size (*in bytes*) of the frames created in the stage."""
+        return sum(self.frame_sizes.values())
+
+
+class MemoryProfile(BaseModel):
+    """
+    Model for memory usage of a comparison, recorded per stage.
+    """
+
+    stages: list[StageMemory] = []
+    """The recorded stages, in the order they were executed."""
+
+    def get_stage(self, stage: str) -> Optional[StageMemory]:
+        """
+        Get the last recorded stage with the given name.
+
+        Args:
+            stage (str): The name of the stage.
+
+        Returns:
+            Optional[StageMemory]: The recorded stage or `None` if the stage was not recorded.
+        """
+        for stage_memory in reversed(self.stages):
+            if stage_memory.stage == stage:
+                return stage_memory
+        return None
+
+    @computed_field
+    @property
+    def peak_rss(self) -> Optional[int]:
+        """The highest peak resident set size (*in bytes*) recorded over all stages."""
+        peaks: list[int] = [s.peak_rss for s in self.stages if s.peak_rss is not None]
+        if len(peaks) == 0:
+            return None
+        return max(peaks)
+
+    @computed_field
+    @property
+    def peak_estimated_size(self) -> int:
+        """The largest estimated size (*in bytes*) of frames recorded in a single stage."""
+        return max([s.estimated_size for s in self.stages], default=0)
+
+
+class ParquetFileKey(BaseModel):
+    """
+    Model identifying the version of a Parquet file without reading its data.
+    """
+
+    path: str
+    """The absolute path of the file."""
+
+    size: int
+    """The size of the file in bytes."""
+
+    mtime_ns: int
+    """The modification time of the file in nanoseconds."""
+
+    row_groups: list[tuple[int, int]]
+    """The number of rows and the total byte size of every row group."""
+
+
+class HashSidecar(BaseModel):
+    """
+    Model for the metadata of a sidecar file with precomputed row hashes of a Parquet file.
+    """
+
+    file_key: ParquetFileKey
+    """The version of the Parquet file the hashes were computed for."""
+
+    columns: list[str]
+    """The hashed columns (*sorted by name*)."""
+
+    polars_version: str
+    """The polars version used for hashing, hashes are not stable between polars versions."""
+
+    number_of_rows: int
+    """The number of rows of the Parquet file."""
+
+    digest: str
+    """The digest of the whole file, it does not depend on the order of the rows."""
+
+    row_group_digests: list[str]
+    """The digest of every row group, it does not depend on the order of the rows."""
+
+
+class RowGroupFingerprint(BaseModel):
+    """
+    Model for the fingerprint of one row group of a Parquet file.
+    """
+
+    index: int
+    """The index of the row group in the file."""
+
+    number_of_rows: int
+    """The number of rows of the row group."""
+
+    statistics: dict[str, tuple[Optional[str], Optional[str], Optional[int]]]
+    """The minimum, maximum and number of nulls of every fingerprinted column (*from the Parquet footer*)."""
+
+    digest: Optional[str] = None
+    """The digest of the row hashes (*it does not depend on the order of the rows*), `None` if not computed."""
+
+
+class IncrementalState(BaseModel):
+    """
+    Model for the state of an incremental (*watermark based*) comparison, stored between the runs.
+    """
+
+    watermark_column: str
+    """The column with the time (*or version*) of the last change of a row, for example `updated_at`."""
+
+    watermark: Optional[Any] = None
+    """The highest value of the watermark column seen so far, `None` before the first run."""
+
+    grouping_columns: list[str]
+    """The key columns of the rows."""
+
+    data_report: DataReport
+    """The data report of all the rows, merged over the runs."""
+
+
+class JobLatency(BaseModel):
+    """
+    Model for the latency of one comparison job of the comparison server.
+    """
+
+    job_id: int
+    """The sequence number of the job."""
+
+    baseline: str
+    """The name of the baseline."""
+
+    candidate: str
+    """The name of the candidate."""
+
+    queued_seconds: float
+    """The time the job waited for a worker."""
+
+    load_seconds: float
+    """The time it took to load the candidate."""
+
+    compare_seconds: float
+    """The time it took to compare the candidate with the baseline."""
+
+    @computed_field
+    @property
+    def total_seconds(self) -> float:
+        """The total latency of the job."""
+        return self.queued_seconds + self.load_seconds + self.compare_seconds
+
+
+class StrategyEstimate(BaseModel):
+    """
+    Model for the estimated cost of one execution strategy of a comparison.
+    """
+
+    strategy: ExecutionStrategy
+    """The execution strategy."""
+
+    estimated_cost: float
+    """The estimated cost in hashed-cell units (*one unit is hashing one value*)."""
+
+    estimated_memory: int
+    """The estimated peak memory in bytes."""
+
+    reason: str
+    """Why the strategy has this cost."""
+
+
+class ComparisonPlan(BaseModel):
+    """
+    Model for the execution plan of a comparison (*see* :func:`data_compare.src.planner.plan_comparison`).
+    """
+
+    df0_name: str
+    """The name of the first source."""
+
+    df1_name: str
+    """The name of the second source."""
+
+    grouping_columns: Optional[list[str]] = None
+    """The columns to pair the rows by."""
+
+    strategy: ExecutionStrategy
+    """The chosen execution strategy."""
+
+    df0_rows: int
+    """The number of rows of the first source."""
+
+    df1_rows: int
+    """The number of rows of the second source."""
+
+    number_of_columns: int
+    """The number of comparable columns."""
+
+    estimated_size: int
+    """The estimated in-memory size of both sources in bytes."""
+
+    keys_unique: Optional[bool] = None
+    """If the grouping columns are unique in both sources, `None` without grouping columns."""
+
+    presorted: Optional[bool] = None
+    """If both sources are sorted by the grouping columns, `None` without grouping columns."""
+
+    memory_budget: Optional[int] = None
+    """The memory budget in bytes."""
+
+    max_workers: int = 1
+    """The number of workers available to the partitioned strategy."""
+
+    estimates: list[StrategyEstimate]
+    """The estimates of all the applicable strategies, the chosen one first."""
+
+    def explain(self) -> str:
+        """
+        Get a human readable description of the plan.
+
+        Returns:
+            str: The description.
+        """
+        lines: list[str] = [
+            f"Comparison of {self.df0_name} ({self.df0_rows} rows) "
+            f"and {self.df1_name} ({self.df1_rows} rows)",
+            f"  comparable columns: {self.number_of_columns}, "
+            f"estimated size: {self.estimated_size} bytes",
+            f"  grouping columns: {self.grouping_columns}, "
+            f"unique keys: {self.keys_unique}, presorted: {self.presorted}",
+            f"  memory budget: {self.memory_budget}, workers: {self.max_workers}",
+            f"Strategy: {self.strategy.value}",
+        ]
+        for estimate in self.estimates:
+            marker: str = "*" if estimate.strategy == self.strategy else " "
+            lines.append(
+                f" {marker} {estimate.strategy.value:<15} cost={estimate.estimated_cost:.0f} "
+                f"memory={estimate.estimated_memory} ({estimate.reason})"
+            )
+        return "\n".join(lines)
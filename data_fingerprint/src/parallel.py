@@ -0,0 +1,291 @@
+import multiprocessing
+import os
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from typing import Any, Optional, Union
+
+import polars as pl
+
+from data_fingerprint.src.checkers import check_inputs
+from data_fingerprint.src.comparator import (
+    _get_hashed_row_differences,
+    _get_row_differences_by_key,
+    _hash_subset,
+    get_column_dtype_differences,
+    get_data_report,
+)
+from data_fingerprint.src.models import DataReport, RowDifference, RowGroupDifference
+from data_fingerprint.src.progress import (
+    CancellationToken,
+    ProgressCallback,
+    report_progress,
+)
+from data_fingerprint.src.utils import convert_to_polars
+
+
+def partition_by_hash(
+    df: pl.DataFrame, key_columns: list[str], number_of_partitions: int
+) -> dict[int, pl.DataFrame]:
+    """
+    Split a dataframe into partitions by `hash(key_columns) % number_of_partitions`.
+
+    Rows with the same values in `key_columns` always land in the same partition,
+    so two dataframes partitioned by the same key columns can be compared partition by partition.
+
+    Args:
+        df (pl.DataFrame): The dataframe to partition.
+        key_columns (list[str]): The columns to hash.
+        number_of_partitions (int): The number of partitions.
+
+    Returns:
+        dict[int, pl.DataFrame]: The non-empty partitions by partition index.
+    """
+    # "hash" is never a column of an input dataframe (see `data_fingerprint.src.checkers`)
+    partition_index: pl.Series = (
+        df.select(sorted(key_columns)).hash_rows() % number_of_partitions
+    ).alias("hash")
+    partitions: dict[tuple, pl.DataFrame] = df.with_columns(
+        partition_index
+    ).partition_by("hash", as_dict=True, include_key=False)
+    return {key[0]: partition for key, partition in partitions.items()}
+
+
+def _compare_partition(
+    df0_partition: pl.DataFrame,
+    df1_partition: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]],
+    unique_key: Optional[bool] = None,
+) -> tuple[
+    list[Union[RowDifference, RowGroupDifference]], Optional[dict[str, list[Any]]]
+]:
+    """
+    Compare one pair of partitions, the partitions must contain only the comparable columns.
+
+    With grouping columns the rows are paired like in :func:`data_compare.src.comparator.get_data_report`
+    (*see* :func:`data_compare.src.comparator._get_row_differences_by_key`).
+
+    Args:
+        df0_partition (pl.DataFrame): The partition of the first dataframe.
+        df1_partition (pl.DataFrame): The partition of the second dataframe.
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        unique_key (Optional[bool]): `True` declares the grouping columns unique in both partitions,
+            `None` detects the duplicated keys and `False` compares all the rows group by group.
+
+    Returns:
+        list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences of the partition.
+
+        Optional[dict[str, list[Any]]]: The keys of the differences found in the duplicated-key groups
+        of the partition, `None` if there are none.
+    """
+    if grouping_columns is None:
+        columns: list[str] = df0_partition.columns
+        return (
+            _get_hashed_row_differences(
+                _hash_subset(df0_partition, columns, df0_name),
+                _hash_subset(df1_partition, columns, df1_name),
+                df0_name,
+                df1_name,
+            ),
+            None,
+        )
+    _, _, row_differences, duplicate_keys = _get_row_differences_by_key(
+        df0_partition,
+        df1_partition,
+        df0_name,
+        df1_name,
+        grouping_columns,
+        unique_key=unique_key,
+    )
+    return row_differences, duplicate_keys
+
+
+def _concat_duplicate_keys(
+    duplicate_keys: list[Optional[dict[str, list[Any]]]],
+) -> Optional[dict[str, list[Any]]]:
+    """
+    Concatenate the duplicated keys of the partitions (*a key is in one partition only*).
+
+    Args:
+        duplicate_keys (list[Optional[dict[str, list[Any]]]]): The duplicated keys of every partition.
+
+    Returns:
+        Optional[dict[str, list[Any]]]: The duplicated keys of all partitions, `None` if there are none.
+    """
+    merged: Optional[dict[str, list[Any]]] = None
+    for keys in duplicate_keys:
+        if keys is None:
+            continue
+        if merged is None:
+            merged = {column: [] for column in keys}
+        for column, values in keys.items():
+            merged[column].extend(values)
+    return merged
+
+
+def _create_executor(max_workers: int, use_processes: bool) -> Executor:
+    """
+    Create the pool that runs the partition comparisons.
+
+    Processes are started with the `spawn` method, forking a process that already runs
+    the polars thread pool can deadlock.
+
+    Args:
+        max_workers (int): The number of workers.
+        use_processes (bool): Use a process pool instead of a thread pool.
+
+    Returns:
+        Executor: The pool.
+    """
+    if use_processes:
+        return ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+@convert_to_polars
+@check_inputs
+def get_data_report_partitioned(
+    df0: pl.DataFrame,
+    df1: pl.DataFrame,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+    number_of_partitions: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> DataReport:
+    """
+    Get a data report comparing two dataframes (*see* :func:`data_compare.src.comparator.get_data_report`),
+    by splitting both dataframes into hash partitions and comparing the partitions in a pool of workers.
+
+    Without grouping columns the rows are partitioned by the hash of all comparable columns
+    (*identical rows land in the same partition*), with grouping columns the rows are partitioned by the hash
+    of the grouping columns (*rows of one group land in the same partition*).
+    That is why the merged report contains exactly the same differences (*and duplicated keys*) as the report of
+    :func:`data_compare.src.comparator.get_data_report`, only the order of the row differences can differ.
+
+    .. note::
+        The per-hash and per-group comparison loops are Python code holding the GIL,
+        so use `use_processes=True` to scale them over CPU cores.
+        The thread pool only helps when the work is dominated by polars operations.
+
+    Example:
+        ```python
+        import polars as pl
+        from data_fingerprint.src.parallel import get_data_report_partitioned
+
+        df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+        df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+        report = get_data_report_partitioned(
+            df0, df1, "df0", "df1", ["a"], number_of_partitions=4, use_processes=True
+        )
+        ```
+
+    Raises:
+        ValueError: If the grouping columns are not comparable in both dataframes.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Args:
+        df0 (pl.DataFrame): The first dataframe.
+        df1 (pl.DataFrame): The second dataframe.
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        number_of_partitions (Optional[int]): The number of partitions, defaults to the number of workers.
+        max_workers (Optional[int]): The number of workers, defaults to the number of CPU cores.
+        use_processes (bool): Compare the partitions in a process pool instead of a thread pool.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the `partitions` stage, number of compared partitions and total number of partitions.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            between compared partitions, the partitions that did not start yet are cancelled.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two dataframes.
+    """
+    same_columns, column_differences = get_column_dtype_differences(
+        df0, df1, df0_name, df1_name
+    )
+    if len(same_columns) == 0:
+        return get_data_report(df0, df1, df0_name, df1_name, grouping_columns)
+
+    if grouping_columns is not None and (
+        len(set(grouping_columns).difference(same_columns)) > 0
+    ):
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+
+    max_workers = max_workers or os.cpu_count() or 1
+    number_of_partitions = number_of_partitions or max_workers
+    key_columns: list[str] = (
+        list(same_columns) if grouping_columns is None else grouping_columns
+    )
+
+    df0_partitions: dict[int, pl.DataFrame] = partition_by_hash(
+        df0.select(same_columns), key_columns, number_of_partitions
+    )
+    df1_partitions: dict[int, pl.DataFrame] = partition_by_hash(
+        df1.select(same_columns), key_columns, number_of_partitions
+    )
+    empty_partition: pl.DataFrame = df0.select(same_columns).clear()
+    partition_indexes: list[int] = sorted(
+        set(df0_partitions.keys()) | set(df1_partitions.keys())
+    )
+
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = []
+    duplicate_keys: list[Optional[dict[str, list[Any]]]] = []
+    with _create_executor(max_workers, use_processes) as executor:
+        futures: list[Future] = [
+            executor.submit(
+                _compare_partition,
+                df0_partitions.get(index, empty_partition),
+                df1_partitions.get(index, empty_partition),
+                df0_name,
+                df1_name,
+                grouping_columns,
+            )
+            for index in partition_indexes
+        ]
+        try:
+            report_progress(
+                progress_callback, cancellation_token, "partitions", 0, len(futures)
+            )
+            for processed, future in enumerate(as_completed(futures), start=1):
+                partition_differences, partition_keys = future.result()
+                row_differences.extend(partition_differences)
+                duplicate_keys.append(partition_keys)
+                report_progress(
+                    progress_callback,
+                    cancellation_token,
+                    "partitions",
+                    processed,
+                    len(futures),
+                )
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return DataReport(
+        df0_length=len(df0),
+        df1_length=len(df1),
+        df0_name=df0_name,
+        df1_name=df1_name,
+        comparable_columns=same_columns,
+        row_differences=row_differences,
+        column_differences=column_differences,
+        duplicate_keys=_concat_duplicate_keys(duplicate_keys),
+    )
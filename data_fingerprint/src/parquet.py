@@ -0,0 +1,585 @@
+import os
+from typing import Iterator, Optional, Union
+
+import numpy as np
+import polars as pl
+import pyarrow.parquet as pq
+
+from data_fingerprint.src.comparator import (
+    _get_hash_counts,
+    _get_hashed_row_differences,
+    _hash_subset,
+    _pair_row_differences,
+    get_data_report,
+)
+from data_fingerprint.src.models import (
+    DataReport,
+    HashSidecar,
+    RowDifference,
+    RowGroupDifference,
+    RowGroupFingerprint,
+)
+from data_fingerprint.src.progress import (
+    CancellationToken,
+    ProgressCallback,
+    track_progress,
+)
+from data_fingerprint.src.schema import get_schema_differences
+from data_fingerprint.src.sidecar import (
+    get_digest,
+    load_sidecar_hashes,
+    read_hash_sidecar,
+    write_hash_sidecar,
+)
+
+
+def _get_differing_hashes(
+    df0_counts: pl.DataFrame, df1_counts: pl.DataFrame
+) -> pl.DataFrame:
+    """
+    Get the hashes that do not have the same number of occurrences in both files.
+
+    Args:
+        df0_counts (pl.DataFrame): The hash counts of the first file.
+        df1_counts (pl.DataFrame): The hash counts of the second file.
+
+    Returns:
+        pl.DataFrame: The dataframe with the differing `hash` column.
+    """
+    return (
+        df0_counts.join(df1_counts, on="hash", how="full", coalesce=True, suffix="_1")
+        .fill_null(0)
+        .filter(pl.col("count") != pl.col("count_1"))
+        .select("hash")
+    )
+
+
+def _read_rows_with_hashes(
+    path: Union[str, os.PathLike],
+    columns: list[str],
+    name: str,
+    hashes: pl.Series,
+    sidecar: HashSidecar,
+    differing_hashes: pl.DataFrame,
+) -> pl.DataFrame:
+    """
+    Read only the row groups of a Parquet file that contain a differing hash
+    (*see* :func:`_iter_row_groups`).
+
+    The hashes are taken from the sidecar, so the rows are not hashed again.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+        columns (list[str]): The compared columns (*sorted by name*).
+        name (str): The name of the file (*value of the `source` column*).
+        hashes (pl.Series): The row hashes loaded from the sidecar.
+        sidecar (:class:`data_compare.src.models.HashSidecar`): The sidecar metadata.
+        differing_hashes (pl.DataFrame): The differing hashes.
+
+    Returns:
+        pl.DataFrame: The hashed subset (*see* :func:`data_compare.src.comparator._hash_subset`)
+        with the rows of the differing hashes.
+    """
+    rows: pl.Series = (
+        pl.DataFrame({"hash": hashes})
+        .with_row_index("row")
+        .join(differing_hashes, on="hash", how="semi")["row"]
+    )
+    row_group_ends: np.ndarray = np.cumsum(
+        [number_of_rows for number_of_rows, _ in sidecar.file_key.row_groups]
+    )
+    row_groups: list[int] = sorted(
+        set(np.searchsorted(row_group_ends, rows.to_numpy(), side="right").tolist())
+    )
+    if len(row_groups) == 0:
+        return pl.DataFrame(schema=pl.read_parquet_schema(path)).select(
+            *columns,
+            pl.Series("hash", [], dtype=pl.UInt64),
+            pl.lit(name).alias("source"),
+        )
+
+    row_group_starts: np.ndarray = np.concatenate([[0], row_group_ends[:-1]])
+    # read with the polars reader that computed the sidecar hashes, so the dtypes (*and hashes*) are the same
+    df: pl.DataFrame = pl.concat(
+        [rows for _, rows in _iter_row_groups(path, columns, row_groups)]
+    )
+    row_group_hashes: pl.Series = pl.concat(
+        [
+            hashes.slice(
+                int(row_group_starts[i]), int(row_group_ends[i] - row_group_starts[i])
+            )
+            for i in row_groups
+        ]
+    )
+    return (
+        df.select(columns)
+        .with_columns(row_group_hashes.alias("hash"), pl.lit(name).alias("source"))
+        .join(differing_hashes, on="hash", how="semi")
+    )
+
+
+def get_parquet_data_report(
+    path0: Union[str, os.PathLike],
+    path1: Union[str, os.PathLike],
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+    write_sidecars: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> DataReport:
+    """
+    Get a data report comparing two Parquet files, using their sidecar hash files when they are valid
+    (*see* :func:`data_compare.src.sidecar.write_hash_sidecar`).
+
+    - If both files have a valid sidecar with the same digest, the files have the same rows and
+      only the metadata of the files and of the sidecars is read.
+    - If a file has a valid sidecar, its precomputed hashes are used and only the row groups
+      containing differing rows are read.
+    - A file without a valid sidecar is read and hashed (*with `write_sidecars=True` the sidecar is written first*).
+
+    The result is the same as :func:`data_compare.src.comparator.get_data_report` on the loaded files.
+
+    Example:
+        ```python
+        from data_fingerprint.src.parquet import get_parquet_data_report
+
+        report = get_parquet_data_report(
+            "data/2024-01-01.parquet", "backup/2024-01-01.parquet", "data", "backup", write_sidecars=True
+        )
+        ```
+
+    Raises:
+        ValueError: If the names are the same or the grouping columns are not comparable in both files.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Args:
+        path0 (Union[str, os.PathLike]): The path of the first Parquet file.
+        path1 (Union[str, os.PathLike]): The path of the second Parquet file.
+        df0_name (str): The name of the first file.
+        df1_name (str): The name of the second file.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        write_sidecars (bool): Write the sidecar of a file that does not have a valid one.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two files.
+    """
+    if df0_name == df1_name:
+        raise ValueError(f"Source name already exists: {df1_name}")
+
+    same_columns, column_differences = get_schema_differences(
+        path0, path1, df0_name, df1_name
+    )
+    if len(same_columns) == 0:
+        return get_data_report(
+            pl.read_parquet(path0),
+            pl.read_parquet(path1),
+            df0_name,
+            df1_name,
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    if grouping_columns is not None and (
+        len(set(grouping_columns).difference(same_columns)) > 0
+    ):
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+    columns: list[str] = sorted(same_columns)
+
+    sidecars: list[Optional[HashSidecar]] = []
+    for path in [path0, path1]:
+        sidecar: Optional[HashSidecar] = read_hash_sidecar(path, columns)
+        if sidecar is None and write_sidecars:
+            sidecar = write_hash_sidecar(path, columns)
+        sidecars.append(sidecar)
+
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = []
+    if not (
+        sidecars[0] is not None
+        and sidecars[1] is not None
+        and sidecars[0].digest == sidecars[1].digest
+    ):
+        # a file without a sidecar is read and hashed once, the hashed rows are kept for the differing hashes
+        hashed: list[Optional[pl.DataFrame]] = [
+            (
+                _hash_subset(pl.read_parquet(path, columns=columns), columns, name)
+                if sidecar is None
+                else None
+            )
+            for path, name, sidecar in zip(
+                [path0, path1], [df0_name, df1_name], sidecars
+            )
+        ]
+        hashes: list[pl.Series] = [
+            (
+                load_sidecar_hashes(path).alias("hash")
+                if path_hashed is None
+                else path_hashed["hash"]
+            )
+            for path, path_hashed in zip([path0, path1], hashed)
+        ]
+        df0_counts, df1_counts = [
+            _get_hash_counts(pl.DataFrame({"hash": h})) for h in hashes
+        ]
+        differing_hashes: pl.DataFrame = _get_differing_hashes(df0_counts, df1_counts)
+
+        subsets: list[pl.DataFrame] = [
+            (
+                _read_rows_with_hashes(
+                    path, columns, name, path_hashes, sidecar, differing_hashes
+                )
+                if path_hashed is None
+                else path_hashed.join(differing_hashes, on="hash", how="semi")
+            )
+            for path, name, sidecar, path_hashes, path_hashed in zip(
+                [path0, path1], [df0_name, df1_name], sidecars, hashes, hashed
+            )
+        ]
+
+        row_differences = _get_hashed_row_differences(
+            subsets[0],
+            subsets[1],
+            df0_name,
+            df1_name,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+            df0_counts=df0_counts,
+            df1_counts=df1_counts,
+        )
+        if grouping_columns is not None:
+            row_differences = _pair_row_differences(
+                row_differences,
+                grouping_columns,
+                progress_callback=progress_callback,
+                cancellation_token=cancellation_token,
+            )
+
+    return DataReport(
+        df0_length=pq.ParquetFile(path0).metadata.num_rows,
+        df1_length=pq.ParquetFile(path1).metadata.num_rows,
+        df0_name=df0_name,
+        df1_name=df1_name,
+        comparable_columns=same_columns,
+        column_differences=column_differences,
+        row_differences=row_differences,
+    )
+
+
+def _get_row_group_offsets(path: Union[str, os.PathLike]) -> list[tuple[int, int]]:
+    """
+    Get the offset and the number of rows of every row group of a Parquet file (*from the footer*).
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+
+    Returns:
+        list[tuple[int, int]]: The offset and the number of rows of every row group.
+    """
+    metadata: pq.FileMetaData = pq.ParquetFile(path).metadata
+    offsets: list[tuple[int, int]] = []
+    offset: int = 0
+    for i in range(metadata.num_row_groups):
+        number_of_rows: int = metadata.row_group(i).num_rows
+        offsets.append((offset, number_of_rows))
+        offset += number_of_rows
+    return offsets
+
+
+def _iter_row_groups(
+    path: Union[str, os.PathLike],
+    columns: list[str],
+    row_groups: list[int],
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> Iterator[tuple[int, pl.DataFrame]]:
+    """
+    Read the columns of some row groups of a Parquet file, one row group at a time.
+
+    The row groups are read as slices of a lazy scan, so only the needed row groups are read
+    and the data types are the same as when the whole file is read.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+        columns (list[str]): The columns to read.
+        row_groups (list[int]): The indices of the row groups.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the `row_groups` stage, number of read row groups and number of row groups to read.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Yields:
+        tuple[int, pl.DataFrame]: The index and the rows of the row group.
+    """
+    offsets: list[tuple[int, int]] = _get_row_group_offsets(path)
+    scan: pl.LazyFrame = pl.scan_parquet(path).select(columns)
+    for i in track_progress(
+        row_groups, "row_groups", progress_callback, cancellation_token
+    ):
+        yield i, scan.slice(*offsets[i]).collect()
+
+
+def get_row_group_fingerprints(
+    path: Union[str, os.PathLike],
+    columns: Optional[list[str]] = None,
+    compute_digests: bool = True,
+) -> list[RowGroupFingerprint]:
+    """
+    Get the fingerprints of the row groups of a Parquet file.
+
+    The statistics are read from the Parquet footer. The digests are taken from a valid sidecar
+    (*see* :func:`data_compare.src.sidecar.write_hash_sidecar`), otherwise they are computed by reading
+    and hashing the row groups (*only with `compute_digests=True`*).
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+        columns (Optional[list[str]]): The fingerprinted columns, all columns by default.
+        compute_digests (bool): Compute the digests that are not available in a sidecar.
+
+    Returns:
+        list[:class:`data_compare.src.models.RowGroupFingerprint`]: The fingerprint of every row group.
+    """
+    if columns is None:
+        columns = pl.read_parquet_schema(path).keys()
+    columns = sorted(columns)
+
+    sidecar: Optional[HashSidecar] = read_hash_sidecar(path, columns)
+    metadata: pq.FileMetaData = pq.ParquetFile(path).metadata
+    fingerprints: list[RowGroupFingerprint] = []
+    for i in range(metadata.num_row_groups):
+        row_group: pq.RowGroupMetaData = metadata.row_group(i)
+        statistics: dict[str, tuple[Optional[str], Optional[str], Optional[int]]] = {}
+        for j in range(row_group.num_columns):
+            column: pq.ColumnChunkMetaData = row_group.column(j)
+            if column.path_in_schema not in columns:
+                continue
+            column_statistics: Optional[pq.Statistics] = column.statistics
+            if column_statistics is None or not column_statistics.has_min_max:
+                statistics[column.path_in_schema] = (None, None, None)
+                continue
+            statistics[column.path_in_schema] = (
+                str(column_statistics.min),
+                str(column_statistics.max),
+                column_statistics.null_count,
+            )
+
+        fingerprints.append(
+            RowGroupFingerprint(
+                index=i,
+                number_of_rows=row_group.num_rows,
+                statistics=statistics,
+                digest=None if sidecar is None else sidecar.row_group_digests[i],
+            )
+        )
+
+    if sidecar is None and compute_digests:
+        _set_digests(path, columns, fingerprints)
+    return fingerprints
+
+
+def _set_digests(
+    path: Union[str, os.PathLike],
+    columns: list[str],
+    fingerprints: list[RowGroupFingerprint],
+) -> None:
+    """
+    Compute the missing digests of row group fingerprints by reading and hashing the row groups.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+        columns (list[str]): The fingerprinted columns (*sorted by name*).
+        fingerprints (list[:class:`data_compare.src.models.RowGroupFingerprint`]): The fingerprints to update.
+
+    Returns:
+        None
+    """
+    missing: dict[int, RowGroupFingerprint] = {
+        fingerprint.index: fingerprint
+        for fingerprint in fingerprints
+        if fingerprint.digest is None
+    }
+    for i, df in _iter_row_groups(path, columns, list(missing.keys())):
+        missing[i].digest = get_digest(df.hash_rows())
+
+
+def match_row_groups(
+    path0: Union[str, os.PathLike],
+    path1: Union[str, os.PathLike],
+    columns: list[str],
+) -> list[tuple[int, int]]:
+    """
+    Match the identical row groups of two Parquet files.
+
+    Row groups are candidates for a match when they have the same number of rows and the same statistics
+    (*read from the footers only*). The digests are computed only for the candidates (*or taken from the sidecars*),
+    and candidates with the same digest are matched. Every row group is matched at most once.
+
+    Args:
+        path0 (Union[str, os.PathLike]): The path of the first Parquet file.
+        path1 (Union[str, os.PathLike]): The path of the second Parquet file.
+        columns (list[str]): The compared columns.
+
+    Returns:
+        list[tuple[int, int]]: The indices of the matched row groups of the first and of the second file.
+    """
+    fingerprints: list[list[RowGroupFingerprint]] = [
+        get_row_group_fingerprints(path, columns, compute_digests=False)
+        for path in [path0, path1]
+    ]
+
+    # the statistics are read from the footers, the digests are computed only for the candidates
+    keys: list[list[str]] = [
+        [
+            repr((fingerprint.number_of_rows, sorted(fingerprint.statistics.items())))
+            for fingerprint in side
+        ]
+        for side in fingerprints
+    ]
+    candidate_keys: set[str] = set(keys[0]) & set(keys[1])
+    for path, side, side_keys in zip([path0, path1], fingerprints, keys):
+        _set_digests(
+            path,
+            sorted(columns),
+            [
+                fingerprint
+                for fingerprint, key in zip(side, side_keys)
+                if key in candidate_keys
+            ],
+        )
+
+    unmatched: dict[tuple[str, Optional[str]], list[int]] = {}
+    for fingerprint, key in zip(fingerprints[1], keys[1]):
+        if key in candidate_keys:
+            unmatched.setdefault((key, fingerprint.digest), []).append(
+                fingerprint.index
+            )
+
+    matches: list[tuple[int, int]] = []
+    for fingerprint, key in zip(fingerprints[0], keys[0]):
+        candidates: list[int] = unmatched.get((key, fingerprint.digest), [])
+        if key in candidate_keys and len(candidates) > 0:
+            matches.append((fingerprint.index, candidates.pop(0)))
+    return matches
+
+
+def get_parquet_data_report_by_row_groups(
+    path0: Union[str, os.PathLike],
+    path1: Union[str, os.PathLike],
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> DataReport:
+    """
+    Get a data report comparing two Parquet files that mostly share row groups
+    (*for example after an append or a small update*).
+
+    The identical row groups are matched by :func:`match_row_groups` and skipped,
+    only the rows of the row groups without a match are read and compared.
+    Since the skipped row groups contain the same rows on both sides, the result is the same as
+    :func:`data_compare.src.comparator.get_data_report` on the loaded files.
+
+    Example:
+        ```python
+        from data_fingerprint.src.parquet import get_parquet_data_report_by_row_groups
+
+        report = get_parquet_data_report_by_row_groups(
+            "data/orders.parquet", "backup/orders.parquet", "data", "backup", ["order_id"]
+        )
+        ```
+
+    Raises:
+        ValueError: If the names are the same or the grouping columns are not comparable in both files.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Args:
+        path0 (Union[str, os.PathLike]): The path of the first Parquet file.
+        path1 (Union[str, os.PathLike]): The path of the second Parquet file.
+        df0_name (str): The name of the first file.
+        df1_name (str): The name of the second file.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is also
+            called with the `row_groups` stage while the unmatched row groups are read.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two files.
+    """
+    if df0_name == df1_name:
+        raise ValueError(f"Source name already exists: {df1_name}")
+
+    same_columns, column_differences = get_schema_differences(
+        path0, path1, df0_name, df1_name
+    )
+    if len(same_columns) == 0:
+        return get_data_report(
+            pl.read_parquet(path0),
+            pl.read_parquet(path1),
+            df0_name,
+            df1_name,
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    if grouping_columns is not None and (
+        len(set(grouping_columns).difference(same_columns)) > 0
+    ):
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+    columns: list[str] = sorted(same_columns)
+
+    matches: list[tuple[int, int]] = match_row_groups(path0, path1, columns)
+    subsets: list[pl.DataFrame] = []
+    for side, (path, name) in enumerate([(path0, df0_name), (path1, df1_name)]):
+        matched: set[int] = {match[side] for match in matches}
+        row_groups: list[int] = [
+            i
+            for i in range(pq.ParquetFile(path).metadata.num_row_groups)
+            if i not in matched
+        ]
+        frames: list[pl.DataFrame] = [
+            df
+            for _, df in _iter_row_groups(
+                path, columns, row_groups, progress_callback, cancellation_token
+            )
+        ]
+        unmatched_rows: pl.DataFrame = (
+            pl.concat(frames)
+            if len(frames) > 0
+            else pl.scan_parquet(path).select(columns).head(0).collect()
+        )
+        subsets.append(_hash_subset(unmatched_rows, columns, name))
+
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = (
+        _get_hashed_row_differences(
+            subsets[0],
+            subsets[1],
+            df0_name,
+            df1_name,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    )
+    if grouping_columns is not None:
+        row_differences = _pair_row_differences(
+            row_differences,
+            grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+
+    return DataReport(
+        df0_length=pq.ParquetFile(path0).metadata.num_rows,
+        df1_length=pq.ParquetFile(path1).metadata.num_rows,
+        df0_name=df0_name,
+        df1_name=df1_name,
+        comparable_columns=same_columns,
+        column_differences=column_differences,
+        row_differences=row_differences,
+    )
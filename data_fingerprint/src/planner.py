@@ -0,0 +1,350 @@
+import os
+from typing import Optional
+
+import polars as pl
+
+from data_fingerprint.src.comparator import _run_sides, get_data_report
+from data_fingerprint.src.difference_types import ExecutionStrategy
+from data_fingerprint.src.memory import MEMORY_FACTOR
+from data_fingerprint.src.models import ComparisonPlan, DataReport, StrategyEstimate
+from data_fingerprint.src.parallel import get_data_report_partitioned
+from data_fingerprint.src.parquet import get_parquet_data_report
+from data_fingerprint.src.progress import CancellationToken, ProgressCallback
+from data_fingerprint.src.scan import (
+    InputSource,
+    collect_source,
+    estimate_source_size,
+    is_parquet_path,
+    scan_source,
+)
+from data_fingerprint.src.schema import get_schema_differences
+from data_fingerprint.src.sort_merge import is_sorted_by
+from data_fingerprint.src.spill import get_data_report_spilled
+
+HASH_BYTES_PER_ROW: int = 16
+"""The estimated memory of one row hash with its count."""
+
+SORT_MERGE_COST_PER_CELL: float = 0.5
+"""The cost of one value compared by the sort-merge strategy, relative to hashing it."""
+
+PARTITION_COST_PER_CELL: float = 0.3
+"""The cost of moving one value into its partition, relative to hashing it."""
+
+PROCESS_STARTUP_COST: float = 5_000_000
+"""The cost of starting one worker process (*and sending it its partitions*)."""
+
+PARQUET_HASHES_COST_PER_CELL: float = 1.2
+"""The cost of one value hashed while streaming a Parquet file, relative to hashing it in memory
+(*the differing rows are read again*)."""
+
+SPILL_COST_PER_CELL: float = 1.0
+"""The cost of writing one value to a spilled partition and reading it back, relative to hashing it."""
+
+DUPLICATE_KEY_COST_PER_CELL: float = 1.0
+"""The extra cost of one value paired group by group because the grouping columns are not unique,
+relative to hashing it (*unique keys are paired with one join*)."""
+
+
+def _get_key_statistics(
+    lazy_frame: pl.LazyFrame, grouping_columns: list[str]
+) -> tuple[bool, bool]:
+    keys: pl.DataFrame = lazy_frame.select(grouping_columns).collect()
+    return keys.n_unique() == len(keys), is_sorted_by(keys, grouping_columns)
+
+
+def _get_estimates(
+    rows: int,
+    number_of_columns: int,
+    estimated_size: int,
+    presorted: Optional[bool],
+    keys_unique: Optional[bool],
+    parquet_paths: bool,
+    max_workers: int,
+    memory_budget: Optional[int],
+) -> list[StrategyEstimate]:
+    cells: int = rows * max(number_of_columns, 1)
+    # the hash based strategies pair the rows of duplicated keys group by group
+    pairing_cost: float = (
+        DUPLICATE_KEY_COST_PER_CELL * cells if keys_unique is False else 0
+    )
+    estimates: list[StrategyEstimate] = [
+        StrategyEstimate(
+            strategy=ExecutionStrategy.HASH,
+            estimated_cost=cells + pairing_cost,
+            estimated_memory=MEMORY_FACTOR * estimated_size,
+            reason="hashes every value of both loaded sources",
+        )
+    ]
+    if presorted:
+        estimates.append(
+            StrategyEstimate(
+                strategy=ExecutionStrategy.SORT_MERGE,
+                estimated_cost=SORT_MERGE_COST_PER_CELL * cells,
+                estimated_memory=estimated_size,
+                reason="both sources are sorted by the grouping columns",
+            )
+        )
+    if max_workers > 1:
+        estimates.append(
+            StrategyEstimate(
+                strategy=ExecutionStrategy.PARTITIONED,
+                estimated_cost=PARTITION_COST_PER_CELL * cells
+                + (cells + pairing_cost) / max_workers
+                + PROCESS_STARTUP_COST * max_workers,
+                estimated_memory=(MEMORY_FACTOR + 1) * estimated_size,
+                reason=f"hashes the partitions in {max_workers} processes",
+            )
+        )
+    if parquet_paths:
+        estimates.append(
+            StrategyEstimate(
+                strategy=ExecutionStrategy.PARQUET_HASHES,
+                estimated_cost=PARQUET_HASHES_COST_PER_CELL * cells + pairing_cost,
+                # the files are read in full to hash them (*unless they have sidecars*)
+                estimated_memory=estimated_size + HASH_BYTES_PER_ROW * rows,
+                reason="hashes the Parquet files and reads back only the differing rows",
+            )
+        )
+    if memory_budget is not None:
+        estimates.append(
+            StrategyEstimate(
+                strategy=ExecutionStrategy.SPILL,
+                estimated_cost=(1 + SPILL_COST_PER_CELL) * cells + pairing_cost,
+                estimated_memory=min(memory_budget, MEMORY_FACTOR * estimated_size),
+                reason="spills hash partitions to disk and compares them one pair at a time",
+            )
+        )
+    return estimates
+
+
+def plan_comparison(
+    df0: InputSource,
+    df1: InputSource,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+    memory_budget: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> ComparisonPlan:
+    """
+    Plan a comparison of two sources without running it.
+
+    The planner reads the schemas, the row counts and the estimated sizes of the sources
+    (*and the grouping columns, to check if they are unique and sorted*), estimates the cost and the peak memory
+    of every applicable :class:`data_compare.src.difference_types.ExecutionStrategy` and picks the cheapest
+    strategy that fits into the memory budget (*or the one with the lowest memory if none fits*).
+    Duplicated grouping keys make the hash based strategies more expensive, as their rows are paired
+    group by group. The costs are rough estimates in hashed-cell units, they are meant to rank the strategies,
+    not to predict the run time.
+
+    Example:
+        ```python
+        from data_fingerprint.src.planner import execute_plan, plan_comparison
+
+        plan = plan_comparison("data/orders.parquet", "backup/orders.parquet", "data", "backup", ["id"])
+        print(plan.explain())
+        report = execute_plan(plan, "data/orders.parquet", "backup/orders.parquet")
+        ```
+
+    Raises:
+        ValueError: If the source names are the same.
+
+    Args:
+        df0 (:data:`data_compare.src.scan.InputSource`): The first source.
+        df1 (:data:`data_compare.src.scan.InputSource`): The second source.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        memory_budget (Optional[int]): The memory budget in bytes, unlimited by default.
+        max_workers (Optional[int]): The number of workers, defaults to the number of CPU cores.
+
+    Returns:
+        :class:`data_compare.src.models.ComparisonPlan`: The plan.
+    """
+    if df0_name == df1_name:
+        raise ValueError(f"Source name already exists: {df1_name}")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    lazy_frames: list[pl.LazyFrame] = [scan_source(df0), scan_source(df1)]
+    same_columns, _ = get_schema_differences(
+        lazy_frames[0].collect_schema(),
+        lazy_frames[1].collect_schema(),
+        df0_name,
+        df1_name,
+    )
+    rows: list[int] = [
+        (
+            len(source)
+            if isinstance(source, pl.DataFrame)
+            else lf.select(pl.len()).collect().item()
+        )
+        for source, lf in zip([df0, df1], lazy_frames)
+    ]
+    estimated_size: int = sum(
+        estimate_source_size(source, source_rows, len(same_columns))
+        for source, source_rows in zip([df0, df1], rows)
+    )
+
+    keys_unique: Optional[bool] = None
+    presorted: Optional[bool] = None
+    if grouping_columns is not None and set(grouping_columns).issubset(same_columns):
+        statistics: list[tuple[bool, bool]] = [
+            _get_key_statistics(lf, grouping_columns) for lf in lazy_frames
+        ]
+        keys_unique = all(unique for unique, _ in statistics)
+        presorted = all(is_sorted for _, is_sorted in statistics)
+
+    estimates: list[StrategyEstimate] = _get_estimates(
+        sum(rows),
+        len(same_columns),
+        estimated_size,
+        presorted,
+        keys_unique,
+        is_parquet_path(df0) and is_parquet_path(df1),
+        max_workers,
+        memory_budget,
+    )
+    fitting: list[StrategyEstimate] = [
+        estimate
+        for estimate in estimates
+        if memory_budget is None or estimate.estimated_memory <= memory_budget
+    ]
+    chosen: StrategyEstimate = (
+        min(fitting, key=lambda estimate: estimate.estimated_cost)
+        if len(fitting) > 0
+        else min(estimates, key=lambda estimate: estimate.estimated_memory)
+    )
+    return ComparisonPlan(
+        df0_name=df0_name,
+        df1_name=df1_name,
+        grouping_columns=grouping_columns,
+        strategy=chosen.strategy,
+        df0_rows=rows[0],
+        df1_rows=rows[1],
+        number_of_columns=len(same_columns),
+        estimated_size=estimated_size,
+        keys_unique=keys_unique,
+        presorted=presorted,
+        memory_budget=memory_budget,
+        max_workers=max_workers,
+        estimates=[chosen]
+        + sorted(
+            [estimate for estimate in estimates if estimate is not chosen],
+            key=lambda estimate: estimate.estimated_cost,
+        ),
+    )
+
+
+def execute_plan(
+    plan: ComparisonPlan,
+    df0: InputSource,
+    df1: InputSource,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> DataReport:
+    """
+    Run a planned comparison (*see* :func:`plan_comparison`) with its chosen strategy.
+
+    Args:
+        plan (:class:`data_compare.src.models.ComparisonPlan`): The plan.
+        df0 (:data:`data_compare.src.scan.InputSource`): The first source (*the one the plan was made for*).
+        df1 (:data:`data_compare.src.scan.InputSource`): The second source (*the one the plan was made for*).
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two sources.
+    """
+    if plan.strategy == ExecutionStrategy.PARQUET_HASHES:
+        return get_parquet_data_report(
+            df0,
+            df1,
+            plan.df0_name,
+            plan.df1_name,
+            plan.grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    if plan.strategy == ExecutionStrategy.SPILL:
+        return get_data_report_spilled(
+            df0,
+            df1,
+            plan.df0_name,
+            plan.df1_name,
+            plan.grouping_columns,
+            memory_limit=plan.memory_budget,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+
+    if plan.strategy == ExecutionStrategy.SORT_MERGE:
+        # the sort-merge engine streams the sources, so they are not loaded here
+        return get_data_report(
+            scan_source(df0),
+            scan_source(df1),
+            plan.df0_name,
+            plan.df1_name,
+            plan.grouping_columns,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+            presorted=True,
+        )
+
+    df0, df1 = _run_sides(
+        lambda: collect_source(df0), lambda: collect_source(df1), concurrent=True
+    )
+    if plan.strategy == ExecutionStrategy.PARTITIONED:
+        return get_data_report_partitioned(
+            df0,
+            df1,
+            plan.df0_name,
+            plan.df1_name,
+            plan.grouping_columns,
+            max_workers=plan.max_workers,
+            use_processes=True,
+            progress_callback=progress_callback,
+            cancellation_token=cancellation_token,
+        )
+    return get_data_report(
+        df0,
+        df1,
+        plan.df0_name,
+        plan.df1_name,
+        plan.grouping_columns,
+        progress_callback=progress_callback,
+        cancellation_token=cancellation_token,
+    )
+
+
+def get_data_report_planned(
+    df0: InputSource,
+    df1: InputSource,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+    memory_budget: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> DataReport:
+    """
+    Get a data report comparing two sources with the strategy chosen by :func:`plan_comparison`.
+
+    Args:
+        df0 (:data:`data_compare.src.scan.InputSource`): The first source.
+        df1 (:data:`data_compare.src.scan.InputSource`): The second source.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        memory_budget (Optional[int]): The memory budget in bytes, unlimited by default.
+        max_workers (Optional[int]): The number of workers, defaults to the number of CPU cores.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): The progress callback.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): The cancellation token.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two sources.
+    """
+    plan: ComparisonPlan = plan_comparison(
+        df0, df1, df0_name, df1_name, grouping_columns, memory_budget, max_workers
+    )
+    return execute_plan(plan, df0, df1, progress_callback, cancellation_token)
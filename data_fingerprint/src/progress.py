@@ -0,0 +1,134 @@
+import threading
+from typing import Callable, Collection, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+ProgressCallback = Callable[[str, int, int], None]
+"""
+Callback for progress reporting, called with the stage name,
+the number of processed items and the total number of items in the stage.
+"""
+
+
+class ComparisonCancelledError(Exception):
+    """
+    Raised when a comparison is cancelled through a :class:`CancellationToken`.
+    """
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation token for long running comparisons.
+
+    The token is thread safe, so it can be cancelled from another thread (*for example an UI thread*)
+    while the comparison is running. The comparison checks the token between processed items
+    and raises :class:`ComparisonCancelledError` as soon as it sees that the token was cancelled.
+
+    Example:
+        ```python
+        from data_fingerprint.src.progress import CancellationToken
+
+        token = CancellationToken()
+        # in some other thread
+        token.cancel()
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._event: threading.Event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Request the cancellation of the comparison.
+
+        Returns:
+            None
+        """
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """`True` if the cancellation was requested."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise :class:`ComparisonCancelledError` if the cancellation was requested.
+
+        Raises:
+            ComparisonCancelledError: If the cancellation was requested.
+
+        Returns:
+            None
+        """
+        if self.is_cancelled:
+            raise ComparisonCancelledError("The comparison was cancelled.")
+
+
+def report_progress(
+    progress_callback: Optional[ProgressCallback],
+    cancellation_token: Optional[CancellationToken],
+    stage: str,
+    processed: int,
+    total: int,
+) -> None:
+    """
+    Check the cancellation token and report the progress of a stage.
+
+    Both the callback and the token are optional, if they are `None` nothing happens.
+
+    Args:
+        progress_callback (Optional[ProgressCallback]): The callback to report the progress to.
+        cancellation_token (Optional[CancellationToken]): The token to check.
+        stage (str): The name of the stage.
+        processed (int): The number of processed items in the stage.
+        total (int): The total number of items in the stage.
+
+    Raises:
+        ComparisonCancelledError: If the cancellation was requested.
+
+    Returns:
+        None
+    """
+    if cancellation_token is not None:
+        cancellation_token.raise_if_cancelled()
+
+    if progress_callback is not None:
+        progress_callback(stage, processed, total)
+
+
+def track_progress(
+    items: Collection[T],
+    stage: str,
+    progress_callback: Optional[ProgressCallback],
+    cancellation_token: Optional[CancellationToken],
+) -> Iterator[T]:
+    """
+    Iterate over the items of a stage while reporting the progress and checking the cancellation token.
+
+    The progress is reported before every item (*with the number of already processed items*)
+    and once more after the last item.
+
+    Example:
+        ```python
+        for item in track_progress(items, "stage", print, None):
+            ...
+        ```
+
+    Args:
+        items (Collection[T]): The items of the stage.
+        stage (str): The name of the stage.
+        progress_callback (Optional[ProgressCallback]): The callback to report the progress to.
+        cancellation_token (Optional[CancellationToken]): The token to check.
+
+    Raises:
+        ComparisonCancelledError: If the cancellation was requested.
+
+    Returns:
+        Iterator[T]: The items.
+    """
+    total: int = len(items)
+    for processed, item in enumerate(items):
+        report_progress(progress_callback, cancellation_token, stage, processed, total)
+        yield item
+    report_progress(progress_callback, cancellation_token, stage, total, total)
@@ -0,0 +1,262 @@
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import polars as pl
+import pyarrow.parquet as pq
+
+from data_fingerprint.src.checkers import check_reserved_columns
+from data_fingerprint.src.schema import IPC_SUFFIXES, PARQUET_SUFFIXES
+
+InputSource = Union[pl.DataFrame, pl.LazyFrame, str, os.PathLike]
+"""A dataframe, a lazy frame or the path of a Parquet, Arrow IPC, CSV or NDJSON file."""
+
+RowFilter = Union[pl.Expr, tuple[Optional[pl.Expr], Optional[pl.Expr]]]
+"""A filter expression for both sources or a tuple with a filter expression (*or `None`*) per source."""
+
+NDJSON_SUFFIXES: tuple[str, ...] = (".ndjson", ".jsonl")
+"""The suffixes of newline-delimited JSON files."""
+
+BYTES_PER_VALUE: int = 8
+"""The estimated in-memory size of one value of a source whose size is not known."""
+
+
+def scan_source(source: InputSource) -> pl.LazyFrame:
+    """
+    Get a lazy frame of a source, files are scanned lazily so nothing is read yet.
+
+    Raises:
+        ValueError: If the source is a file of unknown format or not a supported object.
+
+    Args:
+        source (:data:`InputSource`): The source.
+
+    Returns:
+        pl.LazyFrame: The lazy frame.
+    """
+    if isinstance(source, pl.LazyFrame):
+        return source
+    if isinstance(source, pl.DataFrame):
+        return source.lazy()
+    if isinstance(source, (str, os.PathLike)):
+        suffix: str = Path(source).suffix.lower()
+        if suffix in PARQUET_SUFFIXES:
+            return pl.scan_parquet(source)
+        if suffix in IPC_SUFFIXES:
+            return pl.scan_ipc(source)
+        if suffix == ".csv":
+            return pl.scan_csv(source)
+        if suffix in NDJSON_SUFFIXES:
+            return pl.scan_ndjson(source)
+        raise ValueError(f"Unknown file format of {source}, it can not be scanned.")
+    raise ValueError(f"{type(source)} can not be scanned.")
+
+
+def get_projection(
+    columns: list[str],
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+) -> list[str]:
+    """
+    Get the columns that are kept after including and excluding columns (*in the original order*).
+
+    Included columns that are not in `columns` are ignored, so they are still reported as missing columns
+    when only one of the compared dataframes has them.
+
+    Args:
+        columns (list[str]): The columns of the dataframe.
+        include_columns (Optional[list[str]]): The columns to keep, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns to drop.
+
+    Returns:
+        list[str]: The kept columns.
+    """
+    included: set[str] = set(columns if include_columns is None else include_columns)
+    excluded: set[str] = set(exclude_columns or [])
+    return [
+        column for column in columns if column in included and column not in excluded
+    ]
+
+
+def get_side_filters(
+    row_filter: Optional[RowFilter],
+) -> tuple[Optional[pl.Expr], Optional[pl.Expr]]:
+    """
+    Split a row filter into the filters of the first and of the second source.
+
+    Raises:
+        ValueError: If the row filter is a tuple that does not have exactly two items.
+
+    Args:
+        row_filter (Optional[:data:`RowFilter`]): The row filter.
+
+    Returns:
+        Optional[pl.Expr]: The filter of the first source.
+
+        Optional[pl.Expr]: The filter of the second source.
+    """
+    if row_filter is None or isinstance(row_filter, pl.Expr):
+        return row_filter, row_filter
+    if len(row_filter) != 2:
+        raise ValueError(
+            f"Row filter must be an expression or a tuple of two expressions, got {row_filter}."
+        )
+    return row_filter[0], row_filter[1]
+
+
+def collect_source(
+    source: InputSource,
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+    row_filter: Optional[pl.Expr] = None,
+) -> pl.DataFrame:
+    """
+    Load a source with the row filter and the column projection applied as early as possible.
+
+    For lazy frames and files the filter and the projection are pushed into the scan, so only the rows
+    matching the filter (*as far as the scan can skip them*) and the kept columns are read.
+    The filter can use the excluded columns. Loaded dataframes are only filtered and projected.
+
+    Raises:
+        ValueError: If a scanned source has a column named `hash` or `source` after the projection.
+
+    Args:
+        source (:data:`InputSource`): The source.
+        include_columns (Optional[list[str]]): The columns to keep, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns to drop.
+        row_filter (Optional[pl.Expr]): The filter of the rows to keep.
+
+    Returns:
+        pl.DataFrame: The loaded dataframe.
+    """
+    if isinstance(source, pl.DataFrame):
+        if row_filter is not None:
+            source = source.filter(row_filter)
+        if include_columns is None and exclude_columns is None:
+            return source
+        return source.select(
+            get_projection(source.columns, include_columns, exclude_columns)
+        )
+
+    return scan_projected(
+        source, include_columns, exclude_columns, row_filter
+    ).collect()
+
+
+def scan_projected(
+    source: InputSource,
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+    row_filter: Optional[pl.Expr] = None,
+) -> pl.LazyFrame:
+    """
+    Get a lazy frame of a source with the row filter and the column projection in its plan
+    (*see* :func:`collect_source`), nothing is read yet.
+
+    Raises:
+        ValueError: If the projected source has a column named `hash` or `source`
+            (*see* :func:`data_compare.src.checkers.check_reserved_columns`).
+
+    Args:
+        source (:data:`InputSource`): The source.
+        include_columns (Optional[list[str]]): The columns to keep, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns to drop.
+        row_filter (Optional[pl.Expr]): The filter of the rows to keep.
+
+    Returns:
+        pl.LazyFrame: The lazy frame.
+    """
+    lazy_frame: pl.LazyFrame = scan_source(source)
+    columns: list[str] = get_projection(
+        lazy_frame.collect_schema().names(), include_columns, exclude_columns
+    )
+    if row_filter is not None:
+        lazy_frame = lazy_frame.filter(row_filter)
+    lazy_frame = lazy_frame.select(columns)
+    check_reserved_columns(lazy_frame)
+    return lazy_frame
+
+
+def is_parquet_path(source: InputSource) -> bool:
+    """
+    Check if a source is the path of a Parquet file.
+
+    Args:
+        source (:data:`InputSource`): The source.
+
+    Returns:
+        bool: `True` if the source is the path of a Parquet file.
+    """
+    return (
+        isinstance(source, (str, os.PathLike))
+        and Path(source).suffix.lower() in PARQUET_SUFFIXES
+    )
+
+
+def get_metadata_row_count(source: InputSource) -> Optional[int]:
+    """
+    Get the number of rows of a source without reading its rows.
+
+    Args:
+        source (:data:`InputSource`): The source.
+
+    Returns:
+        Optional[int]: The length of a `polars.DataFrame` or the number of rows in the footer of a Parquet file,
+        `None` for the other sources.
+    """
+    if isinstance(source, pl.DataFrame):
+        return len(source)
+    if is_parquet_path(source):
+        return pq.ParquetFile(source).metadata.num_rows
+    return None
+
+
+def estimate_source_size(
+    source: InputSource,
+    rows: int,
+    number_of_columns: int,
+    columns: Optional[list[str]] = None,
+) -> int:
+    """
+    Estimate the in-memory size (*in bytes*) of a source without loading it.
+
+    - for `polars.DataFrame` the estimated size of the dataframe is returned
+    - for Parquet files the uncompressed size of the row groups is read from the footer
+    - for the other sources :data:`BYTES_PER_VALUE` per value is assumed
+
+    The sizes of dataframes and Parquet files are scaled to `rows` (*for example the number of filtered rows*).
+
+    Args:
+        source (:data:`InputSource`): The source.
+        rows (int): The number of rows of the source.
+        number_of_columns (int): The number of loaded columns of the source.
+        columns (Optional[list[str]]): The loaded columns, all columns if `None`.
+
+    Returns:
+        int: The estimated size.
+    """
+    if isinstance(source, pl.DataFrame):
+        size: int = int(
+            (source if columns is None else source.select(columns)).estimated_size("b")
+        )
+        return size if len(source) == 0 else int(size * rows / len(source))
+    if is_parquet_path(source):
+        metadata: pq.FileMetaData = pq.ParquetFile(source).metadata
+        if columns is None:
+            size = sum(
+                metadata.row_group(index).total_byte_size
+                for index in range(metadata.num_row_groups)
+            )
+        else:
+            loaded: set[str] = set(columns)
+            size = sum(
+                row_group.column(column).total_uncompressed_size
+                for row_group in (
+                    metadata.row_group(index)
+                    for index in range(metadata.num_row_groups)
+                )
+                for column in range(row_group.num_columns)
+                if row_group.column(column).path_in_schema.split(".")[0] in loaded
+            )
+        return size if metadata.num_rows == 0 else int(size * rows / metadata.num_rows)
+    return rows * number_of_columns * BYTES_PER_VALUE
@@ -0,0 +1,207 @@
+import os
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+import polars as pl
+
+from data_fingerprint.src.models import ColumnDifference
+from data_fingerprint.src.difference_types import (
+    ColumnNameDifferenceType,
+    ColumnDataTypeDifferenceType,
+)
+
+SchemaSource = Union[
+    pl.Schema,
+    dict[str, pl.DataType],
+    pl.DataFrame,
+    pl.LazyFrame,
+    pd.DataFrame,
+    str,
+    os.PathLike,
+]
+"""Anything the schema can be taken from without loading the data (*except `pandas.DataFrame`*)."""
+
+PARQUET_SUFFIXES: tuple[str, ...] = (".parquet", ".pq")
+"""The file suffixes read as Parquet files."""
+
+IPC_SUFFIXES: tuple[str, ...] = (".arrow", ".ipc", ".feather")
+"""The file suffixes read as Arrow IPC files."""
+
+
+def get_schema(source: SchemaSource) -> pl.Schema:
+    """
+    Get the schema of a dataframe, lazy frame or file without loading the data.
+
+    - `polars.Schema` and dictionaries are returned as a schema
+    - for `polars.DataFrame` the schema is taken, for `polars.LazyFrame` it is resolved with `collect_schema`
+    - for Parquet and Arrow IPC files only the footer is read
+    - `pandas.DataFrame` is converted to polars (*with the data types polars would use*)
+
+    Raises:
+        ValueError: If the source is a file of unknown format or not a supported object.
+
+    Args:
+        source (:data:`SchemaSource`): The source of the schema.
+
+    Returns:
+        pl.Schema: The schema.
+    """
+    if isinstance(source, pl.Schema):
+        return source
+    if isinstance(source, dict):
+        return pl.Schema(source)
+    if isinstance(source, pl.DataFrame):
+        return source.schema
+    if isinstance(source, pl.LazyFrame):
+        return source.collect_schema()
+    if isinstance(source, pd.DataFrame):
+        return pl.from_pandas(source).schema
+    if isinstance(source, (str, os.PathLike)):
+        suffix: str = Path(source).suffix.lower()
+        if suffix in PARQUET_SUFFIXES:
+            return pl.Schema(pl.read_parquet_schema(source))
+        if suffix in IPC_SUFFIXES:
+            return pl.Schema(pl.read_ipc_schema(source))
+        raise ValueError(
+            f"Unknown file format of {source}, the schema can not be read."
+        )
+    raise ValueError(f"The schema can not be taken from {type(source)}.")
+
+
+def get_schema_name_differences(
+    schema0: SchemaSource, schema1: SchemaSource, df0_name: str, df1_name: str
+) -> tuple[set[str], list[ColumnDifference]]:
+    """
+    Get the differences in column names between two schemas
+    (*see* :func:`data_compare.src.comparator.get_column_name_differences`).
+
+    Args:
+        schema0 (:data:`SchemaSource`): The first schema.
+        schema1 (:data:`SchemaSource`): The second schema.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+
+    Returns:
+        set[str]: The column names that are the same in both schemas.
+
+        list[:class:`data_compare.src.models.ColumnDifference`]: The differences in column names.
+    """
+    column_names_0 = set(get_schema(schema0).names())
+    column_names_1 = set(get_schema(schema1).names())
+
+    # Extra columns are columns in df0 that are not in df1
+    extra_columns = column_names_0 - column_names_1
+    # Missing columns are columns in df1 that are not in df0
+    missing_columns = column_names_1 - column_names_0
+
+    same_columns = column_names_0 & column_names_1
+
+    column_differences: list[ColumnDifference] = []
+    for missing_col in missing_columns:
+        column_differences.append(
+            ColumnDifference(
+                source=df0_name,
+                column_name=missing_col,
+                difference_type=ColumnNameDifferenceType.MISSING,
+            )
+        )
+    for extra_col in extra_columns:
+        column_differences.append(
+            ColumnDifference(
+                source=df0_name,
+                column_name=extra_col,
+                difference_type=ColumnNameDifferenceType.EXTRA,
+            )
+        )
+    return same_columns, column_differences
+
+
+def get_schema_differences(
+    schema0: SchemaSource, schema1: SchemaSource, df0_name: str, df1_name: str
+) -> tuple[list[str], list[ColumnDifference]]:
+    """
+    Get the differences in column names and types between two schemas, without loading any data
+    (*see* :func:`data_compare.src.comparator.get_column_dtype_differences`).
+
+    The time zones and time precisions of `pl.Datetime` columns are taken from the data types.
+
+    Example:
+        ```python
+        from data_fingerprint.src.schema import get_schema_differences
+
+        same_columns, column_differences = get_schema_differences(
+            "data/orders.parquet", "backup/orders.parquet", "data", "backup"
+        )
+        ```
+
+    Raises:
+        ValueError: If a schema can not be read (*see* :func:`get_schema`).
+
+    Args:
+        schema0 (:data:`SchemaSource`): The first schema.
+        schema1 (:data:`SchemaSource`): The second schema.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+
+    Returns:
+        list[str]: The names of the columns that have the same type in both schemas.
+
+        list[:class:`data_compare.src.models.ColumnDifference`]: The differences in column names and types.
+    """
+    schema0 = get_schema(schema0)
+    schema1 = get_schema(schema1)
+    same_columns, column_differences = get_schema_name_differences(
+        schema0, schema1, df0_name, df1_name
+    )
+
+    same_columns_after_dtype_check: list[str] = []
+    for same_col in same_columns:
+        dtype0: pl.DataType = schema0[same_col]
+        dtype1: pl.DataType = schema1[same_col]
+        if type(dtype0) is not type(dtype1):
+            column_differences.append(
+                ColumnDifference(
+                    source=df0_name,
+                    column_name=same_col,
+                    difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TYPE,
+                    more_information={
+                        df0_name: f"{type(dtype0)}",
+                        df1_name: f"{type(dtype1)}",
+                    },
+                )
+            )
+            continue
+
+        if isinstance(dtype0, pl.Datetime):
+            if dtype0.time_zone != dtype1.time_zone:
+                column_differences.append(
+                    ColumnDifference(
+                        source=df0_name,
+                        column_name=same_col,
+                        difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TIMEZONE,
+                        more_information={
+                            df0_name: f"{dtype0.time_zone}",
+                            df1_name: f"{dtype1.time_zone}",
+                        },
+                    )
+                )
+                continue
+
+            if dtype0.time_unit != dtype1.time_unit:
+                column_differences.append(
+                    ColumnDifference(
+                        source=df0_name,
+                        column_name=same_col,
+                        difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TIME_PRECISION,
+                        more_information={
+                            df0_name: f"{dtype0.time_unit}",
+                            df1_name: f"{dtype1.time_unit}",
+                        },
+                    )
+                )
+                continue
+
+        same_columns_after_dtype_check.append(same_col)
+
+    return same_columns_after_dtype_check, column_differences
@@ -0,0 +1,341 @@
+import json
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+
+import polars as pl
+
+from data_fingerprint.src.baseline import BaselineRegistry
+from data_fingerprint.src.models import DataReport, JobLatency
+from data_fingerprint.src.scan import collect_source
+
+
+class ComparisonService:
+    """
+    Long-running comparison service keeping the baselines and their hash indexes warm in memory.
+
+    The baselines are kept in a :class:`data_compare.src.baseline.BaselineRegistry`, the comparison jobs
+    (*candidate files compared with a registered baseline*) run on a bounded worker pool
+    and the latency of the recent jobs is kept for the metrics.
+    The service is used by :class:`ComparisonServer`, but it can be embedded into any other server as well.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[BaselineRegistry] = None,
+        max_workers: Optional[int] = None,
+        number_of_latencies: int = 1000,
+    ) -> None:
+        """
+        Create the service.
+
+        Args:
+            registry (Optional[:class:`data_compare.src.baseline.BaselineRegistry`]): The baseline registry,
+                an unbounded one is created if `None`.
+            max_workers (Optional[int]): The number of workers, defaults to the number of CPU cores.
+            number_of_latencies (int): The number of recent job latencies kept for the metrics.
+        """
+        self.registry: BaselineRegistry = registry or BaselineRegistry()
+        """The baseline registry."""
+
+        self.latencies: deque[JobLatency] = deque(maxlen=number_of_latencies)
+        """The latencies of the recent jobs."""
+
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._number_of_jobs: int = 0
+
+    def register(
+        self, name: str, path: str, grouping_columns: Optional[list[str]] = None
+    ) -> dict[str, Any]:
+        """
+        Load a file and register it as a baseline.
+
+        Args:
+            name (str): The name of the baseline.
+            path (str): The path of the file (*see* :func:`data_compare.src.scan.scan_source`).
+            grouping_columns (Optional[list[str]]): The default columns to pair the rows by.
+
+        Returns:
+            dict[str, Any]: The name, number of rows and estimated size of the baseline.
+        """
+        baseline = self.registry.register(name, collect_source(path), grouping_columns)
+        return {
+            "name": name,
+            "rows": len(baseline.df),
+            "estimated_size": baseline.estimated_size,
+        }
+
+    def submit(
+        self,
+        baseline: str,
+        path: str,
+        candidate_name: Optional[str] = None,
+        grouping_columns: Optional[list[str]] = None,
+    ) -> Future:
+        """
+        Submit a comparison job of a candidate file with a registered baseline.
+
+        Raises:
+            KeyError: If there is no baseline with the name.
+
+        Args:
+            baseline (str): The name of the baseline.
+            path (str): The path of the candidate file.
+            candidate_name (Optional[str]): The name of the candidate, defaults to the file name.
+            grouping_columns (Optional[list[str]]): The columns to pair the rows by,
+                defaults to the grouping columns of the baseline.
+
+        Returns:
+            Future: The future of the `(report, latency)` tuple.
+        """
+        if baseline not in self.registry:
+            raise KeyError(f"Baseline is not registered: {baseline}")
+        with self._lock:
+            self._number_of_jobs += 1
+            job_id: int = self._number_of_jobs
+        return self._executor.submit(
+            self._run,
+            job_id,
+            time.perf_counter(),
+            baseline,
+            path,
+            candidate_name or Path(path).name,
+            grouping_columns,
+        )
+
+    def _run(
+        self,
+        job_id: int,
+        submitted: float,
+        baseline: str,
+        path: str,
+        candidate_name: str,
+        grouping_columns: Optional[list[str]],
+    ) -> tuple[DataReport, JobLatency]:
+        started: float = time.perf_counter()
+        candidate: pl.DataFrame = collect_source(path)
+        loaded: float = time.perf_counter()
+        report: DataReport = self.registry.compare(
+            baseline, candidate, candidate_name, grouping_columns
+        )
+        latency: JobLatency = JobLatency(
+            job_id=job_id,
+            baseline=baseline,
+            candidate=candidate_name,
+            queued_seconds=started - submitted,
+            load_seconds=loaded - started,
+            compare_seconds=time.perf_counter() - loaded,
+        )
+        self.latencies.append(latency)
+        return report, latency
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get the metrics of the service: the registered baselines and the latency statistics of the recent jobs.
+
+        Returns:
+            dict[str, Any]: The metrics.
+        """
+        totals: list[float] = sorted(
+            latency.total_seconds for latency in self.latencies
+        )
+        return {
+            "jobs": self._number_of_jobs,
+            "baselines": self.registry.names,
+            "baselines_estimated_size": self.registry.estimated_size,
+            "latency_seconds": {
+                "count": len(totals),
+                "mean": statistics.fmean(totals) if len(totals) > 0 else None,
+                "p50": totals[len(totals) // 2] if len(totals) > 0 else None,
+                "p95": totals[int(len(totals) * 0.95)] if len(totals) > 0 else None,
+                "max": totals[-1] if len(totals) > 0 else None,
+            },
+            "recent_jobs": [
+                latency.model_dump(mode="json")
+                for latency in list(self.latencies)[-10:]
+            ],
+        }
+
+    def shutdown(self) -> None:
+        """
+        Wait for the running jobs and stop the worker pool.
+
+        Returns:
+            None
+        """
+        self._executor.shutdown(wait=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: "ComparisonServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _send(self, status: int, body: Any) -> None:
+        payload: bytes = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_json(self, required: list[str], optional: list[str]) -> dict[str, Any]:
+        """
+        Read the JSON body of the request and check its shape.
+
+        Raises:
+            ValueError: If the body is not a JSON object, a required field is missing,
+                a field is not a string or `grouping_columns` is not a list of strings.
+
+        Args:
+            required (list[str]): The required string fields.
+            optional (list[str]): The optional string fields.
+
+        Returns:
+            dict[str, Any]: The body.
+        """
+        length: int = int(self.headers.get("Content-Length", 0))
+        body: Any = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(body, dict):
+            raise ValueError(f"Request body must be a JSON object, got: {body!r}")
+        for field in required + optional:
+            if field not in body or (field in optional and body[field] is None):
+                if field in required:
+                    raise ValueError(f"Missing field: {field}")
+                continue
+            if not isinstance(body[field], str):
+                raise ValueError(
+                    f"Field {field} must be a string, got: {body[field]!r}"
+                )
+        grouping_columns: Any = body.get("grouping_columns")
+        if grouping_columns is not None and (
+            not isinstance(grouping_columns, list)
+            or not all(isinstance(column, str) for column in grouping_columns)
+        ):
+            raise ValueError(
+                f"Field grouping_columns must be a list of strings, got: {grouping_columns!r}"
+            )
+        return body
+
+    def do_GET(self) -> None:
+        if self.path == "/metrics":
+            self._send(200, self.server.service.get_metrics())
+            return
+        if self.path == "/baselines":
+            self._send(200, self.server.service.registry.names)
+            return
+        self._send(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        try:
+            if self.path == "/baselines":
+                body: dict[str, Any] = self._read_json(["name", "path"], [])
+                self._send(
+                    200,
+                    self.server.service.register(
+                        body["name"], body["path"], body.get("grouping_columns")
+                    ),
+                )
+                return
+            if self.path == "/compare":
+                body = self._read_json(["baseline", "path"], ["name"])
+                report, latency = self.server.service.submit(
+                    body["baseline"],
+                    body["path"],
+                    body.get("name"),
+                    body.get("grouping_columns"),
+                ).result()
+                self._send(
+                    200,
+                    {
+                        "report": report.model_dump(mode="json"),
+                        "latency": latency.model_dump(mode="json"),
+                    },
+                )
+                return
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+        except KeyError as error:
+            self._send(404, {"error": str(error)})
+        except (
+            ValueError,
+            TypeError,
+            AttributeError,
+            OSError,
+            pl.exceptions.PolarsError,
+        ) as error:
+            self._send(400, {"error": str(error)})
+
+    def do_DELETE(self) -> None:
+        prefix: str = "/baselines/"
+        if not self.path.startswith(prefix):
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+            return
+        try:
+            self.server.service.registry.remove(self.path[len(prefix) :])
+            self._send(200, {"removed": self.path[len(prefix) :]})
+        except KeyError as error:
+            self._send(404, {"error": str(error)})
+
+
+class ComparisonServer(ThreadingHTTPServer):
+    """
+    Local HTTP server running a :class:`ComparisonService`, so the process start, the imports and the loading
+    of the baselines are paid once instead of for every check.
+
+    The requests and responses are JSON:
+
+    - `POST /baselines` with `{"name", "path", "grouping_columns"}` loads and registers a baseline
+    - `GET /baselines` lists the registered baselines, `DELETE /baselines/<name>` removes one
+    - `POST /compare` with `{"baseline", "path", "name", "grouping_columns"}` compares a candidate file
+      with a baseline and returns the `report` and the `latency` of the job
+    - `GET /metrics` returns the latency statistics of the recent jobs
+
+    Example:
+        ```python
+        from data_fingerprint.src.server import ComparisonServer
+
+        server = ComparisonServer(("127.0.0.1", 8765), max_workers=4)
+        server.serve_forever()
+        ```
+
+        ```
+        curl -X POST localhost:8765/baselines -d '{"name": "orders", "path": "golden/orders.parquet", "grouping_columns": ["id"]}'
+        curl -X POST localhost:8765/compare -d '{"baseline": "orders", "path": "candidate/orders.parquet"}'
+        ```
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 8765),
+        service: Optional[ComparisonService] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Create the server and bind it to the address.
+
+        Args:
+            address (tuple[str, int]): The host and the port, port `0` picks a free port.
+            service (Optional[:class:`ComparisonService`]): The service, a new one is created if `None`.
+            max_workers (Optional[int]): The number of workers of a new service.
+        """
+        self.service: ComparisonService = service or ComparisonService(
+            max_workers=max_workers
+        )
+        """The comparison service."""
+        super().__init__(address, _RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.service.shutdown()
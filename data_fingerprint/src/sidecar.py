@@ -0,0 +1,195 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data_fingerprint.src.models import HashSidecar, ParquetFileKey
+
+SIDECAR_SUFFIX: str = ".fingerprint.arrow"
+"""The suffix added to the path of a Parquet file to get the path of its sidecar file."""
+
+_METADATA_KEY: bytes = b"data_fingerprint"
+
+
+def get_sidecar_path(path: Union[str, os.PathLike]) -> Path:
+    """
+    Get the path of the sidecar file of a Parquet file (*the sidecar is stored next to the file*).
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+
+    Returns:
+        Path: The path of the sidecar file.
+    """
+    path = Path(path)
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def get_parquet_file_key(path: Union[str, os.PathLike]) -> ParquetFileKey:
+    """
+    Get the key identifying the current version of a Parquet file.
+
+    Only the file system metadata and the Parquet footer are read.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+
+    Returns:
+        :class:`data_compare.src.models.ParquetFileKey`: The key of the file.
+    """
+    path = Path(path).resolve()
+    stat: os.stat_result = path.stat()
+    metadata: pq.FileMetaData = pq.ParquetFile(path).metadata
+    return ParquetFileKey(
+        path=str(path),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        row_groups=[
+            (metadata.row_group(i).num_rows, metadata.row_group(i).total_byte_size)
+            for i in range(metadata.num_row_groups)
+        ],
+    )
+
+
+def get_digest(hashes: pl.Series) -> str:
+    """
+    Get a digest of row hashes that does not depend on the order of the rows.
+
+    Args:
+        hashes (pl.Series): The row hashes.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    return hashlib.sha256(hashes.sort().to_numpy().tobytes()).hexdigest()
+
+
+def hash_parquet_rows(path: Union[str, os.PathLike], columns: list[str]) -> pl.Series:
+    """
+    Read the columns of a Parquet file and hash its rows the same way as the comparator does.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+        columns (list[str]): The columns to hash.
+
+    Returns:
+        pl.Series: The row hashes.
+    """
+    return pl.read_parquet(path, columns=sorted(columns)).hash_rows()
+
+
+def write_hash_sidecar(
+    path: Union[str, os.PathLike], columns: Optional[list[str]] = None
+) -> HashSidecar:
+    """
+    Hash the rows of a Parquet file and write the hashes and the digests into a sidecar file next to it.
+
+    The sidecar is an Arrow IPC file with one `hash` column, the :class:`data_compare.src.models.HashSidecar`
+    metadata are stored in the schema metadata, so they can be read without reading the hashes.
+
+    Example:
+        ```python
+        from data_fingerprint.src.sidecar import write_hash_sidecar, read_hash_sidecar
+
+        write_hash_sidecar("data/orders.parquet")
+        sidecar = read_hash_sidecar("data/orders.parquet")
+        print(sidecar.digest)
+        ```
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+        columns (Optional[list[str]]): The columns to hash, all columns by default.
+
+    Returns:
+        :class:`data_compare.src.models.HashSidecar`: The metadata of the written sidecar.
+    """
+    file_key: ParquetFileKey = get_parquet_file_key(path)
+    if columns is None:
+        columns = pl.read_parquet_schema(path).keys()
+    columns = sorted(columns)
+
+    hashes: pl.Series = hash_parquet_rows(path, columns)
+    row_group_digests: list[str] = []
+    offset: int = 0
+    for number_of_rows, _ in file_key.row_groups:
+        row_group_digests.append(get_digest(hashes.slice(offset, number_of_rows)))
+        offset += number_of_rows
+
+    sidecar: HashSidecar = HashSidecar(
+        file_key=file_key,
+        columns=columns,
+        polars_version=pl.__version__,
+        number_of_rows=len(hashes),
+        digest=get_digest(hashes),
+        row_group_digests=row_group_digests,
+    )
+    table: pa.Table = pa.table({"hash": hashes.to_arrow()})
+    table = table.replace_schema_metadata(
+        {_METADATA_KEY: sidecar.model_dump_json().encode()}
+    )
+    with pa.OSFile(str(get_sidecar_path(path)), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sidecar
+
+
+def read_hash_sidecar(
+    path: Union[str, os.PathLike], columns: Optional[list[str]] = None
+) -> Optional[HashSidecar]:
+    """
+    Read the metadata of the sidecar file of a Parquet file, if the sidecar is still valid.
+
+    The sidecar is valid if it exists, the Parquet file did not change since the sidecar was written
+    (*same path, size, modification time and row groups*), it was written with the same polars version
+    and (*if `columns` are given*) it hashed the same columns.
+    Only the file system metadata, the Parquet footer and the sidecar metadata are read.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+        columns (Optional[list[str]]): The columns that should be hashed.
+
+    Returns:
+        Optional[:class:`data_compare.src.models.HashSidecar`]: The metadata of the sidecar or `None` if it is not valid.
+    """
+    sidecar_path: Path = get_sidecar_path(path)
+    if not sidecar_path.exists():
+        return None
+
+    try:
+        with pa.memory_map(str(sidecar_path)) as source:
+            metadata: Optional[dict[bytes, bytes]] = pa.ipc.open_file(
+                source
+            ).schema.metadata
+        sidecar: HashSidecar = HashSidecar.model_validate_json(metadata[_METADATA_KEY])
+    except (pa.ArrowInvalid, OSError, KeyError, TypeError, ValueError):
+        return None
+
+    if sidecar.file_key != get_parquet_file_key(path):
+        return None
+    if sidecar.polars_version != pl.__version__:
+        return None
+    if columns is not None and sidecar.columns != sorted(columns):
+        return None
+    return sidecar
+
+
+def load_sidecar_hashes(path: Union[str, os.PathLike]) -> pl.Series:
+    """
+    Load the row hashes from the sidecar file of a Parquet file (*in the order of the rows*).
+
+    .. note::
+        The sidecar is not validated, use :func:`read_hash_sidecar` first.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the Parquet file.
+
+    Returns:
+        pl.Series: The row hashes.
+    """
+    with pa.memory_map(str(get_sidecar_path(path))) as source:
+        table: pa.Table = pa.ipc.open_file(source).read_all()
+    return pl.from_arrow(table.column("hash").combine_chunks()).alias("hash")
@@ -0,0 +1,261 @@
+from functools import reduce
+from typing import Iterator, Optional, Union
+
+import polars as pl
+
+from data_fingerprint.src.checkers import check_inputs
+from data_fingerprint.src.comparator import (
+    _get_hashed_row_differences,
+    _hash_subset,
+    _pair_row_differences,
+)
+from data_fingerprint.src.models import (
+    ColumnDifference,
+    RowDifference,
+    RowGroupDifference,
+)
+from data_fingerprint.src.progress import (
+    CancellationToken,
+    ProgressCallback,
+    report_progress,
+)
+from data_fingerprint.src.schema import get_schema_differences
+from data_fingerprint.src.utils import convert_to_polars
+
+
+def _lexicographic_less_than(columns: list[str], values: tuple) -> pl.Expr:
+    """
+    Build an expression that is `True` when the key of a row is lexicographically smaller than `values`.
+
+    Args:
+        columns (list[str]): The key columns.
+        values (tuple): The key to compare with.
+
+    Returns:
+        pl.Expr: The boolean expression.
+    """
+    expression: pl.Expr = pl.lit(False)
+    for column, value in reversed(list(zip(columns, values))):
+        expression = (pl.col(column) < value) | ((pl.col(column) == value) & expression)
+    return expression
+
+
+def is_sorted_by(df: pl.DataFrame, columns: list[str]) -> bool:
+    """
+    Check if a dataframe is sorted (*ascending, lexicographically*) by the columns.
+
+    The check is a single vectorized pass comparing every row with the previous one.
+    Dataframes with `null` values in the columns are reported as not sorted.
+
+    Args:
+        df (pl.DataFrame): The dataframe to check.
+        columns (list[str]): The columns the dataframe should be sorted by.
+
+    Returns:
+        bool: `True` if the dataframe is sorted by the columns.
+    """
+    if len(df) < 2:
+        return True
+    if df.select(columns).null_count().sum_horizontal()[0] > 0:
+        return False
+
+    # the previous row is smaller or equal to the current row
+    in_order: pl.Expr = pl.lit(True)
+    for column in reversed(columns):
+        in_order = (pl.col(column).shift(1) < pl.col(column)) | (
+            (pl.col(column).shift(1) == pl.col(column)) & in_order
+        )
+    return bool(df.select(in_order.slice(1).all()).item())
+
+
+class _SortedCursor:
+    """
+    Reads a sorted dataframe chunk by chunk and keeps the rows that were read but not yet compared.
+
+    Lazy frames are read in one streaming pass (*see* `pl.LazyFrame.collect_batches`),
+    so only the buffered chunks are in memory.
+    """
+
+    def __init__(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        columns: list[str],
+        chunk_size: int,
+    ):
+        self._batches: Iterator[pl.DataFrame] = (
+            df.select(columns).collect_batches(chunk_size=chunk_size)
+            if isinstance(df, pl.LazyFrame)
+            else df.select(columns).iter_slices(chunk_size)
+        )
+        self.exhausted: bool = False
+        self.buffer: pl.DataFrame = df.select(columns).clear()
+        if isinstance(self.buffer, pl.LazyFrame):
+            self.buffer = self.buffer.collect()
+
+    def fill(self, chunk_size: int) -> None:
+        """Read rows until at least `chunk_size` rows are buffered or the dataframe is exhausted."""
+        chunks: list[pl.DataFrame] = [self.buffer]
+        buffered: int = len(self.buffer)
+        while not self.exhausted and buffered < chunk_size:
+            chunk: Optional[pl.DataFrame] = next(self._batches, None)
+            if chunk is None:
+                self.exhausted = True
+                break
+            chunks.append(chunk)
+            buffered += len(chunk)
+        if len(chunks) > 1:
+            self.buffer = pl.concat(chunks)
+
+    def last_key(self, key_columns: list[str]) -> Optional[tuple]:
+        """The key of the last buffered row, `None` if the buffer is empty."""
+        if len(self.buffer) == 0:
+            return None
+        return self.buffer.select(key_columns).row(-1)
+
+    def take_before(
+        self, key_columns: list[str], bound: Optional[tuple]
+    ) -> pl.DataFrame:
+        """Remove and return the buffered rows with a key smaller than `bound` (*all rows if `None`*)."""
+        if bound is None:
+            number_of_rows: int = len(self.buffer)
+        else:
+            number_of_rows = self.buffer.select(
+                _lexicographic_less_than(key_columns, bound).sum()
+            ).item()
+        window: pl.DataFrame = self.buffer.head(number_of_rows)
+        self.buffer = self.buffer.slice(number_of_rows)
+        return window
+
+
+@convert_to_polars
+@check_inputs
+def get_row_differences_sorted(
+    df0: Union[pl.DataFrame, pl.LazyFrame],
+    df1: Union[pl.DataFrame, pl.LazyFrame],
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: list[str],
+    chunk_size: int = 100_000,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> tuple[
+    list[str], list[ColumnDifference], list[Union[RowDifference, RowGroupDifference]]
+]:
+    """
+    Compares the rows of two dataframes that are **already sorted** by the grouping columns,
+    with the same result as :func:`data_compare.src.comparator.get_row_differences_paired`.
+
+    Instead of hashing both dataframes at once, both sides are read in chunks of `chunk_size` rows
+    and merged like in a sort-merge join: all rows with a key smaller than the smallest last key
+    of the current chunks are complete on both sides, so they are compared and dropped.
+    The work is linear in the number of rows and the working memory is proportional to the chunk size
+    (*the chunk grows only when a single key has more rows than the chunk*). Lazy frames (*like `pl.scan_parquet`*)
+    are streamed, they are never loaded as a whole.
+
+    Example:
+        ```python
+        import polars as pl
+        from data_fingerprint.src.sort_merge import get_row_differences_sorted
+
+        df0 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]})
+        df1 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 10]})
+        same_columns, column_differences, row_differences = get_row_differences_sorted(
+            df0, df1, "df0", "df1", ["a"], chunk_size=2
+        )
+        ```
+
+    .. note::
+        The inputs are not checked for being sorted (*use :func:`is_sorted_by`*),
+        unsorted inputs give wrong results.
+
+    Raises:
+        ValueError: If the grouping columns are not comparable in both dataframes or contain null values.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Args:
+        df0 (Union[pl.DataFrame, pl.LazyFrame]): The first dataframe, sorted by the grouping columns.
+        df1 (Union[pl.DataFrame, pl.LazyFrame]): The second dataframe, sorted by the grouping columns.
+        df0_name (str): The name of the first dataframe.
+        df1_name (str): The name of the second dataframe.
+        grouping_columns (list[str]): The columns the dataframes are sorted and grouped by.
+        chunk_size (int): The number of rows read from each side at once.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the `sort_merge` stage, number of compared rows and total number of rows.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            between compared chunks.
+
+    Returns:
+        list[str]: The same columns
+
+        list[:class:`data_compare.src.models.ColumnDifference`]: The column differences
+
+        list[Union[:class:`data_compare.src.models.RowDifference`, :class:`data_compare.src.models.RowGroupDifference`]]: The row differences
+    """
+    same_columns, column_differences = get_schema_differences(
+        df0, df1, df0_name, df1_name
+    )
+    if len(set(grouping_columns).difference(same_columns)) > 0:
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+    lengths: list[int] = []
+    for df, df_name in [(df0, df0_name), (df1, df1_name)]:
+        # one pass over the grouping columns only, lazy frames are not loaded
+        counts: pl.DataFrame = df.select(
+            pl.len().alias("__length"),
+            pl.sum_horizontal(pl.col(grouping_columns).null_count()).alias("__nulls"),
+        )
+        if isinstance(counts, pl.LazyFrame):
+            counts = counts.collect()
+        lengths.append(counts["__length"][0])
+        if counts["__nulls"][0] > 0:
+            raise ValueError(
+                f"Grouping columns of {df_name} contain null values, "
+                "sorted comparison is not possible."
+            )
+
+    cursors: list[_SortedCursor] = [
+        _SortedCursor(df0, same_columns, chunk_size),
+        _SortedCursor(df1, same_columns, chunk_size),
+    ]
+    total: int = sum(lengths)
+    processed: int = 0
+    current_chunk_size: int = chunk_size
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = []
+    while True:
+        report_progress(
+            progress_callback, cancellation_token, "sort_merge", processed, total
+        )
+        for cursor in cursors:
+            cursor.fill(current_chunk_size)
+        if all(len(cursor.buffer) == 0 for cursor in cursors):
+            break
+
+        # the keys below the smallest last key of not exhausted sides can not appear in later chunks
+        last_keys: list[tuple] = [
+            cursor.last_key(grouping_columns)
+            for cursor in cursors
+            if not cursor.exhausted
+        ]
+        bound: Optional[tuple] = None if len(last_keys) == 0 else reduce(min, last_keys)
+        df0_window, df1_window = [
+            cursor.take_before(grouping_columns, bound) for cursor in cursors
+        ]
+        if len(df0_window) + len(df1_window) == 0:
+            current_chunk_size *= 2
+            continue
+
+        current_chunk_size = chunk_size
+        processed += len(df0_window) + len(df1_window)
+        window_row_differences: list[RowDifference] = _get_hashed_row_differences(
+            _hash_subset(df0_window, same_columns, df0_name),
+            _hash_subset(df1_window, same_columns, df1_name),
+            df0_name,
+            df1_name,
+        )
+        row_differences.extend(
+            _pair_row_differences(window_row_differences, grouping_columns)
+        )
+
+    return same_columns, column_differences, row_differences
@@ -0,0 +1,403 @@
+import math
+import os
+import tempfile
+from typing import Any, Optional, Union
+
+import polars as pl
+import pyarrow as pa
+
+from data_fingerprint.src.difference_types import RowDifferenceType
+from data_fingerprint.src.digest import digest_large_values
+from data_fingerprint.src.memory import MEMORY_FACTOR, track_stage
+from data_fingerprint.src.models import (
+    DataReport,
+    MemoryProfile,
+    RowDifference,
+    RowGroupDifference,
+)
+from data_fingerprint.src.parallel import (
+    _compare_partition,
+    _concat_duplicate_keys,
+    partition_by_hash,
+)
+from data_fingerprint.src.progress import (
+    CancellationToken,
+    ProgressCallback,
+    report_progress,
+)
+from data_fingerprint.src.scan import (
+    InputSource,
+    RowFilter,
+    estimate_source_size,
+    get_metadata_row_count,
+    get_side_filters,
+    scan_projected,
+    scan_source,
+)
+from data_fingerprint.src.schema import get_schema_differences
+
+
+def _scan_side(
+    source: InputSource,
+    include_columns: Optional[list[str]],
+    exclude_columns: Optional[list[str]],
+    row_filter: Optional[pl.Expr],
+    large_value_threshold: Optional[int] = None,
+    grouping_columns: Optional[list[str]] = None,
+) -> pl.LazyFrame:
+    lazy_frame: pl.LazyFrame = scan_projected(
+        source, include_columns, exclude_columns, row_filter
+    )
+    if large_value_threshold is not None:
+        lazy_frame = digest_large_values(
+            lazy_frame, large_value_threshold, grouping_columns
+        )
+    return lazy_frame
+
+
+def estimate_comparison_memory(
+    df0: InputSource,
+    df1: InputSource,
+    rows: Optional[tuple[int, int]] = None,
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+) -> int:
+    """
+    Estimate the peak memory (*in bytes*) of an in-memory comparison of two sources,
+    :data:`data_compare.src.memory.MEMORY_FACTOR` times the estimated size of their compared columns and rows
+    (*see* :func:`data_compare.src.scan.estimate_source_size`).
+
+    The numbers of rows are taken from the metadata where they exist (*dataframes and Parquet files*).
+    Unfiltered CSV and NDJSON files are estimated from the size of the file, so nothing is read,
+    the other sources count the rows of their projected and filtered plan.
+
+    Args:
+        df0 (:data:`data_compare.src.scan.InputSource`): The first source.
+        df1 (:data:`data_compare.src.scan.InputSource`): The second source.
+        rows (Optional[tuple[int, int]]): The numbers of compared rows of the sources, estimated if `None`.
+        include_columns (Optional[list[str]]): The columns to compare, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns that are not compared.
+        row_filter (Optional[:data:`data_compare.src.scan.RowFilter`]): The filter of the compared rows.
+
+    Returns:
+        int: The estimated peak memory.
+    """
+    size: int = 0
+    for index, (source, side_filter) in enumerate(
+        zip([df0, df1], get_side_filters(row_filter))
+    ):
+        lazy_frame: pl.LazyFrame = scan_projected(
+            source, include_columns, exclude_columns, side_filter
+        )
+        columns: list[str] = lazy_frame.collect_schema().names()
+        number_of_rows: Optional[int] = (
+            rows[index]
+            if rows is not None
+            else (get_metadata_row_count(source) if side_filter is None else None)
+        )
+        if (
+            number_of_rows is None
+            and side_filter is None
+            and isinstance(source, (str, os.PathLike))
+        ):
+            # a text file is about as large as its loaded columns
+            all_columns: int = len(scan_source(source).collect_schema())
+            size += int(os.path.getsize(source) * len(columns) / max(all_columns, 1))
+            continue
+        if number_of_rows is None:
+            number_of_rows = lazy_frame.select(pl.len()).collect().item()
+        size += estimate_source_size(source, number_of_rows, len(columns), columns)
+    return MEMORY_FACTOR * size
+
+
+def _spill_partitions(
+    lazy_frame: pl.LazyFrame,
+    number_of_rows: int,
+    key_columns: list[str],
+    number_of_partitions: int,
+    chunk_rows: int,
+    directory: str,
+    prefix: str,
+    progress_callback: Optional[ProgressCallback],
+    cancellation_token: Optional[CancellationToken],
+) -> dict[int, str]:
+    """
+    Read a source in one streaming pass, chunk by chunk, and append every chunk's hash partitions
+    to one Arrow IPC file per partition.
+
+    Args:
+        lazy_frame (pl.LazyFrame): The source with only the comparable columns.
+        number_of_rows (int): The number of rows of the source.
+        key_columns (list[str]): The columns to partition by.
+        number_of_partitions (int): The number of partitions.
+        chunk_rows (int): The number of rows read at once (*approximately, the scan decides the batch sizes*).
+        directory (str): The directory of the partition files.
+        prefix (str): The prefix of the partition files.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the `spill` stage, number of spilled rows and total number of rows.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            after every chunk.
+
+    Returns:
+        dict[int, str]: The paths of the non-empty partition files by partition index.
+    """
+    paths: dict[int, str] = {}
+    writers: dict[int, pa.ipc.RecordBatchFileWriter] = {}
+    try:
+        report_progress(
+            progress_callback, cancellation_token, "spill", 0, number_of_rows
+        )
+        spilled_rows: int = 0
+        for chunk in lazy_frame.collect_batches(chunk_size=chunk_rows):
+            for index, partition in partition_by_hash(
+                chunk, key_columns, number_of_partitions
+            ).items():
+                table: pa.Table = partition.to_arrow()
+                if index not in writers:
+                    paths[index] = os.path.join(directory, f"{prefix}_{index}.arrow")
+                    writers[index] = pa.ipc.new_file(paths[index], table.schema)
+                writers[index].write_table(table)
+            spilled_rows += len(chunk)
+            report_progress(
+                progress_callback,
+                cancellation_token,
+                "spill",
+                spilled_rows,
+                number_of_rows,
+            )
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return paths
+
+
+def get_data_report_spilled(
+    df0: InputSource,
+    df1: InputSource,
+    df0_name: str,
+    df1_name: str,
+    grouping_columns: Optional[list[str]] = None,
+    memory_limit: Optional[int] = None,
+    number_of_partitions: Optional[int] = None,
+    include_columns: Optional[list[str]] = None,
+    exclude_columns: Optional[list[str]] = None,
+    row_filter: Optional[RowFilter] = None,
+    temporary_directory: Optional[str] = None,
+    large_value_threshold: Optional[int] = None,
+    unique_key: Optional[bool] = None,
+    memory_profile: Optional[MemoryProfile] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancellation_token: Optional[CancellationToken] = None,
+) -> DataReport:
+    """
+    Get a data report comparing two sources that do not fit into memory, with grace-hash partitioning.
+
+    Both sources are read in chunks, every chunk is split into hash partitions
+    (*see* :func:`data_compare.src.parallel.partition_by_hash`) that are spilled to temporary Arrow IPC files,
+    then the partitions are compared one pair at a time and their files are removed.
+    The number of partitions and the size of the chunks are chosen from `memory_limit`, so that a chunk
+    and a pair of partitions fit into it. The temporary files are removed even when the comparison fails.
+
+    The report contains the same differences (*and duplicated keys*) as the report of
+    :func:`data_compare.src.comparator.get_data_report`, only the order of the row differences can differ.
+
+    .. note::
+        The limit bounds the memory of the compared rows, not of the report: the row differences of all
+        partitions are collected into the returned report, so a comparison with many differences needs
+        memory for all of them on top of the limit.
+        The memory is also bounded by estimates: a single group of rows (*rows with the same grouping columns
+        or identical rows*) always lands in one partition, so heavily skewed data can still exceed the limit.
+
+    Example:
+        ```python
+        from data_fingerprint.src.spill import get_data_report_spilled
+
+        report = get_data_report_spilled(
+            "data/events.parquet", "backup/events.csv", "data", "backup", ["id"], memory_limit=2 * 1024**3
+        )
+        ```
+
+    Raises:
+        ValueError: If the source names are the same, neither `memory_limit` nor `number_of_partitions`
+            is given or the grouping columns are not comparable in both sources.
+        ComparisonCancelledError: If the `cancellation_token` was cancelled.
+
+    Args:
+        df0 (:data:`data_compare.src.scan.InputSource`): The first source.
+        df1 (:data:`data_compare.src.scan.InputSource`): The second source.
+        df0_name (str): The name of the first source.
+        df1_name (str): The name of the second source.
+        grouping_columns (Optional[list[str]]): The columns to pair the rows by.
+        memory_limit (Optional[int]): The memory limit in bytes.
+        number_of_partitions (Optional[int]): The number of partitions, chosen from `memory_limit` if `None`.
+        include_columns (Optional[list[str]]): The columns to compare, all columns by default.
+        exclude_columns (Optional[list[str]]): The columns that are not compared.
+        row_filter (Optional[:data:`data_compare.src.scan.RowFilter`]): The filter of the compared rows.
+        temporary_directory (Optional[str]): The directory of the temporary files, the system default if `None`.
+        large_value_threshold (Optional[int]): If given, the larger string and binary values are spilled and compared
+            as digests (*see* :func:`data_compare.src.digest.digest_large_values`).
+        unique_key (Optional[bool]): `True` declares the grouping columns unique in both sources,
+            `None` detects the duplicated keys and `False` compares all the rows group by group.
+        memory_profile (Optional[:class:`data_compare.src.models.MemoryProfile`]): If given, the memory
+            of the `spill` and `partitions` stages is recorded into it.
+        progress_callback (Optional[:data:`data_compare.src.progress.ProgressCallback`]): If given, it is called
+            with the `spill` stage per source and the `partitions` stage.
+        cancellation_token (Optional[:class:`data_compare.src.progress.CancellationToken`]): If given, it is checked
+            after every chunk and every partition.
+
+    Returns:
+        :class:`data_compare.src.models.DataReport`: A data report comparing the two sources.
+    """
+    if df0_name == df1_name:
+        raise ValueError(f"Source name already exists: {df1_name}")
+    if memory_limit is None and number_of_partitions is None:
+        raise ValueError(
+            "Spilled comparison needs a memory limit or a number of partitions."
+        )
+
+    df0_filter, df1_filter = get_side_filters(row_filter)
+    lazy_frames: list[pl.LazyFrame] = [
+        _scan_side(
+            source,
+            include_columns,
+            exclude_columns,
+            side_filter,
+            large_value_threshold,
+            grouping_columns,
+        )
+        for source, side_filter in [(df0, df0_filter), (df1, df1_filter)]
+    ]
+    same_columns, column_differences = get_schema_differences(
+        lazy_frames[0].collect_schema(),
+        lazy_frames[1].collect_schema(),
+        df0_name,
+        df1_name,
+    )
+    rows: list[int] = [lf.select(pl.len()).collect().item() for lf in lazy_frames]
+    row_differences: list[Union[RowDifference, RowGroupDifference]] = []
+    if grouping_columns is not None and (
+        len(set(grouping_columns).difference(same_columns)) > 0
+    ):
+        raise ValueError(
+            "Pairing columns must be the same in both dataframes. "
+            f"Pairing columns: {grouping_columns}. Same columns: {same_columns}"
+        )
+
+    memory: int = estimate_comparison_memory(
+        df0,
+        df1,
+        (rows[0], rows[1]),
+        include_columns=include_columns,
+        exclude_columns=exclude_columns,
+        row_filter=row_filter,
+    )
+    if number_of_partitions is None:
+        number_of_partitions = max(1, math.ceil(memory / memory_limit))
+    bytes_per_row: float = max(memory / max(sum(rows), 1), 1)
+    chunk_rows: int = (
+        max(1, int(memory_limit / bytes_per_row))
+        if memory_limit is not None
+        else max(1, math.ceil(max(rows) / number_of_partitions))
+    )
+
+    if len(same_columns) == 0:
+        # nothing can be compared, every row is missing from the other source
+        # (*as in* :func:`data_compare.src.comparator.get_row_differences`)
+        for lf, source in zip(lazy_frames, [df0_name, df1_name]):
+            for chunk in lf.collect_batches(chunk_size=chunk_rows):
+                row_differences.extend(
+                    RowDifference(
+                        source=source,
+                        row=row,
+                        number_of_occurrences=1,
+                        difference_type=RowDifferenceType.MISSING_ROW,
+                    )
+                    for row in chunk.rows(named=True)
+                )
+        return DataReport(
+            df0_length=rows[0],
+            df1_length=rows[1],
+            df0_name=df0_name,
+            df1_name=df1_name,
+            comparable_columns=same_columns,
+            row_differences=row_differences,
+            column_differences=column_differences,
+        )
+
+    lazy_frames = [lf.select(same_columns) for lf in lazy_frames]
+    key_columns: list[str] = (
+        list(same_columns) if grouping_columns is None else grouping_columns
+    )
+    empty_partition: pl.DataFrame = lazy_frames[0].clear().collect()
+
+    duplicate_keys: list[Optional[dict[str, list[Any]]]] = []
+    with tempfile.TemporaryDirectory(
+        prefix="data_fingerprint_", dir=temporary_directory
+    ) as directory:
+        with track_stage(memory_profile, "spill"):
+            df0_paths, df1_paths = [
+                _spill_partitions(
+                    lf,
+                    number_of_rows,
+                    key_columns,
+                    number_of_partitions,
+                    chunk_rows,
+                    directory,
+                    prefix,
+                    progress_callback,
+                    cancellation_token,
+                )
+                for lf, number_of_rows, prefix in zip(lazy_frames, rows, ["df0", "df1"])
+            ]
+        partition_indexes: list[int] = sorted(
+            set(df0_paths.keys()) | set(df1_paths.keys())
+        )
+        report_progress(
+            progress_callback,
+            cancellation_token,
+            "partitions",
+            0,
+            len(partition_indexes),
+        )
+        with track_stage(memory_profile, "partitions"):
+            for processed, index in enumerate(partition_indexes, start=1):
+                partitions: list[pl.DataFrame] = [
+                    (
+                        pl.read_ipc(paths[index], memory_map=False)
+                        if index in paths
+                        else empty_partition
+                    )
+                    for paths in [df0_paths, df1_paths]
+                ]
+                partition_differences, partition_keys = _compare_partition(
+                    partitions[0],
+                    partitions[1],
+                    df0_name,
+                    df1_name,
+                    grouping_columns,
+                    unique_key=unique_key,
+                )
+                row_differences.extend(partition_differences)
+                duplicate_keys.append(partition_keys)
+                for paths in [df0_paths, df1_paths]:
+                    if index in paths:
+                        os.remove(paths[index])
+                report_progress(
+                    progress_callback,
+                    cancellation_token,
+                    "partitions",
+                    processed,
+                    len(partition_indexes),
+                )
+
+    return DataReport(
+        df0_length=rows[0],
+        df1_length=rows[1],
+        df0_name=df0_name,
+        df1_name=df1_name,
+        comparable_columns=same_columns,
+        row_differences=row_differences,
+        column_differences=column_differences,
+        duplicate_keys=_concat_duplicate_keys(duplicate_keys),
+    )
@@ -1,3 +1,4 @@
+import functools
 import warnings
 from typing import Callable, Any
 
@@ -67,6 +68,7 @@ def convert_to_polars(func: Callable) -> Callable:
         Callable: The decorated function.
     """
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs) -> pl.DataFrame:
         arg, kwa = _convert_parameters_to_polars(*args, **kwargs)
         return func(*arg, **kwa)
@@ -89,17 +91,18 @@ def convert_row_differences_to_pandas(
         The DataFrame will have the same columns as the :class:`data_compare.src.models.RowDifference` objects.
         The DataFrame will have an additional column "source" with the source of the row.
     """
-    row_differences_list: list[pl.DataFrame] = []
-
-    for row_diff in row_differences:
-        df: pl.DataFrame = pl.DataFrame(row_diff.row)
-        df = df.with_columns(pl.lit(row_diff.source).alias("source"))
-        row_differences_list.append(df)
-
-    if len(row_differences_list) == 0:
+    if len(row_differences) == 0:
         return pl.DataFrame()
 
-    return pl.concat(row_differences_list)
+    # the rows are gathered column by column and the dataframe is built once,
+    # a dataframe per difference is too slow for wide rows
+    columns: dict[str, list] = {column: [] for column in row_differences[0].row}
+    sources: list[str] = []
+    for row_diff in row_differences:
+        for column, values in row_diff.row.items():
+            columns[column].extend(values)
+        sources.extend([row_diff.source] * len(next(iter(row_diff.row.values()), [])))
+    return pl.DataFrame({**columns, "source": sources})
 
 
 def get_dataframe(data_report: DataReport) -> pl.DataFrame:
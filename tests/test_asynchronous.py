@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+
+import polars as pl
+import pytest
+
+from data_fingerprint.src.asynchronous import (
+    get_data_report_async,
+    iter_data_reports_async,
+    load_async,
+)
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.progress import CancellationToken
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    return df0, df1
+
+
+async def _batches(df: pl.DataFrame):
+    for batch in df.to_arrow().to_batches(max_chunksize=2):
+        yield batch
+
+
+def test_get_data_report_async() -> None:
+    df0, df1 = _get_frames()
+    report = asyncio.run(
+        get_data_report_async(_batches(df0), df1.lazy(), "df0", "df1", ["a"])
+    )
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"])
+    assert set(report.row_differences) == set(expected.row_differences)
+    assert asyncio.run(load_async(_batches(df0))).equals(df0)
+
+
+def test_get_data_report_async_projection(tmp_path) -> None:
+    df0, df1 = _get_frames()
+    df0 = df0.with_columns(c=pl.lit("x"))
+    df0.write_parquet(tmp_path / "df0.parquet")
+    options = {"exclude_columns": ["c"], "row_filter": (pl.col("c") == "x", None)}
+
+    loaded = asyncio.run(
+        load_async(
+            tmp_path / "df0.parquet", exclude_columns=["c"], row_filter=pl.col("a") > 2
+        )
+    )
+    assert loaded.columns == ["a", "b"]
+    assert len(loaded) == 4
+
+    report = asyncio.run(
+        get_data_report_async(
+            pl.scan_parquet(tmp_path / "df0.parquet"),
+            _batches(df1),
+            "df0",
+            "df1",
+            ["a"],
+            **options,
+        )
+    )
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"], **options)
+    assert (
+        set(report.comparable_columns) == set(expected.comparable_columns) == {"a", "b"}
+    )
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+def test_get_data_report_async_cancelled() -> None:
+    df0 = pl.DataFrame({"a": list(range(100))})
+    df1 = pl.DataFrame({"a": list(range(100, 200))})
+    token = CancellationToken()
+    started = threading.Event()
+
+    def progress_callback(stage: str, processed: int, total: int) -> None:
+        started.set()
+        time.sleep(0.01)
+
+    async def cancel() -> None:
+        task = asyncio.ensure_future(
+            get_data_report_async(
+                df0,
+                df1,
+                "df0",
+                "df1",
+                cancellation_token=token,
+                progress_callback=progress_callback,
+            )
+        )
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+    assert token.is_cancelled
+
+
+def test_iter_data_reports_async() -> None:
+    df0, df1 = _get_frames()
+    jobs = [(df0, df1, f"df0_{i}", f"df1_{i}", ["a"]) for i in range(5)]
+
+    async def collect() -> list[int]:
+        return [index async for index, _ in iter_data_reports_async(jobs, 2)]
+
+    assert sorted(asyncio.run(collect())) == list(range(5))
@@ -0,0 +1,144 @@
+import pytest
+import polars as pl
+
+from data_fingerprint.src.baseline import Baseline, BaselineRegistry
+from data_fingerprint.src.comparator import get_data_report
+
+
+def _get_golden() -> pl.DataFrame:
+    return pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["a"]])
+def test_baseline_is_same_as_report(grouping_columns) -> None:
+    golden = _get_golden()
+    baseline = Baseline(golden, "golden", grouping_columns=grouping_columns)
+    candidates = [
+        pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]}),
+        pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]}),
+        pl.DataFrame({"a": [1, 2], "c": [1, 2]}),
+    ]
+    for candidate in candidates:
+        if grouping_columns is not None and "b" not in candidate.columns:
+            continue
+        expected = get_data_report(
+            golden, candidate, "golden", "candidate", grouping_columns
+        )
+        report = baseline.compare(candidate, "candidate")
+        assert set(report.row_differences) == set(expected.row_differences)
+        assert set(report.column_differences) == set(expected.column_differences)
+        assert set(report.comparable_columns) == set(expected.comparable_columns)
+        assert (report.df0_length, report.df1_length) == (
+            expected.df0_length,
+            expected.df1_length,
+        )
+
+
+@pytest.mark.parametrize("grouping_columns", [["a"], ["a", "c"]])
+def test_baseline_duplicate_keys_are_same_as_report(grouping_columns) -> None:
+    golden = pl.DataFrame(
+        {"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 4, 5, 6], "c": [0, 0, 0, 0, 0, 0]}
+    )
+    baseline = Baseline(golden, "golden", grouping_columns=["a"])
+    assert baseline.is_key_unique is False
+    candidates = [
+        pl.DataFrame(
+            {"a": [1, 2, 3, 3, 4, 4], "b": [1, 7, 3, 8, 5, 9], "c": [0, 0, 0, 0, 0, 0]}
+        ),
+        pl.DataFrame({"a": [1, 2, 5], "b": [1, 7, 6], "c": [0, 0, 0]}),
+    ]
+    for candidate in candidates:
+        expected = get_data_report(
+            golden, candidate, "golden", "candidate", grouping_columns
+        )
+        report = baseline.compare(candidate, "candidate", grouping_columns)
+        assert set(report.row_differences) == set(expected.row_differences)
+        assert (report.duplicate_keys is None) == (expected.duplicate_keys is None)
+        if expected.duplicate_keys is not None:
+            assert {tuple(key) for key in zip(*report.duplicate_keys.values())} == {
+                tuple(key) for key in zip(*expected.duplicate_keys.values())
+            }
+
+
+def test_baseline_caches_hashes() -> None:
+    baseline = Baseline(_get_golden(), "golden", grouping_columns=["a"])
+    hashed, counts = baseline.get_hashed_subset(["b", "a"])
+    assert baseline.get_hashed_subset(["a", "b"])[0] is hashed
+    assert counts["count"].sum() == 6
+
+    baseline.compare(
+        pl.DataFrame({"a": [1], "c": [1]}), "candidate", grouping_columns=["a"]
+    )
+    assert baseline.get_hashed_subset(["a"])[0] is baseline.get_hashed_subset(["a"])[0]
+    assert baseline.is_key_unique is False
+    assert Baseline(_get_golden(), "golden").is_key_unique is None
+
+
+def test_baseline_invalid() -> None:
+    with pytest.raises(ValueError, match=".*are not in the baseline.*"):
+        Baseline(_get_golden(), "golden", grouping_columns=["x"])
+    baseline = Baseline(_get_golden(), "golden")
+    with pytest.raises(ValueError, match=".*Source name already exists.*"):
+        baseline.compare(_get_golden(), "golden")
+
+
+def test_registry_lru_eviction() -> None:
+    registry = BaselineRegistry(max_baselines=2)
+    registry.register("first", _get_golden())
+    registry.register("second", _get_golden())
+    registry.get("first")
+    registry.register("third", _get_golden())
+    assert registry.names == ["first", "third"]
+    assert "second" not in registry
+    with pytest.raises(KeyError):
+        registry.get("second")
+
+    registry.remove("first")
+    assert len(registry) == 1
+
+
+def test_registry_size_eviction() -> None:
+    size = Baseline(_get_golden(), "x").estimated_size
+    registry = BaselineRegistry(max_bytes=int(size * 1.5))
+    registry.register("first", _get_golden())
+    registry.register("second", _get_golden())
+    assert registry.names == ["second"]
+    assert registry.estimated_size <= size * 1.5
+
+
+def test_registry_compare() -> None:
+    registry = BaselineRegistry()
+    registry.register("golden", _get_golden(), grouping_columns=["a"])
+    candidate = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    report = registry.compare("golden", candidate, "candidate")
+    expected = get_data_report(_get_golden(), candidate, "golden", "candidate", ["a"])
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+def test_baseline_hashed_subsets_are_bounded() -> None:
+    golden = _get_golden().with_columns(c=pl.col("a") * 2)
+    baseline = Baseline(golden, "golden", max_hashed_subsets=2)
+    for columns in [["a"], ["b"], ["c"]]:
+        baseline.compare(golden.select(columns), "candidate")
+    assert list(baseline._hashed.keys()) == [("b",), ("c",)]
+
+    baseline.get_hashed_subset(["b"])
+    baseline.get_hashed_subset(["a"])
+    assert list(baseline._hashed.keys()) == [("b",), ("a",)]
+    with pytest.raises(ValueError):
+        Baseline(golden, "golden", max_hashed_subsets=0)
+
+
+def test_registry_counts_cached_subsets() -> None:
+    golden = _get_golden().with_columns(c=pl.col("a") * 2)
+    size = sum(Baseline(golden, name).estimated_size for name in ["first", "second"])
+    registry = BaselineRegistry(max_bytes=size)
+    registry.register("first", golden)
+    registry.register("second", golden)
+    assert registry.names == ["first", "second"]
+
+    # hashing new subsets of the second baseline grows it past the bound
+    for columns in [["a"], ["b"], ["c"]]:
+        registry.compare("second", golden.select(columns), "candidate")
+    assert registry.names == ["second"]
+    assert registry.estimated_size == registry.get("second").estimated_size
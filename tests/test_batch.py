@@ -0,0 +1,70 @@
+import polars as pl
+import pytest
+
+from data_fingerprint.src import batch
+from data_fingerprint.src.batch import (
+    estimate_job_memory,
+    get_data_reports,
+    iter_data_reports,
+)
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.progress import CancellationToken, ComparisonCancelledError
+
+
+def _get_jobs() -> list[tuple]:
+    jobs = []
+    for i in range(10):
+        df0 = pl.DataFrame({"a": [1, 2, 3, i], "b": [1, 2, 3, 4]})
+        df1 = pl.DataFrame({"a": [1, 2, 3, 4], "b": [1, 2, 30, 4]})
+        jobs.append(
+            (df0, df1, f"df0_{i}", f"df1_{i}", ["a"])
+            if i % 2 == 0
+            else (df0, df1, f"df0_{i}", f"df1_{i}")
+        )
+    return jobs
+
+
+@pytest.mark.parametrize("max_memory_bytes", [None, 1])
+def test_get_data_reports(max_memory_bytes) -> None:
+    jobs = _get_jobs()
+    progress = []
+    reports = get_data_reports(
+        jobs,
+        max_workers=3,
+        max_memory_bytes=max_memory_bytes,
+        progress_callback=lambda stage, processed, total: progress.append(processed),
+    )
+    for job, report in zip(jobs, reports):
+        expected = get_data_report(*job)
+        assert report.df0_name == job[2]
+        assert set(report.row_differences) == set(expected.row_differences)
+    assert progress == list(range(11))
+
+
+def test_iter_data_reports_yields_every_job() -> None:
+    jobs = _get_jobs()
+    assert sorted(index for index, _ in iter_data_reports(jobs, max_workers=2)) == list(
+        range(10)
+    )
+    assert estimate_job_memory(jobs[0]) == 3 * (
+        jobs[0][0].estimated_size() + jobs[0][1].estimated_size()
+    )
+
+
+def test_get_data_reports_cancelled() -> None:
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(ComparisonCancelledError):
+        get_data_reports(_get_jobs(), cancellation_token=token)
+
+
+def test_get_data_reports_passes_token_to_jobs(monkeypatch) -> None:
+    tokens = []
+    monkeypatch.setattr(
+        batch,
+        "get_data_report",
+        lambda *args, cancellation_token=None: tokens.append(cancellation_token),
+    )
+    token = CancellationToken()
+    get_data_reports(_get_jobs(), max_workers=2, cancellation_token=token)
+    assert tokens == [token] * 10
@@ -0,0 +1,106 @@
+import gc
+
+import polars as pl
+
+from data_fingerprint.src import cache as cache_module
+from data_fingerprint.src.cache import HashCache, get_content_signature
+from data_fingerprint.src.comparator import get_data_report
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    return df0, df1
+
+
+def test_cache_hits() -> None:
+    df0, df1 = _get_frames()
+    cache = HashCache()
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"])
+    first = get_data_report(df0, df1, "df0", "df1", ["a"], hash_cache=cache)
+    second = get_data_report(df0, df1, "df0", "df1", ["b"], hash_cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert len(cache) == 2
+    assert set(first.row_differences) == set(expected.row_differences)
+    assert set(second.row_differences) == set(
+        get_data_report(df0, df1, "df0", "df1", ["b"]).row_differences
+    )
+
+
+def test_cache_hashes_equal_to_hash_rows() -> None:
+    df0, _ = _get_frames()
+    cache = HashCache()
+    assert cache.get_hashes(df0, ["a", "b"]).equals(df0.hash_rows())
+    assert cache.get_hashes(df0, ["a", "b"]).equals(df0.hash_rows())
+    assert cache.hits == 1
+
+
+def test_cache_drops_collected_frames() -> None:
+    cache = HashCache()
+    df, _ = _get_frames()
+    cache.get_hashes(df, ["a"])
+    assert len(cache) == 1
+    del df
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_cache_memory_cap() -> None:
+    df0, df1 = _get_frames()
+    size: int = df0.hash_rows().estimated_size("b")
+    cache = HashCache(max_bytes=size)
+    cache.get_hashes(df0, ["a"])
+    cache.get_hashes(df1, ["a"])
+    assert len(cache) == 1
+    assert cache.estimated_size <= size
+
+    cache.get_hashes(df1, ["a"])
+    assert cache.hits == 1
+
+    tiny = HashCache(max_bytes=1)
+    tiny.get_hashes(df0, ["a"])
+    assert len(tiny) == 0
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_content_signature() -> None:
+    cache = HashCache(use_content_signature=True)
+    cache.get_hashes(_get_frames()[0], ["a", "b"])
+    cache.get_hashes(_get_frames()[0], ["a", "b"])
+    assert cache.hits == 1
+
+    df0, df1 = _get_frames()
+    assert get_content_signature(df0) == get_content_signature(df0.clone())
+    assert get_content_signature(df0) != get_content_signature(df1)
+    assert get_content_signature(df0.clear()) == get_content_signature(df0.clear())
+
+    # a change outside of any sample of rows is still detected
+    df = pl.DataFrame({"a": list(range(1000))})
+    changed = df.with_columns(
+        pl.when(pl.col("a") == 517).then(-1).otherwise(pl.col("a")).alias("a")
+    )
+    assert get_content_signature(df) != get_content_signature(changed)
+    assert get_content_signature(df) != get_content_signature(df.reverse())
+    cache.get_hashes(df, ["a"])
+    assert cache.get_hashes(changed, ["a"]).equals(changed.select("a").hash_rows())
+
+
+def test_cache_content_signature_memoized(monkeypatch) -> None:
+    signatures = []
+    monkeypatch.setattr(
+        cache_module,
+        "get_content_signature",
+        lambda df: signatures.append(id(df)) or (df.height, id(df)),
+    )
+    cache = HashCache(use_content_signature=True)
+    df0, _ = _get_frames()
+    for columns in [["a"], ["b"], ["a", "b"], ["a"]]:
+        cache.get_hashes(df0, columns)
+    assert len(signatures) == 1
+    assert cache.hits == 1
+
+    del df0
+    gc.collect()
+    assert len(cache._signatures) == 0
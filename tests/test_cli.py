@@ -0,0 +1,118 @@
+import json
+
+import polars as pl
+import pytest
+
+from data_fingerprint.src.cli import main, parse_size
+from data_fingerprint.src import spill
+from data_fingerprint.src.comparator import get_data_report
+
+
+@pytest.fixture
+def files(tmp_path):
+    df0 = pl.DataFrame({"id": [1, 2, 3], "b": [1, 2, 3]})
+    df1 = pl.DataFrame({"id": [1, 2, 3], "b": [1, 2, 10]})
+    df0.write_parquet(tmp_path / "a.parquet")
+    df1.write_csv(tmp_path / "b.csv")
+    df1.write_ndjson(tmp_path / "b.ndjson")
+    return df0, df1, tmp_path
+
+
+def test_parse_size() -> None:
+    assert parse_size("1000") == 1000
+    assert parse_size("4GB") == 4 * 1000**3
+    assert parse_size("1.5 KiB") == 1536
+
+
+def test_compare_to_file(files) -> None:
+    df0, df1, tmp_path = files
+    output = tmp_path / "report.json"
+    code = main(
+        [
+            "compare",
+            str(tmp_path / "a.parquet"),
+            str(tmp_path / "b.csv"),
+            "--key",
+            "id",
+            "--threads",
+            "2",
+            "-o",
+            str(output),
+            "--exit-code",
+        ]
+    )
+    assert code == 1
+    expected = get_data_report(df0, df1, "a.parquet", "b.csv", ["id"])
+    assert json.loads(output.read_text()) == expected.model_dump(mode="json")
+
+
+def test_compare_jsonl_stdout(files, capsys) -> None:
+    df0, df1, tmp_path = files
+    code = main(
+        [
+            "compare",
+            str(tmp_path / "a.parquet"),
+            str(tmp_path / "b.ndjson"),
+            "--format",
+            "jsonl",
+        ]
+    )
+    assert code == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines[0]["kind"] == "summary"
+    assert lines[0]["df1_name"] == "b.ndjson"
+    assert [line["kind"] for line in lines[1:]] == ["row_difference"] * 2
+
+
+def test_compare_memory_budget(files, capsys, monkeypatch) -> None:
+    df0, _, tmp_path = files
+    calls = []
+    get_data_report_spilled = spill.get_data_report_spilled
+    monkeypatch.setattr(
+        spill,
+        "get_data_report_spilled",
+        lambda *args, **kwargs: calls.append(args)
+        or get_data_report_spilled(*args, **kwargs),
+    )
+    df0.with_columns(b=pl.Series([1, 2, 4])).write_parquet(tmp_path / "c.parquet")
+    main(
+        [
+            "compare",
+            str(tmp_path / "a.parquet"),
+            str(tmp_path / "c.parquet"),
+            "--memory-budget",
+            "1KB",
+        ]
+    )
+    report = json.loads(capsys.readouterr().out)
+    assert len(report["row_differences"]) == 2
+    assert len(calls) == 1
+
+
+def test_compare_error(tmp_path, capsys) -> None:
+    assert main(["compare", str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]) == 2
+    assert "Unknown file format" in capsys.readouterr().err
+
+
+def test_compare_large_value_threshold(tmp_path, capsys) -> None:
+    pl.DataFrame({"id": [1, 2], "payload": ["a", "x" * 5000]}).write_parquet(
+        tmp_path / "a.parquet"
+    )
+    pl.DataFrame({"id": [1, 2], "payload": ["a", "y" * 5000]}).write_parquet(
+        tmp_path / "b.parquet"
+    )
+    code = main(
+        [
+            "compare",
+            str(tmp_path / "a.parquet"),
+            str(tmp_path / "b.parquet"),
+            "--key",
+            "id",
+            "--large-value-threshold",
+            "1KB",
+        ]
+    )
+    assert code == 0
+    report = json.loads(capsys.readouterr().out)
+    payloads = report["row_differences"][0]["row"]["payload"]
+    assert [payload.startswith("<digest ") for payload in payloads] == [True, True]
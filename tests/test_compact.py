@@ -0,0 +1,67 @@
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_row_differences_paired
+from data_fingerprint.src.compact import (
+    CompactRowDifferences,
+    get_bitmask_expression,
+    get_compact_row_differences,
+)
+
+
+def test_bitmask_expression_wide() -> None:
+    columns = [f"c{index:03}" for index in range(70)]
+    df = pl.DataFrame({column: [column in ("c001", "c065")] for column in columns})
+    words = df.select(get_bitmask_expression(columns, columns))["changed"][0]
+    assert words.to_list() == [1 << 1, 1 << 1]
+
+
+@pytest.mark.parametrize("unique_key", [None, True])
+def test_get_compact_row_differences(unique_key) -> None:
+    df0 = pl.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 5],
+            "b": [1, 2, 3, 4, 5, 6],
+            "c": ["a", "b", "c", "d", "e", "f"],
+        }
+    )
+    df1 = pl.DataFrame(
+        {
+            "id": [1, 2, 3, 6, 5, 5],
+            "b": [1, 20, 3, 6, 5, 7],
+            "c": ["a", "b", "x", "f", "e", "f"],
+        }
+    )
+    if unique_key:
+        df0, df1 = df0.head(5), df1.head(5)
+    same_columns, column_differences, expected = get_row_differences_paired(
+        df0, df1, "df0", "df1", ["id"], unique_key=False
+    )
+    result = get_compact_row_differences(
+        df0, df1, "df0", "df1", ["id"], unique_key=unique_key
+    )
+
+    assert result[0] == same_columns
+    assert result[1] == column_differences
+    differences: CompactRowDifferences = result[2]
+    assert len(differences) == len(expected)
+    assert set(differences.to_row_differences()) == set(expected)
+    assert differences.estimated_size() > 0
+
+    changed_b = differences.differences.filter(differences.get_changed("b"))
+    assert changed_b["id"].to_list()[:1] == [2]
+    first_pair = differences.differences["source"].to_list().index(None)
+    assert differences.get_changed_columns(first_pair) == (
+        differences[first_pair].column_differences
+    )
+
+
+def test_get_compact_row_differences_identical() -> None:
+    df = pl.DataFrame({"id": [1, 2], "b": [1, 2]})
+    _, _, differences = get_compact_row_differences(
+        df, df.clone(), "df0", "df1", ["id"]
+    )
+    assert len(differences) == 0
+    assert differences.to_row_differences() == []
+    with pytest.raises(ValueError):
+        differences.get_changed("x")
@@ -411,3 +411,134 @@ def test_data_report():
     assert get_number_of_differences_per_source(report) == {df0_name: 2, df1_name: 2}
     assert get_ratio_of_differences_per_source(report) == {df0_name: 0.5, df1_name: 0.5}
     assert get_number_of_row_differences(report) == len(get_dataframe(report))
+
+
+def test_get_row_differences_duplicates_both_directions():
+    df0 = pl.DataFrame({"a": [1, 1, 1, 2, 2, 3, 3, 3, 3]})
+    df1 = pl.DataFrame({"a": [1, 2, 2, 2, 2, 3, 3, 4]})
+    expected_row_differences = [
+        RowDifference(
+            source="df0",
+            row={"a": [1, 1]},
+            number_of_occurrences=2,
+            difference_type=RowDifferenceType.MISSING_ROW,
+        ),
+        RowDifference(
+            source="df1",
+            row={"a": [2, 2]},
+            number_of_occurrences=2,
+            difference_type=RowDifferenceType.MISSING_ROW,
+        ),
+        RowDifference(
+            source="df0",
+            row={"a": [3, 3]},
+            number_of_occurrences=2,
+            difference_type=RowDifferenceType.MISSING_ROW,
+        ),
+        RowDifference(
+            source="df1",
+            row={"a": [4]},
+            number_of_occurrences=1,
+            difference_type=RowDifferenceType.MISSING_ROW,
+        ),
+    ]
+    _, _, row_differences = get_row_differences(df0, df1, "df0", "df1")
+    assert set(row_differences) == set(expected_row_differences)
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["a"]])
+def test_get_data_report_concurrent_sides(grouping_columns):
+    df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+    report = get_data_report(
+        df0.lazy(), df1.lazy(), "df0", "df1", grouping_columns, concurrent_sides=True
+    )
+    assert set(report.comparable_columns) == set(expected.comparable_columns)
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+@pytest.mark.parametrize("grouping_columns", [["a"], ["a", "k"]])
+def test_get_row_differences_paired_unique_key(grouping_columns):
+    df0 = pl.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5, 6, 7],
+            "k": ["x", "y", "z", "x", "y", "z", "x"],
+            "r": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+            "t": ["a", "b", "c", "d", "e", "f", "g"],
+        }
+    )
+    df1 = pl.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 8, 6, 7],
+            "k": ["x", "y", "z", "x", "y", "z", "x"],
+            "r": [1.0, 2.5, 3.0, 4.0, 5.0, 6.5, 0.0],
+            "t": ["a", "b", "c", "e", "e", "f", "h"],
+        }
+    )
+    expected = get_row_differences_paired(
+        df0, df1, "df0", "df1", grouping_columns, unique_key=False
+    )
+    for unique_key in [None, True]:
+        result = get_row_differences_paired(
+            df0, df1, "df0", "df1", grouping_columns, unique_key=unique_key
+        )
+        assert result[0] == expected[0]
+        assert set(result[2]) == set(expected[2])
+        assert len(result[2]) == len(expected[2])
+
+
+def test_get_row_differences_paired_unique_null_key():
+    df0 = pl.DataFrame({"a": [1, None], "b": [1, 2]})
+    df1 = pl.DataFrame({"a": [1, None], "b": [1, 3]})
+    _, _, row_differences = get_row_differences_paired(
+        df0, df1, "df0", "df1", ["a"], unique_key=True
+    )
+    assert row_differences == [
+        RowGroupDifference(
+            sources=["df0", "df1"],
+            row={"a": [None, None], "b": [2, 3]},
+            number_of_occurrences=2,
+            grouping_columns=["a"],
+            column_differences=["b"],
+            consise_information={
+                "a": [None, None],
+                "b": [2, 3],
+                "source": ["df0", "df1"],
+            },
+            row_with_source={"a": [None, None], "b": [2, 3], "source": ["df0", "df1"]},
+        )
+    ]
+
+
+def test_get_data_report_duplicate_keys():
+    df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"], unique_key=False)
+    report = get_data_report(df0, df1, "df0", "df1", ["a"])
+
+    assert set(report.row_differences) == set(expected.row_differences)
+    assert report.duplicate_keys == {"a": [3]}
+    assert expected.duplicate_keys is None
+
+
+def test_get_row_differences_paired_wide_table():
+    columns = {f"c{index}": list(range(4)) for index in range(600)}
+    df0 = pl.DataFrame({"a": [1, 2, None, 4], **columns})
+    df1 = df0.with_columns(
+        pl.when(pl.col("a") == 2).then(-1).otherwise(pl.col("c3")).alias("c3"),
+        pl.when(pl.col("a").is_null()).then(-1).otherwise(pl.col("c599")).alias("c599"),
+        pl.when(pl.col("a") == 2).then(-1).otherwise(pl.col("c17")).alias("c17"),
+    )
+    _, _, row_differences = get_row_differences_paired(
+        df0, df1, "df0", "df1", ["a"], unique_key=False
+    )
+    _, _, expected = get_row_differences_paired(
+        df0, df1, "df0", "df1", ["a"], unique_key=True
+    )
+
+    assert set(row_differences) == set(expected)
+    assert sorted(difference.column_differences for difference in row_differences) == [
+        ["c17", "c3"],
+        ["c599"],
+    ]
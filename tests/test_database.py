@@ -0,0 +1,148 @@
+import sqlite3
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.database import (
+    FrameSource,
+    SQLSource,
+    get_source_data_report,
+    portable_hash,
+    register_sqlite_hash_function,
+)
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame(
+        {
+            "id": [1, 2, 3, 3, 4, 5],
+            "name": ["a", "b", "c", "c", None, "e"],
+            "value": [1.0, 2.0, 3.0, 3.0, 4.0, 5.5],
+        }
+    )
+    df1 = pl.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 6],
+            "name": ["a", "b", "c", None, "x", "f"],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.5, 6.0],
+        }
+    )
+    return df0, df1
+
+
+@pytest.fixture
+def connection():
+    df0, _ = _get_frames()
+    connection = sqlite3.connect(":memory:")
+    register_sqlite_hash_function(connection)
+    connection.execute("CREATE TABLE orders (id INTEGER, name TEXT, value REAL)")
+    connection.executemany("INSERT INTO orders VALUES (?, ?, ?)", df0.rows())
+    yield connection
+    connection.close()
+
+
+def test_portable_hash_in_sql(connection) -> None:
+    assert connection.execute(
+        "SELECT data_fingerprint_hash(id, name, value) FROM orders WHERE id = 4"
+    ).fetchone()[0] == portable_hash(4, None, 4.0)
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["id"]])
+def test_get_source_data_report(connection, grouping_columns) -> None:
+    df0, df1 = _get_frames()
+    executed: list[str] = []
+    connection.set_trace_callback(executed.append)
+
+    report = get_source_data_report(
+        SQLSource(connection, "SELECT * FROM orders", chunk_size=2),
+        FrameSource(df1, chunk_size=4),
+        "df0",
+        "df1",
+        grouping_columns,
+    )
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+    assert (report.df0_length, report.df1_length) == (6, 6)
+    assert set(report.comparable_columns) == {"id", "name", "value"}
+    assert set(report.row_differences) == set(expected.row_differences)
+    # the hashes are counted in SQL
+    assert any("GROUP BY" in sql for sql in executed)
+
+
+def test_sql_source_chunks(connection) -> None:
+    source = SQLSource(
+        connection, "SELECT id, name FROM orders WHERE id > 1", chunk_size=2
+    )
+    chunks = list(source.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert len(source) == 5
+    assert source.get_hash_counts(["id", "name"])["count"].sum() == 5
+    assert source.get_rows_by_hashes(
+        ["id", "name"], [portable_hash(2, "b")]
+    ).rows() == [(2, "b", portable_hash(2, "b"))]
+
+
+def test_frame_source_portable_hash() -> None:
+    df = pl.DataFrame(
+        {
+            "a": [1, None, -3],
+            "b": ["x", "y", None],
+            "c": [0.1, 1e20, None],
+            "d": [True, None, False],
+            "e": [b"\x00\xff", None, b""],
+            "f": [date(2024, 1, 1), None, date(1999, 12, 31)],
+            "g": [datetime(2024, 1, 1, 12), datetime(2024, 1, 1, 0, 0, 1, 5), None],
+        }
+    )
+    hashes = FrameSource(df, chunk_size=2).get_rows_by_hashes(
+        df.columns, [portable_hash(*row) for row in df.rows()]
+    )
+    assert hashes["hash"].to_list() == [portable_hash(*row) for row in df.rows()]
+
+
+def test_sql_source_schema_with_nulls(connection) -> None:
+    connection.execute("CREATE TABLE sparse (id INTEGER, amount REAL, note TEXT)")
+    connection.executemany(
+        "INSERT INTO sparse VALUES (?, ?, ?)", [(1, None, None), (2, None, "x")]
+    )
+    source = SQLSource(
+        connection,
+        "SELECT id, amount, note, id * 2 AS doubled FROM sparse",
+        chunk_size=1,
+    )
+    assert source.schema == pl.Schema(
+        {"id": pl.Int64, "amount": pl.Float64, "note": pl.String, "doubled": pl.Int64}
+    )
+    report = get_source_data_report(
+        source,
+        FrameSource(
+            pl.DataFrame(
+                {
+                    "id": [1, 2],
+                    "amount": [None, None],
+                    "note": [None, "x"],
+                    "doubled": [2, 4],
+                },
+                schema=source.schema,
+            )
+        ),
+        "sql",
+        "frame",
+    )
+    assert report.column_differences == []
+    assert report.row_differences == []
+
+
+def test_get_source_data_report_same_names(connection) -> None:
+    df0, df1 = _get_frames()
+    with pytest.raises(ValueError):
+        get_source_data_report(FrameSource(df0), FrameSource(df1), "df", "df")
+
+
+def test_sql_source_schema_drops_temp_view(connection) -> None:
+    source = SQLSource(connection, "SELECT id, name FROM orders")
+    assert list(source.schema) == ["id", "name"]
+    with pytest.raises(sqlite3.OperationalError):
+        _ = SQLSource(connection, "SELECT missing FROM orders").schema
+    assert connection.execute("SELECT name FROM sqlite_temp_master").fetchall() == []
@@ -0,0 +1,100 @@
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.digest import (
+    digest_large_values,
+    fetch_large_value,
+    parse_digest_token,
+)
+from data_fingerprint.src.spill import get_data_report_spilled
+
+
+def _get_dataframes() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "payload": ["small", "x" * 5000, "y" * 5000],
+            "blob": [b"a", b"\xff" * 3000, b"b"],
+        }
+    )
+    df1 = pl.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "payload": ["small", "x" * 5000, "z" * 5000],
+            "blob": [b"a", b"\xfe" * 3000, b"b"],
+        }
+    )
+    return df0, df1
+
+
+def test_digest_large_values() -> None:
+    df0, _ = _get_dataframes()
+    digested = digest_large_values(df0, 1024, ["id"])
+
+    assert digested.schema == df0.schema
+    assert digested["payload"][0] == "small"
+    assert parse_digest_token(digested["payload"][1])[1] == 5000
+    assert parse_digest_token(digested["blob"][1])[1] == 3000
+    assert parse_digest_token("small") is None
+    assert (
+        digest_large_values(df0.lazy(), 1024)
+        .collect()
+        .equals(digest_large_values(df0, 1024))
+    )
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["id"]])
+def test_get_data_report_large_value_threshold(grouping_columns) -> None:
+    df0, df1 = _get_dataframes()
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+    report = get_data_report(
+        df0, df1, "df0", "df1", grouping_columns, large_value_threshold=1024
+    )
+
+    assert report.model_dump(exclude={"row_differences"}) == expected.model_dump(
+        exclude={"row_differences"}
+    )
+    assert len(report.row_differences) == len(expected.row_differences)
+    sources = {"df0": df0, "df1": df1}
+    for difference in report.row_differences:
+        row = getattr(difference, "row_with_source", None) or {
+            **difference.row,
+            "source": [difference.source] * difference.number_of_occurrences,
+        }
+        for column in ["payload", "blob"]:
+            for value, source in zip(row[column], row["source"]):
+                assert len(value) < 1024
+                if parse_digest_token(value) is not None:
+                    payload = fetch_large_value(sources[source], column, value)
+                    assert payload in sources[source][column]
+
+
+def test_get_data_report_spilled_large_value_threshold(tmp_path) -> None:
+    df0, df1 = _get_dataframes()
+    expected = get_data_report(
+        df0, df1, "df0", "df1", ["id"], large_value_threshold=1024
+    )
+    report = get_data_report_spilled(
+        df0,
+        df1,
+        "df0",
+        "df1",
+        ["id"],
+        number_of_partitions=2,
+        large_value_threshold=1024,
+        temporary_directory=str(tmp_path),
+    )
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+def test_fetch_large_value(tmp_path) -> None:
+    df0, _ = _get_dataframes()
+    df0.write_parquet(tmp_path / "df0.parquet")
+    token = digest_large_values(df0, 1024)["payload"][2]
+
+    assert fetch_large_value(tmp_path / "df0.parquet", "payload", token) == "y" * 5000
+    with pytest.raises(ValueError):
+        fetch_large_value(df0, "payload", "small")
+    with pytest.raises(ValueError):
+        fetch_large_value(df0, "payload", "<digest 1 length 5000>")
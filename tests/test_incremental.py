@@ -0,0 +1,166 @@
+import datetime
+
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.incremental import get_incremental_data_report
+from data_fingerprint.src.models import IncrementalState
+
+DAY_1 = datetime.datetime(2024, 1, 1)
+DAY_2 = datetime.datetime(2024, 1, 2)
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame(
+        {"id": [1, 2, 3, 4], "value": [1, 2, 3, 4], "updated_at": [DAY_1] * 4}
+    )
+    df1 = pl.DataFrame(
+        {"id": [1, 2, 3, 4], "value": [1, 2, 30, 40], "updated_at": [DAY_1] * 4}
+    )
+    return df0, df1
+
+
+def _compare(df0, df1, state=None) -> IncrementalState:
+    return get_incremental_data_report(
+        df0,
+        df1,
+        "df0",
+        "df1",
+        ["id"],
+        "updated_at",
+        state=state,
+        exclude_columns=["updated_at"],
+    )
+
+
+def test_incremental_data_report() -> None:
+    df0, df1 = _get_frames()
+    state = _compare(df0, df1)
+    assert state.watermark == DAY_1
+    assert len(state.data_report.row_differences) == 2
+
+    # id 3 is fixed, id 1 breaks and id 5 is added on one side only
+    df1 = df1.with_columns(
+        pl.when(pl.col("id") == 3).then(3).otherwise(pl.col("value")).alias("value"),
+        pl.when(pl.col("id") == 3)
+        .then(DAY_2)
+        .otherwise(pl.col("updated_at"))
+        .alias("updated_at"),
+    )
+    df0 = pl.concat(
+        [
+            df0.with_columns(
+                pl.when(pl.col("id") == 1)
+                .then(10)
+                .otherwise(pl.col("value"))
+                .alias("value"),
+                pl.when(pl.col("id") == 1)
+                .then(DAY_2)
+                .otherwise(pl.col("updated_at"))
+                .alias("updated_at"),
+            ),
+            pl.DataFrame({"id": [5], "value": [5], "updated_at": [DAY_2]}),
+        ]
+    )
+    # the state survives a round trip through JSON
+    state = IncrementalState.model_validate_json(state.model_dump_json())
+    state = _compare(df0, df1, state)
+    expected = get_data_report(
+        df0.drop("updated_at"), df1.drop("updated_at"), "df0", "df1", ["id"]
+    )
+    assert state.watermark == DAY_2
+    assert (state.data_report.df0_length, state.data_report.df1_length) == (5, 4)
+    assert set(state.data_report.row_differences) == set(expected.row_differences)
+
+
+def test_incremental_data_report_without_changes() -> None:
+    df0, df1 = _get_frames()
+    state = _compare(df0, df1)
+    assert _compare(df0, df1, state) == state
+
+
+def test_incremental_data_report_late_rows() -> None:
+    df0, df1 = _get_frames()
+    state = _compare(df0, df1)
+    # id 5 is written late with the same watermark as the last run
+    df0 = pl.concat(
+        [df0, pl.DataFrame({"id": [5], "value": [5], "updated_at": [DAY_1]})]
+    )
+    state = _compare(df0, df1, state)
+    expected = get_data_report(
+        df0.drop("updated_at"), df1.drop("updated_at"), "df0", "df1", ["id"]
+    )
+    assert state.watermark == DAY_1
+    assert len(state.data_report.row_differences) == 3
+    assert set(state.data_report.row_differences) == set(expected.row_differences)
+
+
+def test_incremental_data_report_duplicate_keys() -> None:
+    df0, df1 = _get_frames()
+    df0 = pl.concat(
+        [df0, pl.DataFrame({"id": [2], "value": [20], "updated_at": [DAY_1]})]
+    )
+    state = _compare(df0, df1)
+    assert state.data_report.duplicate_keys == {"id": [2]}
+
+    # only id 4 changes, the duplicated id 2 is kept from the state
+    df1 = df1.with_columns(
+        pl.when(pl.col("id") == 4)
+        .then(DAY_2)
+        .otherwise(pl.col("updated_at"))
+        .alias("updated_at")
+    )
+    state = _compare(df0, df1, state)
+    assert state.data_report.duplicate_keys == {"id": [2]}
+
+    # id 2 is fixed
+    df0 = df0.filter(pl.col("value") != 20).with_columns(
+        pl.when(pl.col("id") == 2)
+        .then(DAY_2)
+        .otherwise(pl.col("updated_at"))
+        .alias("updated_at")
+    )
+    state = _compare(df0, df1, state)
+    assert state.data_report.duplicate_keys is None
+
+
+def test_incremental_data_report_other_state() -> None:
+    df0, df1 = _get_frames()
+    state = _compare(df0, df1)
+    with pytest.raises(ValueError):
+        get_incremental_data_report(
+            df0, df1, "df0", "df1", ["value"], "updated_at", state=state
+        )
+    with pytest.raises(ValueError):
+        get_incremental_data_report(
+            df0.drop("updated_at"), df1, "df0", "df1", ["id"], "updated_at"
+        )
+
+
+def test_incremental_data_report_null_keys() -> None:
+    df0, df1 = _get_frames()
+    null_row = pl.DataFrame(
+        {"id": [None], "value": [5], "updated_at": [DAY_1]},
+        schema=df0.schema,
+    )
+    df0, df1 = pl.concat([df0, null_row]), pl.concat([df1, null_row])
+    state = _compare(df0, df1)
+
+    # the row with the null key changes and must be compared again
+    df1 = df1.with_columns(
+        pl.when(pl.col("id").is_null())
+        .then(50)
+        .otherwise(pl.col("value"))
+        .alias("value"),
+        pl.when(pl.col("id").is_null())
+        .then(DAY_2)
+        .otherwise(pl.col("updated_at"))
+        .alias("updated_at"),
+    )
+    state = _compare(df0, df1, state)
+    expected = get_data_report(
+        df0, df1, "df0", "df1", ["id"], exclude_columns=["updated_at"]
+    )
+    assert len(state.data_report.row_differences) == len(expected.row_differences)
+    assert state.data_report.row_differences == expected.row_differences
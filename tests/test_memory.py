@@ -0,0 +1,61 @@
+import polars as pl
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.memory import (
+    get_peak_rss_bytes,
+    get_rss_bytes,
+    record_frame_size,
+    track_stage,
+)
+from data_fingerprint.src.models import MemoryProfile
+
+
+def test_track_stage_without_profile() -> None:
+    with track_stage(None, "stage") as stage_memory:
+        record_frame_size(stage_memory, "frame", pl.DataFrame({"a": [1, 2, 3]}))
+    assert stage_memory is None
+
+
+def test_track_stage_records_sizes() -> None:
+    profile = MemoryProfile()
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    with track_stage(profile, "stage") as stage_memory:
+        record_frame_size(stage_memory, "frame", df)
+        record_frame_size(stage_memory, "frame", df)
+
+    stage = profile.get_stage("stage")
+    assert stage is not None
+    assert stage.frame_sizes == {"frame": 2 * df.estimated_size("b")}
+    assert stage.estimated_size == 2 * df.estimated_size("b")
+    assert profile.get_stage("missing") is None
+
+
+def test_rss() -> None:
+    rss = get_rss_bytes()
+    peak_rss = get_peak_rss_bytes()
+    assert rss is None or rss > 0
+    assert peak_rss is None or peak_rss > 0
+
+
+def test_data_report_memory_profile() -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    profile = MemoryProfile()
+    report = get_data_report(
+        df0, df1, "df0", "df1", ["a"], memory_profile=profile, unique_key=False
+    )
+
+    assert [stage.stage for stage in profile.stages] == [
+        "column_differences",
+        "hashing",
+        "row_differences",
+        "pairing",
+    ]
+    hashing = profile.get_stage("hashing")
+    assert hashing.frame_sizes["df0_subset"] > 0
+    assert hashing.frame_sizes["df1_subset"] > 0
+    assert profile.get_stage("row_differences").estimated_size > 0
+    assert profile.get_stage("pairing").frame_sizes["difference_dataframe"] > 0
+    assert profile.peak_estimated_size >= hashing.estimated_size
+    assert len(report.row_differences) == 3
+    assert "rss_delta" in profile.model_dump()["stages"][0]
@@ -0,0 +1,133 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import polars as pl
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.merge import merge_data_reports
+from data_fingerprint.src.models import DataReport
+from data_fingerprint.src.utils import get_number_of_differences_per_source
+
+
+def _get_shards() -> list[tuple[pl.DataFrame, pl.DataFrame]]:
+    # row (7, 7) is in df0 on the first shard and in df1 on the second shard
+    # row (3, 10) is duplicated over both shards
+    return [
+        (
+            pl.DataFrame({"a": [1, 2, 3, 7], "b": [1, 2, 3, 7]}),
+            pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]}),
+        ),
+        (
+            pl.DataFrame({"a": [3, 3, 4], "b": [10, 10, 15]}),
+            pl.DataFrame({"a": [3, 4, 7], "b": [10, 20, 7]}),
+        ),
+        (
+            pl.DataFrame({"a": [3, 8], "b": [10, 8]}),
+            pl.DataFrame({"a": [5], "b": [24]}),
+        ),
+    ]
+
+
+def _get_whole() -> tuple[pl.DataFrame, pl.DataFrame]:
+    shards = _get_shards()
+    return (
+        pl.concat([shard0 for shard0, _ in shards]),
+        pl.concat([shard1 for _, shard1 in shards]),
+    )
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["a"]])
+def test_merge_is_same_as_whole(grouping_columns) -> None:
+    df0, df1 = _get_whole()
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+    reports = [
+        get_data_report(shard0, shard1, "df0", "df1", grouping_columns)
+        for shard0, shard1 in _get_shards()
+    ]
+    report = merge_data_reports(reports, grouping_columns)
+    assert set(report.row_differences) == set(expected.row_differences)
+    assert report.df0_length == expected.df0_length
+    assert report.df1_length == expected.df1_length
+    assert get_number_of_differences_per_source(
+        report
+    ) == get_number_of_differences_per_source(expected)
+
+
+def test_merge_is_associative() -> None:
+    reports = [
+        get_data_report(shard0, shard1, "df0", "df1", ["a"])
+        for shard0, shard1 in _get_shards()
+    ]
+    left = merge_data_reports([merge_data_reports(reports[:2]), reports[2]])
+    right = merge_data_reports([reports[0], merge_data_reports(reports[1:])])
+    assert set(left.row_differences) == set(right.row_differences)
+    assert set(left.row_differences) == set(merge_data_reports(reports).row_differences)
+
+
+def test_merge_duplicate_keys() -> None:
+    reports = [
+        get_data_report(shard0, shard1, "df0", "df1", ["a"])
+        for shard0, shard1 in _get_shards()
+    ]
+    assert reports[1].duplicate_keys is not None
+    expected = {
+        key
+        for r in reports
+        if r.duplicate_keys is not None
+        for key in r.duplicate_keys["a"]
+    }
+    report = merge_data_reports(reports, ["a"])
+    assert set(report.duplicate_keys["a"]) == expected
+    assert len(report.duplicate_keys["a"]) == len(expected)
+    assert merge_data_reports([reports[0]], ["a"]).duplicate_keys is None
+
+
+def test_merge_column_differences() -> None:
+    df0 = pl.DataFrame({"a": [1], "b": [1]})
+    df1 = pl.DataFrame({"a": [1], "c": [1]})
+    reports = [get_data_report(df0, df1, "df0", "df1") for _ in range(2)]
+    report = merge_data_reports(reports)
+    assert set(report.column_differences) == set(reports[0].column_differences)
+    assert len(report.column_differences) == 2
+    assert report.row_differences == []
+
+
+def test_merge_invalid_reports() -> None:
+    df0 = pl.DataFrame({"a": [1], "b": [1]})
+    with pytest.raises(ValueError, match=".*At least one data report.*"):
+        merge_data_reports([])
+    with pytest.raises(ValueError, match=".*same sources.*"):
+        merge_data_reports(
+            [
+                get_data_report(df0, df0, "df0", "df1"),
+                get_data_report(df0, df0, "df0", "df2"),
+            ]
+        )
+    with pytest.raises(ValueError, match=".*same comparable columns.*"):
+        merge_data_reports(
+            [
+                get_data_report(df0, df0, "df0", "df1"),
+                get_data_report(df0, df0.drop("b"), "df0", "df1"),
+            ]
+        )
+
+
+def test_merge_multi_process_shards() -> None:
+    df0, df1 = _get_whole()
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"])
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        reports: list[DataReport] = list(
+            executor.map(
+                get_data_report,
+                [shard0 for shard0, _ in _get_shards()],
+                [shard1 for _, shard1 in _get_shards()],
+                ["df0"] * 3,
+                ["df1"] * 3,
+                [["a"]] * 3,
+            )
+        )
+    report = merge_data_reports(reports, ["a"])
+    assert set(report.row_differences) == set(expected.row_differences)
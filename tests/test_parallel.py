@@ -0,0 +1,84 @@
+import datetime
+
+import pytest
+import polars as pl
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.parallel import (
+    get_data_report_partitioned,
+    partition_by_hash,
+)
+from data_fingerprint.src.progress import CancellationToken, ComparisonCancelledError
+from data_fingerprint.src.utils import get_number_of_row_differences
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame(
+        {
+            "a": [1, 2, 3, 3, 3, 4, 6, 7, 7],
+            "b": [1, 2, 3, 10, 10, 15, 6, 7, 7],
+            "c": [datetime.datetime(2021, 1, i) for i in range(1, 10)],
+        }
+    )
+    df1 = pl.DataFrame(
+        {
+            "a": [1, 2, 3, 3, 4, 5, 6, 7],
+            "b": [1, 2, 3, 10, 20, 24, 6, 7],
+            "c": [datetime.datetime(2021, 1, i) for i in range(1, 9)],
+        }
+    )
+    return df0, df1
+
+
+def test_partition_by_hash() -> None:
+    df = pl.DataFrame({"a": [1, 2, 3, 3, 4], "b": [1, 2, 3, 4, 5]})
+    partitions = partition_by_hash(df, ["a"], 3)
+    assert sum(len(p) for p in partitions.values()) == len(df)
+    assert all(p.columns == ["a", "b"] for p in partitions.values())
+    # rows with the same key are in the same partition
+    assert sum(1 for p in partitions.values() if 3 in p["a"]) == 1
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["a"]])
+def test_partitioned_report_is_same(grouping_columns) -> None:
+    df0, df1 = _get_frames()
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+    report = get_data_report_partitioned(
+        df0, df1, "df0", "df1", grouping_columns, number_of_partitions=4
+    )
+    assert set(report.row_differences) == set(expected.row_differences)
+    assert set(report.column_differences) == set(expected.column_differences)
+    assert set(report.comparable_columns) == set(expected.comparable_columns)
+    assert report.df0_length == expected.df0_length
+    assert report.df1_length == expected.df1_length
+    assert (report.duplicate_keys is None) == (expected.duplicate_keys is None)
+    if expected.duplicate_keys is not None:
+        assert sorted(report.duplicate_keys["a"]) == sorted(
+            expected.duplicate_keys["a"]
+        )
+
+
+def test_partitioned_report_processes() -> None:
+    df0, df1 = _get_frames()
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"])
+    report = get_data_report_partitioned(
+        df0, df1, "df0", "df1", ["a"], max_workers=2, use_processes=True
+    )
+    assert set(report.row_differences) == set(expected.row_differences)
+    assert get_number_of_row_differences(report) == get_number_of_row_differences(
+        expected
+    )
+
+
+def test_partitioned_report_invalid_grouping() -> None:
+    df0, df1 = _get_frames()
+    with pytest.raises(ValueError, match=".*Pairing columns must be the same.*"):
+        get_data_report_partitioned(df0, df1.drop("a"), "df0", "df1", ["a"])
+
+
+def test_partitioned_report_cancellation() -> None:
+    df0, df1 = _get_frames()
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(ComparisonCancelledError):
+        get_data_report_partitioned(df0, df1, "df0", "df1", cancellation_token=token)
@@ -0,0 +1,150 @@
+import datetime
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pytest
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.parquet import (
+    get_parquet_data_report,
+    get_parquet_data_report_by_row_groups,
+    get_row_group_fingerprints,
+    match_row_groups,
+)
+from data_fingerprint.src.sidecar import read_hash_sidecar, write_hash_sidecar
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame(
+        {"a": list(range(100)) + [3, 3], "b": list(range(100)) + [10, 10]}
+    )
+    df1 = df0.with_columns(
+        pl.when(pl.col("a") == 50).then(-1).otherwise(pl.col("b")).alias("b")
+    ).head(101)
+    return df0, df1
+
+
+def _write(df: pl.DataFrame, path) -> str:
+    df.write_parquet(path, row_group_size=10)
+    return str(path)
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["a"]])
+@pytest.mark.parametrize("sidecars", [(False, False), (True, False), (True, True)])
+def test_parquet_data_report(tmp_path, grouping_columns, sidecars) -> None:
+    df0, df1 = _get_frames()
+    path0 = _write(df0, tmp_path / "df0.parquet")
+    path1 = _write(df1, tmp_path / "df1.parquet")
+    for path, write in zip([path0, path1], sidecars):
+        if write:
+            write_hash_sidecar(path)
+
+    report = get_parquet_data_report(path0, path1, "df0", "df1", grouping_columns)
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+    assert (report.df0_length, report.df1_length) == (102, 101)
+    assert set(report.comparable_columns) == set(expected.comparable_columns)
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+def test_parquet_data_report_reads_file_once(tmp_path, monkeypatch) -> None:
+    df0, df1 = _get_frames()
+    path0 = _write(df0, tmp_path / "df0.parquet")
+    path1 = _write(df1, tmp_path / "df1.parquet")
+    write_hash_sidecar(path0)
+
+    read_paths: list[str] = []
+    read_parquet = pl.read_parquet
+
+    def _read_parquet(source, *args, **kwargs):
+        read_paths.append(str(source))
+        return read_parquet(source, *args, **kwargs)
+
+    monkeypatch.setattr(pl, "read_parquet", _read_parquet)
+    report = get_parquet_data_report(path0, path1, "df0", "df1", ["a"])
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"])
+    assert read_paths == [path1]
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+def test_parquet_data_report_arrow_types(tmp_path) -> None:
+    df0 = pl.DataFrame(
+        {
+            "a": list(range(30)),
+            "s": [f"v{i % 3}" for i in range(30)],
+            "ts": [datetime.datetime(2024, 1, 1, 0, 0, i) for i in range(30)],
+        }
+    )
+    df1 = df0.with_columns(
+        pl.when(pl.col("a") == 15).then(pl.lit("w")).otherwise("s").alias("s")
+    )
+    paths = []
+    for name, df in [("df0", df0), ("df1", df1)]:
+        table = df.to_arrow()
+        table = table.set_column(1, "s", pc.dictionary_encode(table["s"])).set_column(
+            2, "ts", table["ts"].cast(pa.timestamp("s"))
+        )
+        paths.append(str(tmp_path / f"{name}.parquet"))
+        pq.write_table(table, paths[-1], row_group_size=10)
+        write_hash_sidecar(paths[-1])
+
+    report = get_parquet_data_report(*paths, "df0", "df1", ["a"])
+    expected = get_data_report(
+        pl.read_parquet(paths[0]), pl.read_parquet(paths[1]), "df0", "df1", ["a"]
+    )
+    assert len(report.row_differences) == 1
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+def test_parquet_data_report_same_digest(tmp_path) -> None:
+    df0, _ = _get_frames()
+    path0 = _write(df0, tmp_path / "df0.parquet")
+    path1 = _write(df0.reverse(), tmp_path / "df1.parquet")
+    report = get_parquet_data_report(path0, path1, "df0", "df1", write_sidecars=True)
+    assert read_hash_sidecar(path0).digest == read_hash_sidecar(path1).digest
+    assert report.row_differences == []
+    assert report.df0_length == report.df1_length == len(df0)
+
+
+def test_row_group_fingerprints(tmp_path) -> None:
+    df0, _ = _get_frames()
+    path = _write(df0, tmp_path / "df0.parquet")
+    fingerprints = get_row_group_fingerprints(path)
+    assert [f.number_of_rows for f in fingerprints] == [10] * 10 + [2]
+    assert fingerprints[0].statistics["a"] == ("0", "9", 0)
+    assert [f.digest for f in fingerprints] == write_hash_sidecar(
+        path
+    ).row_group_digests
+    assert get_row_group_fingerprints(path, compute_digests=False) == fingerprints
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["a"]])
+def test_parquet_data_report_by_row_groups(tmp_path, grouping_columns) -> None:
+    df0, df1 = _get_frames()
+    # an update in the 6th row group and an appended row group
+    df1 = pl.concat([df1, pl.DataFrame({"a": [200], "b": [200]})])
+    path0 = _write(df0, tmp_path / "df0.parquet")
+    path1 = _write(df1, tmp_path / "df1.parquet")
+
+    read_row_groups: list[tuple[int, int]] = []
+    report = get_parquet_data_report_by_row_groups(
+        path0,
+        path1,
+        "df0",
+        "df1",
+        grouping_columns,
+        progress_callback=lambda stage, processed, total: (
+            read_row_groups.append((processed, total))
+            if stage == "row_groups"
+            else None
+        ),
+    )
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+    assert match_row_groups(path0, path1, ["a", "b"]) == [
+        (i, i) for i in range(10) if i != 5
+    ]
+    # only the updated and the last row groups are read
+    assert [total for _, total in read_row_groups] == [2, 2, 2, 2, 2, 2]
+    assert (report.df0_length, report.df1_length) == (len(df0), len(df1))
+    assert set(report.row_differences) == set(expected.row_differences)
@@ -0,0 +1,115 @@
+import polars as pl
+import pytest
+
+from data_fingerprint.src import comparator, planner
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.difference_types import ExecutionStrategy
+from data_fingerprint.src.planner import (
+    execute_plan,
+    get_data_report_planned,
+    plan_comparison,
+)
+
+
+def test_plan_comparison_hash() -> None:
+    df0 = pl.DataFrame({"a": [3, 1, 2], "b": [1, 2, 3]})
+    df1 = pl.DataFrame({"a": [3, 1, 1], "b": [1, 2, 10]})
+    plan = plan_comparison(df0, df1, "df0", "df1", ["a"], max_workers=4)
+
+    assert plan.strategy == ExecutionStrategy.HASH
+    assert plan.df0_rows == 3
+    assert plan.number_of_columns == 2
+    assert plan.keys_unique is False
+    assert plan.presorted is False
+    unique_plan = plan_comparison(df0, df1, "df0", "df1", ["b"], max_workers=4)
+    assert unique_plan.keys_unique is True
+    assert plan.estimates[0].estimated_cost > next(
+        estimate.estimated_cost
+        for estimate in unique_plan.estimates
+        if estimate.strategy == ExecutionStrategy.HASH
+    )
+    assert {estimate.strategy for estimate in plan.estimates} == {
+        ExecutionStrategy.HASH,
+        ExecutionStrategy.PARTITIONED,
+    }
+    assert "Strategy: HASH" in plan.explain()
+
+    report = execute_plan(plan, df0, df1)
+    assert set(report.row_differences) == set(
+        get_data_report(df0, df1, "df0", "df1", ["a"]).row_differences
+    )
+
+
+def test_plan_comparison_sort_merge() -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]})
+    df1 = pl.DataFrame({"a": [1, 2, 4], "b": [1, 5, 3]})
+    plan = plan_comparison(df0, df1, "df0", "df1", ["a"], max_workers=1)
+
+    assert plan.strategy == ExecutionStrategy.SORT_MERGE
+    assert plan.keys_unique is True
+    assert (
+        len(get_data_report_planned(df0, df1, "df0", "df1", ["a"]).row_differences) > 0
+    )
+
+
+def test_execute_plan_sort_merge_streams_sources(tmp_path, monkeypatch) -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]})
+    df1 = pl.DataFrame({"a": [1, 2, 4], "b": [1, 5, 3]})
+    paths = [str(tmp_path / "df0.csv"), str(tmp_path / "df1.csv")]
+    df0.write_csv(paths[0])
+    df1.write_csv(paths[1])
+    plan = plan_comparison(*paths, "df0", "df1", ["a"], max_workers=1)
+    assert plan.strategy == ExecutionStrategy.SORT_MERGE
+
+    def _collect_source(*args, **kwargs):
+        raise AssertionError("the sort-merge sources must not be collected")
+
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"])
+    monkeypatch.setattr(planner, "collect_source", _collect_source)
+    monkeypatch.setattr(comparator, "collect_source", _collect_source)
+    report = execute_plan(plan, *paths)
+    assert set(report.row_differences) == set(expected.row_differences)
+
+
+def test_plan_comparison_memory_budget(tmp_path) -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]})
+    df1 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 4]})
+    df0.write_parquet(tmp_path / "df0.parquet")
+    df1.write_parquet(tmp_path / "df1.parquet")
+    paths = [str(tmp_path / "df0.parquet"), str(tmp_path / "df1.parquet")]
+
+    unlimited = plan_comparison(*paths, "df0", "df1", max_workers=1)
+    estimates = {estimate.strategy: estimate for estimate in unlimited.estimates}
+    parquet_memory = estimates[ExecutionStrategy.PARQUET_HASHES].estimated_memory
+    assert parquet_memory >= unlimited.estimated_size
+    assert parquet_memory < estimates[ExecutionStrategy.HASH].estimated_memory
+
+    plan = plan_comparison(
+        *paths, "df0", "df1", memory_budget=parquet_memory, max_workers=1
+    )
+    assert plan.strategy == ExecutionStrategy.PARQUET_HASHES
+    tight = plan_comparison(*paths, "df0", "df1", memory_budget=200, max_workers=1)
+    assert tight.strategy == ExecutionStrategy.SPILL
+
+    report = execute_plan(plan, *paths)
+    assert set(report.row_differences) == set(
+        get_data_report(df0, df1, "df0", "df1").row_differences
+    )
+
+
+def test_plan_comparison_same_names() -> None:
+    df = pl.DataFrame({"a": [1]})
+    with pytest.raises(ValueError):
+        plan_comparison(df, df, "df", "df")
+
+
+def test_plan_comparison_spill() -> None:
+    df0 = pl.DataFrame({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+    df1 = df0.with_columns(b=pl.col("b").str.replace("7", "x"))
+    plan = plan_comparison(df0, df1, "df0", "df1", memory_budget=1000, max_workers=1)
+
+    assert plan.strategy == ExecutionStrategy.SPILL
+    report = execute_plan(plan, df0, df1)
+    assert set(report.row_differences) == set(
+        get_data_report(df0, df1, "df0", "df1").row_differences
+    )
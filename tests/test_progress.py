@@ -0,0 +1,72 @@
+import pytest
+import polars as pl
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.progress import (
+    CancellationToken,
+    ComparisonCancelledError,
+    track_progress,
+)
+
+
+def test_track_progress() -> None:
+    calls: list[tuple[str, int, int]] = []
+    items = list(track_progress(["x", "y"], "stage", lambda *a: calls.append(a), None))
+    assert items == ["x", "y"]
+    assert calls == [("stage", 0, 2), ("stage", 1, 2), ("stage", 2, 2)]
+
+
+def test_cancellation_token() -> None:
+    token = CancellationToken()
+    assert not token.is_cancelled
+    token.raise_if_cancelled()
+
+    token.cancel()
+    assert token.is_cancelled
+    with pytest.raises(ComparisonCancelledError):
+        token.raise_if_cancelled()
+
+
+def test_data_report_progress() -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    calls: list[tuple[str, int, int]] = []
+    get_data_report(
+        df0,
+        df1,
+        "df0",
+        "df1",
+        ["a"],
+        progress_callback=lambda *a: calls.append(a),
+        unique_key=False,
+    )
+
+    stages: set[str] = {stage for stage, _, _ in calls}
+    assert stages == {
+        "row_differences_df0",
+        "row_differences_df1",
+        "duplicates",
+        "pairing",
+    }
+    assert ("row_differences_df0", 1, 1) in calls
+    assert ("row_differences_df1", 2, 2) in calls
+    assert ("pairing", 3, 3) in calls
+
+
+def test_data_report_cancellation() -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]})
+    df1 = pl.DataFrame({"a": [1, 2, 4], "b": [1, 2, 4]})
+    token = CancellationToken()
+
+    def cancel_on_first_item(stage: str, processed: int, total: int) -> None:
+        token.cancel()
+
+    with pytest.raises(ComparisonCancelledError):
+        get_data_report(
+            df0,
+            df1,
+            "df0",
+            "df1",
+            progress_callback=cancel_on_first_item,
+            cancellation_token=token,
+        )
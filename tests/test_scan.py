@@ -0,0 +1,110 @@
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.scan import collect_source, get_projection, scan_source
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3], "updated_at": [1, 1, 1]})
+    df1 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 10], "updated_at": [2, 2, 2]})
+    return df0, df1
+
+
+def test_get_projection() -> None:
+    columns = ["a", "b", "c"]
+    assert get_projection(columns) == columns
+    assert get_projection(columns, include_columns=["c", "a", "d"]) == ["a", "c"]
+    assert get_projection(columns, exclude_columns=["b"]) == ["a", "c"]
+    assert get_projection(columns, ["a", "b"], ["b"]) == ["a"]
+
+
+def test_collect_source_pushes_projection(tmp_path) -> None:
+    df0, _ = _get_frames()
+    df0.write_parquet(tmp_path / "df0.parquet")
+    lazy_frame = scan_source(tmp_path / "df0.parquet").select(
+        get_projection(df0.columns, exclude_columns=["updated_at"])
+    )
+    assert "updated_at" not in lazy_frame.explain()
+    assert collect_source(
+        str(tmp_path / "df0.parquet"), exclude_columns=["updated_at"]
+    ).equals(df0.drop("updated_at"))
+    assert collect_source(df0) is df0
+
+    with pytest.raises(ValueError):
+        scan_source(tmp_path / "df0.txt")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_get_data_report_column_projection(lazy) -> None:
+    df0, df1 = _get_frames()
+    sources = [df0.lazy(), df1.lazy()] if lazy else [df0, df1]
+
+    report = get_data_report(
+        *sources, "df0", "df1", ["a"], exclude_columns=["updated_at"]
+    )
+    expected = get_data_report(
+        df0.drop("updated_at"), df1.drop("updated_at"), "df0", "df1", ["a"]
+    )
+    assert set(report.comparable_columns) == {"a", "b"}
+    assert report.row_differences == expected.row_differences
+    assert len(report.row_differences) == 1
+
+    report = get_data_report(*sources, "df0", "df1", ["a"], include_columns=["a"])
+    assert report.comparable_columns == ["a"]
+    assert report.row_differences == []
+
+
+def test_get_data_report_row_filter(tmp_path) -> None:
+    df0, df1 = _get_frames()
+    df0.write_parquet(tmp_path / "df0.parquet")
+
+    report = get_data_report(
+        pl.scan_parquet(tmp_path / "df0.parquet"),
+        df1,
+        "df0",
+        "df1",
+        ["a"],
+        exclude_columns=["updated_at"],
+        row_filter=pl.col("a") < 3,
+    )
+    assert (report.df0_length, report.df1_length) == (2, 2)
+    assert report.row_differences == []
+
+    # the filters can be different per side
+    report = get_data_report(
+        df0, df1, "df0", "df1", row_filter=(pl.col("a") == 3, pl.col("b") == 10)
+    )
+    assert (report.df0_length, report.df1_length) == (1, 1)
+
+    with pytest.raises(ValueError):
+        get_data_report(df0, df1, "df0", "df1", row_filter=(pl.col("a") == 3,))
+
+
+def test_collect_source_pushes_filter(tmp_path) -> None:
+    df0, _ = _get_frames()
+    df0.write_parquet(tmp_path / "df0.parquet")
+    lazy_frame = (
+        scan_source(tmp_path / "df0.parquet")
+        .filter(pl.col("updated_at") == 1)
+        .select("a")
+    )
+    assert "SELECTION" in lazy_frame.explain()
+    assert collect_source(
+        str(tmp_path / "df0.parquet"),
+        include_columns=["a"],
+        row_filter=pl.col("b") > 1,
+    ).equals(pl.DataFrame({"a": [2, 3]}))
+
+
+def test_scanned_sources_reserved_columns(tmp_path) -> None:
+    df = pl.DataFrame({"a": [1, 2], "hash": [1, 2]})
+    df.write_parquet(tmp_path / "df0.parquet")
+    df.write_parquet(tmp_path / "df1.parquet")
+    path = str(tmp_path / "df0.parquet")
+    with pytest.raises(ValueError, match=".*cannot contain 'hash'.*"):
+        collect_source(path)
+    with pytest.raises(ValueError, match=".*cannot contain 'hash'.*"):
+        get_data_report(path, str(tmp_path / "df1.parquet"), "df0", "df1", ["a"])
+    # the reserved column can be excluded from the scan
+    assert collect_source(path, exclude_columns=["hash"]).columns == ["a"]
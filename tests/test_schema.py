@@ -0,0 +1,95 @@
+import datetime
+
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_column_dtype_differences
+from data_fingerprint.src.difference_types import (
+    ColumnDataTypeDifferenceType,
+    ColumnNameDifferenceType,
+)
+from data_fingerprint.src.models import ColumnDifference
+from data_fingerprint.src.schema import get_schema, get_schema_differences
+
+SCHEMA_0 = pl.Schema(
+    {
+        "a": pl.Int64,
+        "b": pl.Datetime("us", "UTC"),
+        "c": pl.Datetime("ms"),
+        "d": pl.Int64,
+    }
+)
+SCHEMA_1 = pl.Schema(
+    {"a": pl.Int64, "b": pl.Datetime("us"), "c": pl.Datetime("us"), "e": pl.Utf8}
+)
+EXPECTED_DIFFERENCES = {
+    ColumnDifference(
+        source="df0",
+        column_name="b",
+        difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TIMEZONE,
+        more_information={"df0": "UTC", "df1": "None"},
+    ),
+    ColumnDifference(
+        source="df0",
+        column_name="c",
+        difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TIME_PRECISION,
+        more_information={"df0": "ms", "df1": "us"},
+    ),
+    ColumnDifference(
+        source="df0",
+        column_name="d",
+        difference_type=ColumnNameDifferenceType.EXTRA,
+    ),
+    ColumnDifference(
+        source="df0",
+        column_name="e",
+        difference_type=ColumnNameDifferenceType.MISSING,
+    ),
+}
+
+
+def test_get_schema_differences() -> None:
+    same_columns, column_differences = get_schema_differences(
+        SCHEMA_0, SCHEMA_1, "df0", "df1"
+    )
+    assert same_columns == ["a"]
+    assert set(column_differences) == EXPECTED_DIFFERENCES
+
+
+def test_get_schema_differences_from_files_and_lazy_frames(tmp_path) -> None:
+    df0 = pl.DataFrame(schema=SCHEMA_0)
+    df0.write_parquet(tmp_path / "df0.parquet")
+    pl.DataFrame(schema=SCHEMA_1).write_ipc(tmp_path / "df1.arrow")
+    assert get_schema(tmp_path / "df0.parquet") == SCHEMA_0
+    same_columns, column_differences = get_schema_differences(
+        str(tmp_path / "df0.parquet"),
+        pl.scan_ipc(tmp_path / "df1.arrow"),
+        "df0",
+        "df1",
+    )
+    assert same_columns == ["a"]
+    assert set(column_differences) == EXPECTED_DIFFERENCES
+
+    with pytest.raises(ValueError):
+        get_schema(tmp_path / "df0.csv")
+
+
+def test_get_column_dtype_differences_empty_frames() -> None:
+    df0 = pl.DataFrame(schema=SCHEMA_0)
+    df1 = pl.DataFrame(
+        {"a": [1], "b": [datetime.datetime(2021, 1, 1)]},
+        schema={"a": pl.Int64, "b": pl.Datetime("us")},
+    )
+    same_columns, column_differences = get_column_dtype_differences(
+        df0, df1, "df0", "df1"
+    )
+    assert same_columns == ["a"]
+    assert (
+        ColumnDifference(
+            source="df0",
+            column_name="b",
+            difference_type=ColumnDataTypeDifferenceType.DIFFERENT_TIMEZONE,
+            more_information={"df0": "UTC", "df1": "None"},
+        )
+        in column_differences
+    )
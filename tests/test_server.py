@@ -0,0 +1,103 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.server import ComparisonServer, ComparisonService
+
+
+def _request(server: ComparisonServer, method: str, path: str, body=None):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.server_address[1]}{path}",
+        data=None if body is None else json.dumps(body).encode(),
+        method=method,
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+@pytest.fixture
+def server():
+    server = ComparisonServer(("127.0.0.1", 0), max_workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_compare(server, tmp_path) -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]})
+    df1 = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 10]})
+    df0.write_parquet(tmp_path / "golden.parquet")
+    df1.write_csv(tmp_path / "candidate.csv")
+
+    registered = _request(
+        server,
+        "POST",
+        "/baselines",
+        {
+            "name": "golden",
+            "path": str(tmp_path / "golden.parquet"),
+            "grouping_columns": ["a"],
+        },
+    )
+    assert registered["rows"] == 3
+    assert _request(server, "GET", "/baselines") == ["golden"]
+
+    for _ in range(3):
+        response = _request(
+            server,
+            "POST",
+            "/compare",
+            {"baseline": "golden", "path": str(tmp_path / "candidate.csv")},
+        )
+    expected = get_data_report(df0, df1, "golden", "candidate.csv", ["a"])
+    assert response["report"] == expected.model_dump(mode="json")
+    assert response["latency"]["job_id"] == 3
+
+    metrics = _request(server, "GET", "/metrics")
+    assert metrics["jobs"] == 3
+    assert metrics["latency_seconds"]["count"] == 3
+    assert len(metrics["recent_jobs"]) == 3
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _request(
+            server, "POST", "/compare", {"baseline": "other", "path": "candidate.csv"}
+        )
+    assert error.value.code == 404
+    assert _request(server, "DELETE", "/baselines/golden") == {"removed": "golden"}
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("/baselines", ["golden", "golden.parquet"]),
+        ("/baselines", {"name": "golden"}),
+        ("/baselines", {"name": 1, "path": "golden.parquet"}),
+        (
+            "/baselines",
+            {"name": "golden", "path": "golden.parquet", "grouping_columns": "a"},
+        ),
+        ("/compare", {"baseline": "golden", "path": ["candidate.csv"]}),
+        (
+            "/compare",
+            {"baseline": "golden", "path": "candidate.csv", "grouping_columns": [1]},
+        ),
+    ],
+)
+def test_server_invalid_body(server, path, body) -> None:
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _request(server, "POST", path, body)
+    assert error.value.code == 400
+    assert "error" in json.loads(error.value.read())
+
+
+def test_service_without_jobs() -> None:
+    service = ComparisonService(max_workers=1)
+    assert service.get_metrics()["latency_seconds"]["count"] == 0
+    service.shutdown()
@@ -0,0 +1,48 @@
+import os
+
+import polars as pl
+
+from data_fingerprint.src.sidecar import (
+    get_sidecar_path,
+    load_sidecar_hashes,
+    read_hash_sidecar,
+    write_hash_sidecar,
+)
+
+
+def _get_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame(
+        {"a": list(range(100)) + [3, 3], "b": list(range(100)) + [10, 10]}
+    )
+    df1 = df0.with_columns(
+        pl.when(pl.col("a") == 50).then(-1).otherwise(pl.col("b")).alias("b")
+    ).head(101)
+    return df0, df1
+
+
+def _write(df: pl.DataFrame, path) -> str:
+    df.write_parquet(path, row_group_size=10)
+    return str(path)
+
+
+def test_write_and_read_sidecar(tmp_path) -> None:
+    df0, _ = _get_frames()
+    path = _write(df0, tmp_path / "df0.parquet")
+    sidecar = write_hash_sidecar(path)
+    assert get_sidecar_path(path).exists()
+    assert sidecar.columns == ["a", "b"]
+    assert sidecar.number_of_rows == len(df0)
+    assert len(sidecar.row_group_digests) == 11
+    assert read_hash_sidecar(path) == sidecar
+    assert read_hash_sidecar(path, ["b", "a"]) == sidecar
+    assert read_hash_sidecar(path, ["a"]) is None
+    assert load_sidecar_hashes(path).to_list() == df0.hash_rows().to_list()
+
+
+def test_sidecar_invalidated_by_change(tmp_path) -> None:
+    df0, df1 = _get_frames()
+    path = _write(df0, tmp_path / "df0.parquet")
+    write_hash_sidecar(path)
+    _write(df1, path)
+    os.utime(path, ns=(0, 0))
+    assert read_hash_sidecar(path) is None
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+import polars as pl
+
+from data_fingerprint.src.comparator import get_data_report, get_row_differences_paired
+from data_fingerprint.src.sort_merge import get_row_differences_sorted, is_sorted_by
+
+
+def test_is_sorted_by() -> None:
+    df = pl.DataFrame({"a": [1, 1, 2, 3], "b": [2, 3, 1, 1]})
+    assert is_sorted_by(df, ["a"])
+    assert is_sorted_by(df, ["a", "b"])
+    assert not is_sorted_by(df, ["b"])
+    assert not is_sorted_by(df, ["b", "a"])
+    assert not is_sorted_by(pl.DataFrame({"a": [1, None, 2]}), ["a"])
+    assert is_sorted_by(pl.DataFrame({"a": [1]}), ["a"])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1000])
+def test_sorted_is_same_as_hashed(chunk_size: int) -> None:
+    df0 = pl.DataFrame(
+        {"a": [1, 2, 3, 3, 3, 4, 6, 6, 6, 6], "b": [1, 2, 3, 10, 10, 15, 1, 1, 1, 1]}
+    )
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5, 6], "b": [1, 2, 3, 10, 20, 24, 1]})
+    _, _, expected = get_row_differences_paired(df0, df1, "df0", "df1", ["a"])
+    same_columns, column_differences, row_differences = get_row_differences_sorted(
+        df0, df1, "df0", "df1", ["a"], chunk_size=chunk_size
+    )
+    assert set(same_columns) == {"a", "b"}
+    assert column_differences == []
+    assert set(row_differences) == set(expected)
+
+
+def test_sorted_random_multi_column_keys() -> None:
+    rng = random.Random(42)
+    rows = [
+        (rng.randint(0, 5), rng.randint(0, 5), rng.randint(0, 3)) for _ in range(200)
+    ]
+    df0 = pl.DataFrame(rows[:120], schema=["a", "b", "c"], orient="row")
+    df1 = pl.DataFrame(rows[80:], schema=["a", "b", "c"], orient="row")
+    df0 = df0.sort(["a", "b"])
+    df1 = df1.sort(["a", "b"])
+    _, _, expected = get_row_differences_paired(df0, df1, "df0", "df1", ["a", "b"])
+    _, _, row_differences = get_row_differences_sorted(
+        df0, df1, "df0", "df1", ["a", "b"], chunk_size=7
+    )
+    assert set(row_differences) == set(expected)
+
+
+def test_sorted_null_keys() -> None:
+    df0 = pl.DataFrame({"a": [None, 1], "b": [1, 2]})
+    with pytest.raises(ValueError, match=".*contain null values.*"):
+        get_row_differences_sorted(df0, df0, "df0", "df1", ["a"])
+
+
+def test_data_report_presorted() -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 3, 3, 3, 4], "b": [1, 2, 3, 10, 10, 15]})
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5], "b": [1, 2, 3, 10, 20, 24]})
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"])
+    for presorted in [True, None]:
+        report = get_data_report(df0, df1, "df0", "df1", ["a"], presorted=presorted)
+        assert set(report.row_differences) == set(expected.row_differences)
+
+    with pytest.raises(ValueError, match=".*must be compared with grouping columns.*"):
+        get_data_report(df0, df1, "df0", "df1", presorted=True)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_sorted_lazy_frames_are_streamed(tmp_path, chunk_size: int) -> None:
+    df0 = pl.DataFrame(
+        {"a": [1, 2, 3, 3, 3, 4, 6, 6, 6, 6], "b": [1, 2, 3, 10, 10, 15, 1, 1, 1, 1]}
+    )
+    df1 = pl.DataFrame({"a": [1, 2, 3, 3, 4, 5, 6], "b": [1, 2, 3, 10, 20, 24, 1]})
+    df0.write_csv(tmp_path / "df0.csv")
+    df1.write_csv(tmp_path / "df1.csv")
+    _, _, expected = get_row_differences_paired(df0, df1, "df0", "df1", ["a"])
+
+    _, _, row_differences = get_row_differences_sorted(
+        pl.scan_csv(tmp_path / "df0.csv"),
+        pl.scan_csv(tmp_path / "df1.csv"),
+        "df0",
+        "df1",
+        ["a"],
+        chunk_size=chunk_size,
+    )
+    assert set(row_differences) == set(expected)
+
+    report = get_data_report(
+        pl.scan_csv(tmp_path / "df0.csv"),
+        pl.scan_csv(tmp_path / "df1.csv"),
+        "df0",
+        "df1",
+        ["a"],
+        presorted=True,
+        row_filter=pl.col("a") < 6,
+    )
+    assert report.df0_length == 6
+    assert set(report.row_differences) == set(
+        get_data_report(
+            df0.filter(pl.col("a") < 6),
+            df1.filter(pl.col("a") < 6),
+            "df0",
+            "df1",
+            ["a"],
+        ).row_differences
+    )
+
+
+@pytest.mark.parametrize("column", ["hash", "source"])
+def test_sorted_lazy_frames_reserved_columns(column: str) -> None:
+    df = pl.DataFrame({"a": [1, 2], column: [1, 2]})
+    with pytest.raises(ValueError, match=f".*cannot contain '{column}'.*"):
+        get_row_differences_sorted(df.lazy(), df.lazy(), "df0", "df1", ["a"])
+    with pytest.raises(ValueError, match=f".*cannot contain '{column}'.*"):
+        get_data_report(df.lazy(), df.lazy(), "df0", "df1", ["a"], presorted=True)
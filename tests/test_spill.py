@@ -0,0 +1,120 @@
+import os
+
+import polars as pl
+import pytest
+
+from data_fingerprint.src.comparator import get_data_report
+from data_fingerprint.src.spill import (
+    estimate_comparison_memory,
+    get_data_report_spilled,
+)
+
+
+def _get_dataframes() -> tuple[pl.DataFrame, pl.DataFrame]:
+    df0 = pl.DataFrame(
+        {"a": list(range(100)) + [5, 5], "b": [str(i) for i in range(100)] + ["x", "x"]}
+    )
+    df1 = pl.DataFrame(
+        {
+            "a": list(range(1, 101)) + [5],
+            "b": [str(i) for i in range(1, 100)] + ["y", "x"],
+        }
+    )
+    return df0, df1
+
+
+@pytest.mark.parametrize("grouping_columns", [None, ["a"]])
+def test_get_data_report_spilled(tmp_path, grouping_columns) -> None:
+    df0, df1 = _get_dataframes()
+    df0.write_parquet(tmp_path / "df0.parquet")
+    df1.write_csv(tmp_path / "df1.csv")
+    spill_directory = tmp_path / "spill"
+    spill_directory.mkdir()
+    stages = []
+
+    report = get_data_report_spilled(
+        str(tmp_path / "df0.parquet"),
+        str(tmp_path / "df1.csv"),
+        "df0",
+        "df1",
+        grouping_columns,
+        memory_limit=1000,
+        temporary_directory=str(spill_directory),
+        progress_callback=lambda stage, done, total: stages.append(stage),
+    )
+    expected = get_data_report(df0, df1, "df0", "df1", grouping_columns)
+
+    assert set(report.row_differences) == set(expected.row_differences)
+    assert report.df0_length == expected.df0_length
+    assert report.column_differences == expected.column_differences
+    assert {"spill", "partitions"}.issubset(stages)
+    assert os.listdir(spill_directory) == []
+
+
+def test_estimate_comparison_memory_projected(tmp_path) -> None:
+    df0, df1 = _get_dataframes()
+    memory = estimate_comparison_memory(df0, df1)
+    assert estimate_comparison_memory(df0, df1, exclude_columns=["b"]) < memory
+    assert estimate_comparison_memory(df0, df1, row_filter=pl.col("a") < 10) < memory
+
+    df0.write_parquet(tmp_path / "df0.parquet")
+    df1.write_csv(tmp_path / "df1.csv")
+    paths = (str(tmp_path / "df0.parquet"), str(tmp_path / "df1.csv"))
+    csv_size = os.path.getsize(paths[1])
+    assert estimate_comparison_memory(*paths) > estimate_comparison_memory(
+        *paths, include_columns=["a"]
+    )
+    assert (
+        estimate_comparison_memory(df0, paths[1])
+        == estimate_comparison_memory(df0, df0) // 2 + 3 * csv_size
+    )
+
+
+def test_get_data_report_memory_limit() -> None:
+    df0, df1 = _get_dataframes()
+    assert estimate_comparison_memory(df0, df1) > 1000
+
+    report = get_data_report(
+        df0, df1, "df0", "df1", ["a"], memory_limit=1000, exclude_columns=["b"]
+    )
+    expected = get_data_report(df0, df1, "df0", "df1", ["a"], exclude_columns=["b"])
+    assert set(report.row_differences) == set(expected.row_differences)
+    assert report.comparable_columns == ["a"]
+
+
+def test_get_data_report_memory_limit_duplicate_keys() -> None:
+    df0 = pl.DataFrame({"id": [1, 2, 2, 3], "value": [1, 2, 3, 4]})
+    df1 = pl.DataFrame({"id": [1, 2, 3], "value": [1, 2, 5]})
+    expected = get_data_report(df0, df1, "df0", "df1", ["id"])
+    report = get_data_report(df0, df1, "df0", "df1", ["id"], memory_limit=1)
+    assert expected.duplicate_keys == {"id": [2]}
+    assert report.duplicate_keys == expected.duplicate_keys
+    assert set(report.row_differences) == set(expected.row_differences)
+
+    with pytest.raises(ValueError, match=".*Memory limit can not be combined.*"):
+        get_data_report(df0, df1, "df0", "df1", ["id"], memory_limit=1, presorted=None)
+    with pytest.raises(ValueError, match=".*Memory limit can not be combined.*"):
+        get_data_report(
+            df0, df1, "df0", "df1", ["id"], memory_limit=1, concurrent_sides=True
+        )
+
+
+def test_get_data_report_spilled_invalid() -> None:
+    df0, df1 = _get_dataframes()
+    with pytest.raises(ValueError):
+        get_data_report_spilled(df0, df1, "df0", "df1")
+    with pytest.raises(ValueError):
+        get_data_report_spilled(df0, df1, "df0", "df1", ["c"], number_of_partitions=2)
+
+
+def test_get_data_report_spilled_no_same_columns(tmp_path) -> None:
+    df0 = pl.DataFrame({"a": [1, 2, 2]})
+    df1 = pl.DataFrame({"b": ["x"]})
+    df0.write_csv(tmp_path / "df0.csv")
+
+    report = get_data_report_spilled(
+        str(tmp_path / "df0.csv"), df1, "df0", "df1", number_of_partitions=2
+    )
+    expected = get_data_report(df0, df1, "df0", "df1")
+    assert report.row_differences == expected.row_differences
+    assert report.column_differences == expected.column_differences